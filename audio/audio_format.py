@@ -0,0 +1,104 @@
+"""
+DRAGON'S LAIR RPG - Audio Format Module
+=======================================
+
+This module contains helpers for building sounds in the mixer's own format.
+
+WHAT THIS FILE DOES:
+===================
+The mixer is opened with a sample rate, a sample type and a channel count
+(pygame.mixer.get_init() tells us which). If we hand it sounds in any other
+format, they have to be converted or resampled. These helpers:
+- Tell the music and sound effect code which sample rate to generate at
+- Turn a mono wave (floats from -1 to 1) into a Sound in the native format
+- Measure how much memory the finished sounds take
+- Tell how long the mixer's buffer delays a sound that was just started
+
+FOR NOVICE CODERS:
+==================
+All our audio is generated as ONE mono wave. For a stereo mixer we don't
+build a second copy of the wave - we write the same mono samples into both
+channels of the Sound's buffer directly.
+"""
+
+import pygame
+import numpy as np
+from config.constants import MIXER_BUFFER_SIZE
+
+# Format used when the mixer is not initialized (frequency, size, channels)
+DEFAULT_MIXER_FORMAT = (44100, -16, 2)
+
+
+def get_mixer_format():
+    """
+    Get the mixer's actual format.
+
+    Returns:
+        tuple: (frequency, size, channels) as reported by pygame.mixer.get_init()
+    """
+    mixer_format = pygame.mixer.get_init()
+    return mixer_format if mixer_format else DEFAULT_MIXER_FORMAT
+
+
+def get_sample_rate():
+    """Get the sample rate audio should be generated at"""
+    return get_mixer_format()[0]
+
+
+def get_output_latency_ms():
+    """Get how long (ms) a started sound waits for the mixer's buffer before it's heard"""
+    return MIXER_BUFFER_SIZE / get_sample_rate() * 1000
+
+
+def to_sample_type(wave, dtype):
+    """
+    Convert a float wave (-1 to 1) to the mixer's sample type.
+
+    Args:
+        wave: numpy array of floats between -1 and 1
+        dtype: numpy dtype of the mixer's samples
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind == 'f':
+        return wave.astype(dtype, copy=False)
+    bits = dtype.itemsize * 8
+    peak = 2 ** (bits - 1) - 1
+    if dtype.kind == 'u':
+        return (wave * peak + peak + 1).astype(dtype)
+    return (wave * peak).astype(dtype)
+
+
+def make_mono_sound(wave):
+    """
+    Create a Sound in the mixer's native format from a mono wave.
+
+    The mono samples are written straight into every channel of the Sound's
+    own buffer, so no stereo copy of the wave is ever built.
+
+    Args:
+        wave: numpy array of floats between -1 and 1
+
+    Returns:
+        pygame.mixer.Sound: The finished sound
+    """
+    frequency, size, channels = get_mixer_format()
+    sound = pygame.mixer.Sound(buffer=bytes(len(wave) * channels * (abs(size) // 8)))
+    samples = pygame.sndarray.samples(sound)
+    native = to_sample_type(wave, samples.dtype)
+    if samples.ndim == 1:
+        samples[:] = native
+    else:
+        samples[:] = native[:, None]  # Same mono data in every channel
+    return sound
+
+
+def get_sound_nbytes(sound):
+    """Get how many bytes a Sound's sample buffer takes"""
+    if sound is None:
+        return 0
+    return pygame.sndarray.samples(sound).nbytes
+
+
+def get_audio_memory(sounds):
+    """Get the total bytes used by a collection of Sounds"""
+    return sum(get_sound_nbytes(sound) for sound in sounds)
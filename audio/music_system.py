@@ -7,9 +7,10 @@ This module contains the MusicSystem class for procedural music generation.
 
 import pygame
 import numpy as np
-import io
-import wave
+import time
 from config.constants import *
+from audio.audio_format import get_sample_rate, make_mono_sound, get_audio_memory, get_output_latency_ms
+from systems.event_bus import STATE_CHANGED, AREA_ENTERED, BATTLE_STARTED, BATTLE_ENDED
 
 class MusicSystem:
     """
@@ -24,26 +25,49 @@ class MusicSystem:
     - Boss Battle: Epic boss theme
     - Victory: Triumphant victory theme
     - Game Over: Somber ending theme
+    
+    Tracks are kept as ready Sound objects and played on two alternating
+    reserved channels, so a state change crossfades instead of reloading.
     """
     def __init__(self):
         self.current_track = None
         self.last_state = None
         self.boss_battle_active = False
         
+        # Kept up to date by game events (see subscribe())
+        self.next_battle_is_boss = False
+        self.current_area = None
+        
+        # Two reserved mixer channels that alternate, so the old track can fade
+        # out on one while the new track fades in on the other
+        self.music_channels = []
+        self.active_channel = 0
+        
+        # Timing of the last state changes (milliseconds until audio was playing):
+        # starting the channel plus one mixer buffer before the sound is heard
+        self.last_switch_ms = 0.0
+        self.switch_times_ms = []
+        
+        # Keep every track as a ready pygame.mixer.Sound so switching never
+        # has to decode anything
+        self.tracks = {}
         try:
-            # Store raw bytes instead of BytesIO objects
-            self.start_menu_music_bytes = self.sound_to_wav_bytes(self.generate_start_menu_music())
-            self.overworld_music_bytes = self.sound_to_wav_bytes(self.generate_overworld_music())
-            self.town_music_bytes = self.sound_to_wav_bytes(self.generate_town_music())
-            self.battle_music_bytes = self.sound_to_wav_bytes(self.generate_battle_music())
-            self.boss_music_bytes = self.sound_to_wav_bytes(self.generate_boss_music())
-            self.victory_music_bytes = self.sound_to_wav_bytes(self.generate_victory_music())
-            self.game_over_music_bytes = self.sound_to_wav_bytes(self.generate_game_over_music())
-            print('Music bytes created successfully')
+            self.tracks = {
+                "start_menu": self.generate_start_menu_music(),
+                "overworld": self.generate_overworld_music(),
+                "town": self.generate_town_music(),
+                "battle": self.generate_battle_music(),
+                "boss": self.generate_boss_music(),
+                "victory": self.generate_victory_music(),
+                "game_over": self.generate_game_over_music(),
+            }
+            pygame.mixer.set_reserved(2)
+            self.music_channels = [pygame.mixer.Channel(0), pygame.mixer.Channel(1)]
+            print(f'Music tracks created successfully ({self.get_audio_memory() // 1024} KB)')
         except Exception as e:
-            print(f"Failed to create music bytes: {e}")
-            self.start_menu_music_bytes = self.overworld_music_bytes = self.battle_music_bytes = None
-            self.boss_music_bytes = self.victory_music_bytes = self.game_over_music_bytes = None
+            print(f"Failed to create music tracks: {e}")
+            self.tracks = {}
+            self.music_channels = []
     
     def generate_start_menu_music(self):
         # Epic title screen theme
@@ -66,78 +90,112 @@ class MusicSystem:
         
         return self.generate_chiptune_song(melody, bass, percussion=percussion, bpm=80, volume=0.25)
     
-    def sound_to_wav_bytes(self, sound):
-        try:
-            arr = pygame.sndarray.array(sound)
-            memfile = io.BytesIO()
-            with wave.open(memfile, 'wb') as wf:
-                wf.setnchannels(2)
-                wf.setsampwidth(2)  # 16 bits
-                wf.setframerate(44100)
-                wf.writeframes(arr.astype(np.int16).tobytes())
-            return memfile.getvalue()  # Return the bytes content
-        except Exception as e:
-            print(f"Error converting sound to WAV: {e}")
-            return None
+    def get_track_name(self, game_state, is_boss_battle=False, current_area=None):
+        """Pick which track belongs to a game state"""
+        if game_state in ("start_menu", "opening_cutscene", "character_select"):
+            return "start_menu"
+        elif game_state == "overworld":
+            # Check if we're in a town area
+            if current_area and current_area.area_type == "town":
+                return "town"
+            return "overworld"
+        elif game_state == "battle":
+            return "boss" if is_boss_battle else "battle"
+        elif game_state in ("victory", "game_over"):
+            return game_state
+        return None
+    
+    def get_crossfade_ms(self, from_track, to_track):
+        """Look up the crossfade length between two tracks"""
+        return MUSIC_CROSSFADES.get((from_track, to_track), MUSIC_DEFAULT_CROSSFADE_MS)
     
     def update(self, game_state, is_boss_battle=False, current_area=None):
         # Only update when state or boss battle status changes
         if game_state == self.last_state and is_boss_battle == self.boss_battle_active:
             return
         
+        switch_start = time.perf_counter()
         print(f'MusicSystem: State change detected! "{self.last_state}" -> "{game_state}", boss: {self.boss_battle_active} -> {is_boss_battle}')
         self.last_state = game_state
         self.boss_battle_active = is_boss_battle
-        pygame.mixer.music.stop()
-        pygame.mixer.music.set_volume(0.5)
+        
+        track_name = self.get_track_name(game_state, is_boss_battle, current_area)
+        if track_name is None or track_name not in self.tracks or not self.music_channels:
+            print(f'MusicSystem: No music for state: {game_state}')
+            self.stop()
+            return
+        
+        # Same track already playing (e.g. start menu -> cutscene): keep it going
+        if track_name == self.current_track and self.is_playing():
+            return
         
         try:
-            if game_state == "start_menu" and self.start_menu_music_bytes:
-                print('MusicSystem: Playing start menu music')
-                pygame.mixer.music.load(io.BytesIO(self.start_menu_music_bytes))
-                pygame.mixer.music.play(-1)
-            elif game_state == "opening_cutscene" and self.start_menu_music_bytes:
-                print('MusicSystem: Playing cutscene music')
-                pygame.mixer.music.load(io.BytesIO(self.start_menu_music_bytes))
-                pygame.mixer.music.play(-1)
-            elif game_state == "character_select" and self.start_menu_music_bytes:
-                print('MusicSystem: Playing character select music')
-                pygame.mixer.music.load(io.BytesIO(self.start_menu_music_bytes))
-                pygame.mixer.music.play(-1)
-            elif game_state == "overworld":
-                # Check if we're in a town area
-                if current_area and current_area.area_type == "town" and self.town_music_bytes:
-                    print('MusicSystem: Playing town music')
-                    pygame.mixer.music.load(io.BytesIO(self.town_music_bytes))
-                    pygame.mixer.music.play(-1)
-                elif self.overworld_music_bytes:
-                    print('MusicSystem: Playing overworld music')
-                    pygame.mixer.music.load(io.BytesIO(self.overworld_music_bytes))
-                    pygame.mixer.music.play(-1)
-            elif game_state == "battle":
-                if is_boss_battle and self.boss_music_bytes:
-                    print('MusicSystem: Playing boss music')
-                    pygame.mixer.music.load(io.BytesIO(self.boss_music_bytes))
-                    pygame.mixer.music.play(-1)
-                elif self.battle_music_bytes:
-                    print('MusicSystem: Playing battle music')
-                    pygame.mixer.music.load(io.BytesIO(self.battle_music_bytes))
-                    pygame.mixer.music.play(-1)
-                else:
-                    print('MusicSystem: WARNING - No battle music available!')
-            elif game_state == "victory" and self.victory_music_bytes:
-                print('MusicSystem: Playing victory music')
-                pygame.mixer.music.load(io.BytesIO(self.victory_music_bytes))
-                pygame.mixer.music.play(0)
-            elif game_state == "game_over" and self.game_over_music_bytes:
-                print('MusicSystem: Playing game over music')
-                pygame.mixer.music.load(io.BytesIO(self.game_over_music_bytes))
-                pygame.mixer.music.play(0)
-            else:
-                print(f'MusicSystem: No music for state: {game_state}')
+            fade_ms = self.get_crossfade_ms(self.current_track, track_name)
+            old_channel = self.music_channels[self.active_channel]
+            self.active_channel = 1 - self.active_channel
+            new_channel = self.music_channels[self.active_channel]
+            
+            # Fade the old track out while the new one fades in
+            if old_channel.get_busy():
+                old_channel.fadeout(fade_ms)
+            loops = 0 if track_name in ("victory", "game_over") else -1
+            new_channel.set_volume(MUSIC_VOLUME)
+            new_channel.play(self.tracks[track_name], loops=loops, fade_ms=fade_ms)
+            self.current_track = track_name
+            
+            start_ms = (time.perf_counter() - switch_start) * 1000
+            buffer_ms = get_output_latency_ms()
+            self.last_switch_ms = start_ms + buffer_ms
+            self.switch_times_ms.append(self.last_switch_ms)
+            if len(self.switch_times_ms) > 100:
+                self.switch_times_ms.pop(0)
+            print(f'MusicSystem: Playing {track_name} music ({fade_ms} ms crossfade, playing in {self.last_switch_ms:.2f} ms: '
+                  f'{start_ms:.2f} ms to start + {buffer_ms:.2f} ms mixer buffer)')
         except Exception as e:
             print(f"Music playback error: {e}")
     
+    def subscribe(self, events):
+        """Follow the game's event bus (systems/event_bus.py) instead of being updated every frame"""
+        events.subscribe(STATE_CHANGED, self.on_state_changed)
+        events.subscribe(AREA_ENTERED, self.on_area_entered)
+        events.subscribe(BATTLE_STARTED, self.on_battle_started)
+        events.subscribe(BATTLE_ENDED, self.on_battle_ended)
+    
+    def on_state_changed(self, old_state, new_state):
+        self.update(new_state, new_state == "battle" and self.next_battle_is_boss, self.current_area)
+    
+    def on_area_entered(self, area, previous_area):
+        self.current_area = area
+        # Walking into (or out of) town switches between the town and overworld tracks
+        if self.last_state == "overworld" and self.get_track_name("overworld", False, area) != self.current_track:
+            self.last_state = None
+            self.update("overworld", False, area)
+    
+    def on_battle_started(self, enemy, is_boss):
+        self.next_battle_is_boss = is_boss
+    
+    def on_battle_ended(self, enemy, result, is_boss):
+        self.next_battle_is_boss = False
+    
+    def is_playing(self):
+        """Check if the current track is still playing"""
+        if not self.music_channels:
+            return False
+        return self.music_channels[self.active_channel].get_busy()
+    
+    def stop(self, fade_ms=0):
+        """Stop (or fade out) both music channels"""
+        for channel in self.music_channels:
+            if fade_ms > 0:
+                channel.fadeout(fade_ms)
+            else:
+                channel.stop()
+        self.current_track = None
+    
+    def get_audio_memory(self):
+        """Get how many bytes all music tracks take in the mixer's format"""
+        return get_audio_memory(self.tracks.values())
+    
     def generate_overworld_music(self):
         # Calm adventure theme
         melody = [
@@ -268,7 +326,8 @@ class MusicSystem:
             percussion = [list(note) for note in percussion]
         if lead is not None:
             lead = [list(note) for note in lead]
-        song = np.zeros((0, 2), dtype=np.int16)
+        sample_rate = get_sample_rate()
+        segments = []
         melody_idx = bass_idx = perc_idx = lead_idx = 0
         melody_len = len(melody)
         bass_len = len(bass)
@@ -295,7 +354,7 @@ class MusicSystem:
                 l_freq, l_beats = 0, 0.25
             step_beats = min(m_beats, b_beats, p_beats, l_beats)
             step_duration = 60 / bpm * step_beats
-            t = np.linspace(0, step_duration, int(44100 * step_duration), False)
+            t = np.linspace(0, step_duration, int(sample_rate * step_duration), False)
             # Generate waves
             m_wave = np.sin(m_freq * 2 * np.pi * t) if m_freq > 0 else np.zeros_like(t)
             b_wave = 0.25 * np.sign(np.sin(b_freq * 2 * np.pi * t)) if b_freq > 0 else np.zeros_like(t)
@@ -304,10 +363,8 @@ class MusicSystem:
             # Combine waves
             wave = m_wave + b_wave + p_wave + l_wave
             wave = np.clip(wave, -1, 1)
-            # Convert to audio
-            audio = (wave * volume * 32767).astype(np.int16)
-            audio_stereo = np.column_stack((audio, audio))
-            song = np.concatenate((song, audio_stereo))
+            # Keep the mono segment; it is converted to the mixer format once at the end
+            segments.append((wave * volume).astype(np.float32))
             # Update note durations
             if melody_idx < melody_len:
                 melody[melody_idx][1] -= step_beats
@@ -325,4 +382,4 @@ class MusicSystem:
                 lead[lead_idx][1] -= step_beats
                 if lead[lead_idx][1] <= 0:
                     lead_idx += 1
-        return pygame.sndarray.make_sound(song) 
\ No newline at end of file
+        return make_mono_sound(np.concatenate(segments)) 
\ No newline at end of file
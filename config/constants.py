@@ -49,6 +49,10 @@ import wave
 import io
 
 # Initialize Pygame
+# The mixer plays sound in chunks of MIXER_BUFFER_SIZE samples, so a sound that
+# is started waits up to one chunk before it is heard (512 is pygame's default)
+MIXER_BUFFER_SIZE = 512
+pygame.mixer.pre_init(buffer=MIXER_BUFFER_SIZE)
 pygame.init()
 pygame.font.init()
 pygame.mixer.init()
@@ -61,12 +65,75 @@ pygame.mixer.music.set_volume(1.0)
 # Display and Performance Settings
 # ===============================
 # These control how the game looks and runs
-SCREEN_WIDTH, SCREEN_HEIGHT = 1000, 700  # Game window size
+SCREEN_WIDTH, SCREEN_HEIGHT = 1000, 700  # Size the game is drawn at (all positions use these pixels)
+WINDOW_SIZE = None                        # Window size: None = same as the game (fastest), (0, 0) = full screen
+RENDER_SCALE_MODE = "fast"                # How the game fills a bigger/smaller window (see systems/render_target.py):
+                                          # "integer" (crisp 2x, 3x...), "fast" or "smooth"
+HUD_NATIVE_RESOLUTION = True              # Profiler/memory overlays are drawn sharp at window resolution
 PLAYER_SIZE = 50                          # How big the player character is
 ENEMY_SIZE = 40                           # How big enemies are
 ITEM_SIZE = 30                            # How big collectible items are
 FPS = 60                                 # Frames per second (game speed)
 
+# Music Crossfade Settings
+# ========================
+# How long (in milliseconds) the old track fades out while the new one fades in.
+# Keys are (from_track, to_track); anything not listed uses the default.
+MUSIC_VOLUME = 0.5
+MUSIC_DEFAULT_CROSSFADE_MS = 500
+MUSIC_CROSSFADES = {
+    ("overworld", "battle"): 300,   # Snap into battle quickly
+    ("town", "battle"): 300,
+    ("overworld", "boss"): 300,
+    ("town", "boss"): 300,
+    ("battle", "overworld"): 800,   # Ease back into exploring
+    ("boss", "overworld"): 800,
+    ("battle", "game_over"): 200,
+    ("boss", "victory"): 200,
+}
+
+# Battle Log Settings
+# ===================
+# Only the newest messages are kept in memory. Set BATTLE_LOG_ARCHIVE_DIR to a
+# folder name to also save every battle's full log there as a text file.
+BATTLE_LOG_CAPACITY = 100
+BATTLE_LOG_ARCHIVE_DIR = None
+
+# Battle Render Cache Settings
+# ============================
+# The battle scene is drawn from cached layers (see ui/battle_layers.py)
+BATTLE_SPRITE_PADDING = 30       # Extra room around a combatant's sprite layer
+ENEMY_FLICKER_FRAMES = 4         # Regular enemies' flames/smoke change every N frames
+BOSS_LAYER_INTERVAL_MS = 33      # Boss dragons are redrawn at most this often (about 30 FPS)
+ROTATION_CACHE_STEPS = 24        # Spinning sprites are pre-rotated in 15 degree steps
+
+# Frame Profiler Settings
+# =======================
+# F3 shows frame timings per subsystem, F4 exports them (see systems/frame_profiler.py)
+PROFILER_WINDOW = 600            # Percentiles cover the last 600 frames (10 seconds)
+PROFILER_MAX_SAMPLES = 200000    # Raw timings kept for export (oldest are dropped)
+PROFILER_HUD_REFRESH = 30        # Overlay is re-rendered every 30 frames
+PROFILER_HUD_ROWS = 14           # Slowest sections shown on the overlay
+PROFILER_EXPORT_DIR = "profiles"
+
+# Quality Governor Settings
+# =========================
+# Effects are turned down when frames run slow (see systems/quality_governor.py)
+QUALITY_PRESET = "auto"          # "auto", or a fixed "high", "medium", "low" or "minimal" (F8 cycles)
+QUALITY_FRAME_BUDGET_MS = 14.0   # Work time per frame before quality steps down (a frame is 16.7 ms)
+QUALITY_WINDOW = 60              # Frames averaged before each decision (1 second)
+QUALITY_UP_HEADROOM = 0.6        # Step back up once frames average under 60% of the budget...
+QUALITY_UP_FRAMES = 300          # ... for at least this many frames (5 seconds)
+
+# Memory Monitor Settings
+# =======================
+# F6 starts/stops memory tracking, F7 writes a report (see systems/memory_monitor.py)
+MEMORY_TRACE_FRAMES = 1          # Call-stack depth remembered for every allocation
+MEMORY_TOP_SUBSYSTEMS = 8        # Files listed in a report (biggest first)
+MEMORY_TOP_LINES = 3             # Biggest allocating lines listed per file
+MEMORY_MAX_REPORTS = 100         # State-change reports kept (oldest are dropped)
+MEMORY_DUMP_DIR = "memory_reports"
+
 # Visual Design - Retro 80s Color Palette
 # =======================================
 # Core UI Colors (User Interface colors)
@@ -136,8 +203,18 @@ DRAGON_BOSS_COLORS = [
 
 # Create the main game window
 # ===========================
-# This creates the actual window that the game runs in
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+# This creates the actual window that the game runs in. Everything is drawn
+# onto `screen`: when the window is the game's size that IS the window,
+# otherwise it's a SCREEN_WIDTH x SCREEN_HEIGHT picture that
+# systems/render_target.py scales into the window every frame.
+if WINDOW_SIZE is None:
+    window = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+else:
+    window = pygame.display.set_mode(WINDOW_SIZE, pygame.FULLSCREEN if WINDOW_SIZE == (0, 0) else 0)
+if window.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT):
+    screen = window
+else:
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
 pygame.display.set_caption("Dragon's Lair RPG")  # Window title
 clock = pygame.time.Clock()  # Controls game speed (FPS)
 
@@ -172,18 +249,43 @@ GRID_SIZE = 50                    # Size of each grid square (in pixels)
 GRID_WIDTH = SCREEN_WIDTH // GRID_SIZE   # Number of grid columns
 GRID_HEIGHT = SCREEN_HEIGHT // GRID_SIZE # Number of grid rows
 
-# World Map System (3x3 grid of areas)
-# ====================================
-# The game world is a 3x3 grid, like this:
+# World Map System (grid of areas)
+# ================================
+# The game world is a WORLD_SIZE x WORLD_SIZE grid. With the default of 3:
 # [Area 0,0] [Area 0,1] [Area 0,2]
 # [Area 1,0] [Area 1,1] [Area 1,2]
 # [Area 2,0] [Area 2,1] [Area 2,2]
+# Any size works: areas are only created when the player first gets to them
+# (see world/world_map.py), so a huge world costs nothing until it is explored.
 WORLD_SIZE = 3                    # 3x3 world grid
+WORLD_SEED = 1987                 # Picks the area types outside the classic 3x3 layout
+WORLD_MAP_VIEW_CELLS = 9          # The M map shows at most 9x9 areas around the player
+AREA_PREFETCH_CELLS = 3           # Start building the next area 3 grid squares before its edge
+AREA_HOT_RADIUS = 1               # The current area and its 8 neighbours always stay live
+AREA_MEMORY_BUDGET = 32 * 1024 * 1024  # Older areas are packed away above this (about 11 areas)
+AREA_SPILL_DIR = None             # Folder for packed-away areas (None: keep them in memory)
+AREA_NEIGHBOR_TICK_FRAMES = 15    # Areas next to the player are simulated 4 times a second
+ENEMY_SPAWN_INTERVAL = 300        # Frames between enemy spawns in an area (5 seconds)
+ITEM_SPAWN_INTERVAL = 600         # Frames between item spawns in an area (10 seconds)
+MAX_AREA_ENEMIES = 3              # No more spawns once an area has this many enemies
+MAX_AREA_ITEMS = 2                # ... or this many items
 AREA_WIDTH = SCREEN_WIDTH         # Each area is full screen width
 AREA_HEIGHT = SCREEN_HEIGHT       # Each area is full screen height
 WORLD_WIDTH = WORLD_SIZE * AREA_WIDTH    # Total world width
 WORLD_HEIGHT = WORLD_SIZE * AREA_HEIGHT  # Total world height
 
+# ============================================================================
+# INPUT SETTINGS
+# ============================================================================
+
+# Held keys and buffered commands (see systems/input_actions.py)
+# All times are in frames (60 frames = 1 second)
+INPUT_REPEAT_DELAY = 15           # Hold an arrow key this long before it starts repeating
+INPUT_REPEAT_INTERVAL = 10        # Then repeat this often (matches the movement cooldown)
+INPUT_BUFFER_FRAMES = 12          # A move pressed during the cooldown waits this long at most
+TOUCH_BUTTON_SIZE = 80            # Android on-screen buttons (see systems/touch_controls.py)
+TOUCH_BUTTON_MARGIN = 20
+
 # ============================================================================
 # GAME STATE CONSTANTS
 # ============================================================================
@@ -3,18 +3,16 @@ DRAGON'S LAIR RPG - Game Events Module
 =====================================
 
 This module contains all event handling logic extracted from the Game class.
-It manages user input, mouse interactions, and Android virtual controls.
+It manages user input and mouse interactions.
 
 The module handles:
 - Keyboard input for all game states
 - Mouse interactions and button clicks
-- Android virtual control mapping
 - Event processing and state transitions
 """
 
 import pygame
 from core.game_state import *
-from utils.android_utils import is_android
 
 
 def handle_events(game, screen):
@@ -38,29 +36,7 @@ def handle_events(game, screen):
             
         if event.type == pygame.MOUSEBUTTONDOWN:
             mouse_click = True
-            # Android virtual controls
-            if hasattr(game, 'android_buttons') and game.android_buttons:
-                mx, my = event.pos
-                for name, rect in game.android_buttons.items():
-                    if rect.collidepoint(mx, my):
-                        if name == 'up':
-                            fake_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP)
-                            pygame.event.post(fake_event)
-                        elif name == 'down':
-                            fake_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN)
-                            pygame.event.post(fake_event)
-                        elif name == 'left':
-                            fake_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT)
-                            pygame.event.post(fake_event)
-                        elif name == 'right':
-                            fake_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT)
-                            pygame.event.post(fake_event)
-                        elif name == 'enter':
-                            fake_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN)
-                            pygame.event.post(fake_event)
-                        elif name == 'space':
-                            fake_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
-                            pygame.event.post(fake_event)
+            # Android on-screen buttons use finger events (see systems/touch_controls.py)
         
         if event.type == pygame.KEYDOWN:
             handle_keydown_event(game, event)
@@ -1,6 +1,54 @@
-# Game state constants and helpers extracted from Game class
+"""
+DRAGON'S LAIR RPG - Game States Module
+======================================
 
-# Game state constants
+This module contains one class per game state (title screen, cutscene,
+overworld, battle, ...) and the registry Game uses to find them.
+
+WHAT THIS FILE DOES:
+===================
+Each state is an object with the same hooks:
+- enter(previous_state): called when the game switches to this state
+- exit(next_state): called when the game leaves it (release big things here)
+- handle_event(event): one pygame event (quit and F-keys are handled by Game)
+- handle_action(action): one ActionEvent - keys and clicks already turned into
+  "up", "back", "map", ... with held-key repeats (see systems/input_actions.py)
+- handle_mouse(mouse_pos, mouse_click): once per frame, for buttons
+- update(): once per frame, after Game's shared updates (stars, particles)
+- draw(screen): once per frame, on top of Game's shared background
+
+Game only ever calls `game.current_state.update()` and so on - the registry
+looks the state up in a dict by name, and creates a state the first time
+the game enters it. That keeps the title screen's dragon or the battle code
+from costing anything until they are needed.
+
+HOW TO ADD A STATE:
+==================
+1. Write a class based on State and fill in the hooks it needs
+2. Add it to STATE_CLASSES under its name
+3. Switch to it with `game.state = "my_state"`
+
+FOR NOVICE CODERS:
+==================
+Instead of one giant "if state == ... elif state == ..." in every method,
+each state keeps its own code together. Switching states is just changing
+which object gets called.
+"""
+
+import random
+import pygame
+
+from config.constants import *
+from entities.dragon import Dragon
+from entities.player_characters.character import Character
+from ui.button import Button
+from ui.opening_cutscene import OpeningCutscene
+from systems.frame_profiler import profiler
+from systems.event_bus import ITEM_COLLECTED
+from systems.input_actions import BACK, MAP, TALK, MOVE_ACTIONS
+from systems.quality_governor import quality
+
+# Game state names
 START_MENU = "start_menu"
 OPENING_CUTSCENE = "opening_cutscene"
 CHARACTER_SELECT = "character_select"
@@ -9,4 +57,636 @@ BATTLE = "battle"
 GAME_OVER = "game_over"
 VICTORY = "victory"
 
-# (Add any state transition helpers here if needed) 
\ No newline at end of file
+
+class State:
+    """Base class: every hook does nothing until a state fills it in"""
+    name = None
+
+    def __init__(self, game):
+        self.game = game
+
+    def enter(self, previous_state):
+        pass
+
+    def exit(self, next_state):
+        pass
+
+    def handle_event(self, event):
+        pass
+
+    def handle_action(self, action):
+        pass
+
+    def handle_mouse(self, mouse_pos, mouse_click):
+        pass
+
+    def update(self):
+        pass
+
+    def draw(self, screen):
+        pass
+
+
+class StartMenuState(State):
+    """Title screen with the animated dragon"""
+    name = START_MENU
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.dragon = Dragon(SCREEN_WIDTH//2 - 250, SCREEN_HEIGHT//2 - 120)
+        self.fire_timer = 0
+
+    def handle_mouse(self, mouse_pos, mouse_click):
+        game = self.game
+        # Update button hover states
+        game.start_screen.update_buttons(mouse_pos)
+
+        # Handle clicks using StartScreen module
+        result = game.start_screen.handle_start_menu_clicks(mouse_pos, mouse_click)
+        if result:
+            if game.SFX_CLICK: game.SFX_CLICK.play()
+            if result == "quit":
+                game.running = False
+            else:
+                game.state = result
+
+    def update(self):
+        self.dragon.update()
+        self.fire_timer += 1
+        if self.fire_timer > 120:
+            self.dragon.breathe_fire()
+            self.fire_timer = 0
+        self.game.start_screen.update()
+
+    def draw(self, screen):
+        self.game.start_screen.draw_start_menu(screen)
+        self.dragon.draw(screen)
+
+
+class OpeningCutsceneState(State):
+    """Story introduction; a fresh cutscene every time, dropped afterwards"""
+    name = OPENING_CUTSCENE
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.cutscene = None
+
+    def enter(self, previous_state):
+        self.cutscene = OpeningCutscene()
+
+    def exit(self, next_state):
+        self.cutscene = None
+
+    def handle_event(self, event):
+        # Any key (ESC included) skips the cutscene
+        if event.type == pygame.KEYDOWN:
+            self.cutscene.skip()
+
+    def update(self):
+        next_state = self.cutscene.update()
+        if next_state:
+            self.game.state = next_state
+
+    def draw(self, screen):
+        self.cutscene.draw(screen)
+
+
+class CharacterSelectState(State):
+    """Pick Warrior, Mage or Rogue"""
+    name = CHARACTER_SELECT
+
+    def handle_action(self, action):
+        if action.action == BACK and action.pressed:
+            self.game.state = START_MENU
+
+    def handle_mouse(self, mouse_pos, mouse_click):
+        game = self.game
+        # Update button hover states
+        game.start_screen.update_buttons(mouse_pos)
+
+        # Handle clicks using StartScreen module
+        result = game.start_screen.handle_character_select_clicks(mouse_pos, mouse_click)
+        if result:
+            if game.SFX_CLICK: game.SFX_CLICK.play()
+            next_state, character_type = result
+            if character_type:
+                game.player = Character(character_type)
+                game.start_game()
+            game.state = next_state
+
+    def draw(self, screen):
+        self.game.start_screen.draw_character_select(screen)
+
+
+class OverworldState(State):
+    """Main gameplay: walking between areas, enemies, items and the town"""
+    name = OVERWORLD
+
+    def handle_action(self, action):
+        if not action.pressed:
+            return
+        game = self.game
+        if action.action == BACK:
+            game.state = GAME_OVER
+
+        # Handle world map toggle
+        elif action.action == MAP:
+            game.show_world_map = not game.show_world_map
+
+        # Handle movement in overworld; a move pressed during the cooldown is
+        # buffered and made as soon as the cooldown ends (see update)
+        elif action.action in MOVE_ACTIONS:
+            if game.movement_cooldown > 0:
+                game.input.buffer(action)
+            else:
+                self.move(*MOVE_ACTIONS[action.action])
+
+        # Handle town cutscene dialogue advancement
+        elif action.action == TALK:
+            current_area = game.current_area
+            if current_area and current_area.cutscene_active and current_area.guard:
+                # Advance dialogue
+                current_area.guard["current_dialogue"] += 1
+                current_area.cutscene_timer = 0
+
+                # Check if we've reached the end of dialogue
+                if current_area.guard["current_dialogue"] >= len(current_area.guard["dialogue"]):
+                    current_area.cutscene_phase = 2  # End cutscene
+
+    def move(self, dx, dy):
+        """Move the player one grid square, unless a building is in the way"""
+        game = self.game
+        if not game.player:
+            return
+        if game.SFX_ARROW: game.SFX_ARROW.play()
+        # Store original position for collision detection
+        original_x = game.player.x
+        original_y = game.player.y
+        game.player.move(dx, dy)
+        # Check collision and revert if needed
+        current_area = game.current_area
+        if current_area and current_area.check_building_collision(game.player.x, game.player.y):
+            game.player.x = original_x
+            game.player.y = original_y
+        else:
+            game.player_moved = True
+            game.movement_cooldown = game.movement_delay
+
+    def update(self):
+        game = self.game
+        if not game.player:
+            return
+        # Main gameplay area with movement and exploration
+        game.game_time += 1
+        game.spawn_timer += 1
+        game.item_timer += 1
+        game.movement_cooldown = max(0, game.movement_cooldown - 1)
+        if game.movement_cooldown == 0:
+            buffered = game.input.take_buffered()
+            if buffered:
+                self.handle_action(buffered)
+        game.player.update_animation()
+
+        # Update camera to follow player
+        game.world_map.update_camera(game.player.x, game.player.y)
+
+        # Update area transition effect
+        game.world_map.update_transition()
+
+        # Check for area transition
+        previous_area = game.current_area
+        if game.world_map.check_area_transition(game.player.x, game.player.y):
+            # Area changed, update enemy and item lists
+            game.enter_current_area(previous_area)
+            current_area = game.current_area
+            game.autosave_requested = True
+
+            # If entering town area, position player at the gate (4 squares lower)
+            if current_area and current_area.area_type == "town":
+                area_world_x, area_world_y = current_area.get_world_position()
+                # Position at gate (center horizontally, 4 squares lower)
+                game.player.x = area_world_x + (AREA_WIDTH // 2)  # Center horizontally
+                game.player.y = area_world_y + 260  # 4 squares lower from top (200 + 60 = 260)
+
+        # Build the next area in the background when the player nears an edge
+        game.world_map.prefetch_neighbors(game.player.x, game.player.y)
+
+        # Off-screen areas: neighbours get a cheap tick, re-entered areas catch up
+        t = profiler.start()
+        game.world_map.simulator.update(game.game_time, game.player.level)
+        profiler.stop("areas.simulate", t)
+
+        # Add area-specific particle effects
+        t = profiler.start()
+        current_area = game.current_area
+        if current_area:
+            current_area.particle_timer += 1
+            if current_area.particle_timer >= current_area.particle_interval:
+                current_area.particle_timer = 0
+
+                # Spawn area-specific particles (fewer at lower quality settings)
+                area_world_x, area_world_y = current_area.get_world_position()
+                if current_area.area_type == "volcano":
+                    # Lava particles
+                    for _ in range(quality.particle_count(5)):
+                        x = area_world_x + random.randint(0, AREA_WIDTH)
+                        y = area_world_y + random.randint(0, AREA_HEIGHT)
+                        game.particle_system.add_particle(
+                            x, y, (255, 100, 0),
+                            (random.uniform(-0.5, 0.5), random.uniform(-2, -0.5)),
+                            6, 40
+                        )
+                elif current_area.area_type == "ice":
+                    # Snow particles
+                    for _ in range(quality.particle_count(4)):
+                        x = area_world_x + random.randint(0, AREA_WIDTH)
+                        y = area_world_y + random.randint(0, AREA_HEIGHT)
+                        game.particle_system.add_particle(
+                            x, y, (200, 220, 255),
+                            (random.uniform(-0.3, 0.3), random.uniform(0.5, 1.5)),
+                            4, 50
+                        )
+                elif current_area.area_type == "swamp":
+                    # Mist particles
+                    for _ in range(quality.particle_count(3)):
+                        x = area_world_x + random.randint(0, AREA_WIDTH)
+                        y = area_world_y + random.randint(0, AREA_HEIGHT)
+                        game.particle_system.add_particle(
+                            x, y, (150, 180, 150),
+                            (random.uniform(-0.2, 0.2), random.uniform(-0.2, 0.2)),
+                            5, 60
+                        )
+                elif current_area.area_type == "forest":
+                    # Leaf particles
+                    for _ in range(quality.particle_count(4)):
+                        x = area_world_x + random.randint(0, AREA_WIDTH)
+                        y = area_world_y + random.randint(0, AREA_HEIGHT)
+                        game.particle_system.add_particle(
+                            x, y, (100, 150, 50),
+                            (random.uniform(-0.3, 0.3), random.uniform(-0.5, -0.1)),
+                            5, 45
+                        )
+                elif current_area.area_type == "desert":
+                    # Sand particles
+                    for _ in range(quality.particle_count(6)):
+                        x = area_world_x + random.randint(0, AREA_WIDTH)
+                        y = area_world_y + random.randint(0, AREA_HEIGHT)
+                        game.particle_system.add_particle(
+                            x, y, (200, 180, 120),
+                            (random.uniform(-1, 1), random.uniform(-0.5, 0.5)),
+                            4, 35
+                        )
+                elif current_area.area_type == "mountain":
+                    # Wind particles
+                    for _ in range(quality.particle_count(3)):
+                        x = area_world_x + random.randint(0, AREA_WIDTH)
+                        y = area_world_y + random.randint(0, AREA_HEIGHT)
+                        game.particle_system.add_particle(
+                            x, y, (180, 180, 200),
+                            (random.uniform(-0.8, 0.8), random.uniform(-0.3, 0.3)),
+                            4, 40
+                        )
+                elif current_area.area_type == "beach":
+                    # Sea foam particles
+                    for _ in range(quality.particle_count(4)):
+                        x = area_world_x + random.randint(0, AREA_WIDTH)
+                        y = area_world_y + random.randint(0, AREA_HEIGHT)
+                        game.particle_system.add_particle(
+                            x, y, (220, 240, 255),
+                            (random.uniform(-0.4, 0.4), random.uniform(-0.2, 0.2)),
+                            5, 55
+                        )
+                elif current_area.area_type == "castle":
+                    # Magic sparkles
+                    for _ in range(quality.particle_count(3)):
+                        x = area_world_x + random.randint(0, AREA_WIDTH)
+                        y = area_world_y + random.randint(0, AREA_HEIGHT)
+                        game.particle_system.add_particle(
+                            x, y, (255, 215, 0),
+                            (random.uniform(-0.2, 0.2), random.uniform(-0.2, 0.2)),
+                            4, 50
+                        )
+                elif current_area.area_type == "cave":
+                    # Dust particles
+                    for _ in range(quality.particle_count(2)):
+                        x = area_world_x + random.randint(0, AREA_WIDTH)
+                        y = area_world_y + random.randint(0, AREA_HEIGHT)
+                        game.particle_system.add_particle(
+                            x, y, (100, 100, 120),
+                            (random.uniform(-0.1, 0.1), random.uniform(-0.1, 0.1)),
+                            3, 70
+                        )
+                elif current_area.area_type == "town":
+                    # Town-specific particles (smoke, fountain, leaves)
+                    current_area.generate_town_particles(game.particle_system)
+
+                    # Check for town entrance cutscene
+                    if current_area.check_entrance_cutscene(game.player.x, game.player.y):
+                        print("Town entrance cutscene triggered!")
+
+                    # Update town cutscene if active
+                    current_area.update_cutscene()
+        profiler.stop("area_effects", t)
+
+        t = profiler.start()
+        for item in game.items:
+            item.update()
+        profiler.stop("items.update", t)
+        if game.spawn_timer >= ENEMY_SPAWN_INTERVAL:
+            game.spawn_enemy()
+            game.spawn_timer = 0
+        if game.item_timer >= ITEM_SPAWN_INTERVAL:
+            game.spawn_item()
+            game.item_timer = 0
+        t = profiler.start()
+        for enemy in game.enemies:
+            enemy.update(game.player.x, game.player.y)
+            enemy.update_animation()
+        profiler.stop("enemies.update", t)
+        # --- Boss battle queued by a level up (see BossSystem.on_level_up) ---
+        boss_enemy = game.boss_system.take_pending_boss()
+        if boss_enemy:
+            game.start_battle(boss_enemy)
+            game.boss_system.start_boss_battle(game.player, boss_enemy)
+            return
+        t = profiler.start()
+        for enemy in game.enemies[:]:
+            if game.player:  # Ensure player exists
+                player_rect = pygame.Rect(game.player.x, game.player.y, PLAYER_SIZE, PLAYER_SIZE)
+                enemy_rect = pygame.Rect(enemy.x, enemy.y, ENEMY_SIZE, ENEMY_SIZE)
+                if player_rect.colliderect(enemy_rect):
+                    game.start_battle(enemy)
+                    # Remove enemy from both lists
+                    game.enemies.remove(enemy)
+                    current_area = game.current_area
+                    if current_area and enemy in current_area.enemies:
+                        current_area.enemies.remove(enemy)
+                    game.player_moved = False
+                    break
+        for item in game.items[:]:
+            if game.player:  # Ensure player exists
+                item_rect = pygame.Rect(item.x, item.y, ITEM_SIZE, ITEM_SIZE)
+                player_rect = pygame.Rect(game.player.x, game.player.y, PLAYER_SIZE, PLAYER_SIZE)
+                if player_rect.colliderect(item_rect):
+                    if item.type == "health":
+                        game.player.health = min(game.player.max_health, game.player.health + 30)
+                        for _ in range(15):
+                            x = random.randint(game.player.x, game.player.x + PLAYER_SIZE)
+                            y = random.randint(game.player.y, game.player.y + PLAYER_SIZE)
+                            game.particle_system.add_particle(
+                                x, y, HEALTH_COLOR,
+                                (random.uniform(-0.5, 0.5), random.uniform(-1, -0.5)),
+                                3, 30
+                            )
+                    else:
+                        game.player.mana = min(game.player.max_mana, game.player.mana + 40)
+                        for _ in range(15):
+                            x = random.randint(game.player.x, game.player.x + PLAYER_SIZE)
+                            y = random.randint(game.player.y, game.player.y + PLAYER_SIZE)
+                            game.particle_system.add_particle(
+                                x, y, MANA_COLOR,
+                                (random.uniform(-0.5, 0.5), random.uniform(-1, -0.5)),
+                                3, 30
+                            )
+                    game.player.items_collected += 1
+                    # Remove item from both lists
+                    if item in game.items:
+                        game.items.remove(item)
+                    current_area = game.current_area
+                    if current_area and item in current_area.items:
+                        current_area.items.remove(item)
+                    game.events.publish(ITEM_COLLECTED, item=item)
+        profiler.stop("collisions", t)
+
+    def draw(self, screen):
+        game = self.game
+        # Main gameplay area
+        if game.show_world_map:
+            # Draw world map view
+            game.world_map.draw_world_map(screen, (game.player.x, game.player.y))
+        else:
+            # Draw current area
+            t = profiler.start()
+            current_area = game.current_area
+            if current_area:
+                current_area.draw(screen, game.world_map)
+            else:
+                screen.fill(BACKGROUND)
+            profiler.stop("world_area.draw", t)
+
+            # Draw grid for current area
+            for x in range(0, SCREEN_WIDTH, GRID_SIZE):
+                pygame.draw.line(screen, current_area.grid_color if current_area else GRID_COLOR, 
+                               (x, 0), (x, SCREEN_HEIGHT), 2)
+            for y in range(0, SCREEN_HEIGHT, GRID_SIZE):
+                pygame.draw.line(screen, current_area.grid_color if current_area else GRID_COLOR, 
+                               (0, y), (SCREEN_WIDTH, y), 2)
+
+            # Draw area boundaries more prominently
+            pygame.draw.rect(screen, (255, 255, 255), (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT), 3)
+
+            # Draw player (convert world coordinates to screen coordinates)
+            if game.player:
+                screen_x, screen_y = game.world_map.world_to_screen(game.player.x, game.player.y)
+                original_x, original_y = game.player.x, game.player.y
+                game.player.x, game.player.y = screen_x, screen_y
+                game.player.draw(screen)
+                game.player.x, game.player.y = original_x, original_y
+
+                # Draw player position indicator
+                grid_x = (screen_x // GRID_SIZE) * GRID_SIZE
+                grid_y = (screen_y // GRID_SIZE) * GRID_SIZE
+                pygame.draw.rect(screen, (255, 255, 0), (grid_x, grid_y, GRID_SIZE, GRID_SIZE), 2)
+
+            # Draw enemies (convert world coordinates to screen coordinates)
+            t = profiler.start()
+            for enemy in game.enemies:
+                screen_x, screen_y = game.world_map.world_to_screen(enemy.x, enemy.y)
+                if 0 <= screen_x < SCREEN_WIDTH and 0 <= screen_y < SCREEN_HEIGHT:
+                    original_x, original_y = enemy.x, enemy.y
+                    enemy.x, enemy.y = screen_x, screen_y
+                    enemy.draw(screen)
+                    enemy.x, enemy.y = original_x, original_y
+            profiler.stop("enemies.draw", t)
+
+            # Draw items (convert world coordinates to screen coordinates)
+            t = profiler.start()
+            for item in game.items:
+                screen_x, screen_y = game.world_map.world_to_screen(item.x, item.y)
+                if 0 <= screen_x < SCREEN_WIDTH and 0 <= screen_y < SCREEN_HEIGHT:
+                    original_x, original_y = item.x, item.y
+                    item.x, item.y = screen_x, screen_y
+                    item.draw(screen)
+                    item.x, item.y = original_x, original_y
+            profiler.stop("items.draw", t)
+
+            # Draw particle effects
+            t = profiler.start()
+            game.particle_system.draw(screen, game.world_map)
+            profiler.stop("particles.draw", t)
+
+            # Draw town entrance cutscene if active
+            if current_area and current_area.cutscene_active:
+                current_area.draw_cutscene(screen)
+
+            # Draw area transition effect
+            if game.world_map.transitioning:
+                overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+                overlay.fill((0, 0, 0, game.world_map.area_transition_alpha))
+                screen.blit(overlay, (0, 0))
+
+            # Draw UI overlay
+            self.draw_ui(screen)
+
+    def draw_ui(self, screen):
+        """Draw the overworld UI overlay"""
+        game = self.game
+        if not game.player:
+            return
+
+        # Draw player stats
+        game.player.draw_stats(screen, 10, 10)
+
+        # Draw score
+        score_text = font_small.render(f"Score: {game.score}", True, TEXT_COLOR)
+        screen.blit(score_text, (10, 150))
+
+        # Draw controls hint
+        controls_text = font_tiny.render("M: Map | F5: Save | ESC: Menu", True, (150, 150, 150))
+        screen.blit(controls_text, (10, SCREEN_HEIGHT - 30))
+
+
+class BattleState(State):
+    """Turn-based combat; the battle screen (and its particles) is dropped on exit"""
+    name = BATTLE
+
+    def exit(self, next_state):
+        self.game.battle_screen = None
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and self.game.battle_screen:
+            self.game.battle_screen.handle_input(event, self.game)
+
+    def handle_action(self, action):
+        if action.pressed and self.game.battle_screen:
+            self.game.battle_screen.handle_command(action, self.game)
+
+    def update(self):
+        game = self.game
+        battle = game.battle_screen
+        if not battle:
+            return
+        t = profiler.start()
+        battle_ended = battle.update()
+        profiler.stop("battle.update", t)
+        if not battle_ended:
+            return
+
+        # Save once we're back in the overworld (a lost battle keeps the old save)
+        game.autosave_requested = True
+
+        # Boss battle win/lose/escape
+        if game.boss_system.is_boss_battle(battle):
+            if battle.result == "win":
+                game.boss_system.handle_boss_battle_win(game.player, battle.enemy, game)
+            elif battle.result == "lose":
+                game.boss_system.handle_boss_battle_lose(game)
+            elif battle.result == "escape":
+                game.boss_system.handle_boss_battle_escape(game.player, game)
+        else:
+            if battle.result == "win":
+                game.player.kills += 1
+                game.player.gain_exp(25)
+                game.score += 10
+                game.start_transition()
+                print(f"Battle ended - transitioning to overworld")
+                game.state = OVERWORLD
+            elif battle.result == "lose":
+                game.state = GAME_OVER
+            elif battle.result == "escape":
+                game.player.exp = 0
+                game.player.just_leveled_up = False
+                print(f"Battle escaped - transitioning to overworld")
+                game.state = OVERWORLD
+        game.end_battle(battle)
+
+    def draw(self, screen):
+        if self.game.battle_screen:
+            t = profiler.start()
+            self.game.battle_screen.draw(screen)
+            profiler.stop("battle.draw", t)
+
+
+class EndScreenState(State):
+    """Shared by the game over and victory screens: two buttons and some text"""
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.play_again_button = Button(SCREEN_WIDTH//2 - 120, 450, 240, 60, "PLAY AGAIN", UI_BORDER)
+        self.menu_button = Button(SCREEN_WIDTH//2 - 120, 530, 240, 60, "MAIN MENU", UI_BORDER)
+
+    def handle_mouse(self, mouse_pos, mouse_click):
+        game = self.game
+        self.play_again_button.update(mouse_pos)
+        self.menu_button.update(mouse_pos)
+
+        if self.play_again_button.is_clicked(mouse_pos, mouse_click):
+            if game.SFX_CLICK: game.SFX_CLICK.play()
+            game.state = CHARACTER_SELECT
+        elif self.menu_button.is_clicked(mouse_pos, mouse_click):
+            if game.SFX_CLICK: game.SFX_CLICK.play()
+            game.state = START_MENU
+
+    def draw_lines(self, screen, title, title_color, lines):
+        title_text = font_large.render(title, True, title_color)
+        screen.blit(title_text, title_text.get_rect(center=(SCREEN_WIDTH//2, 200)))
+        for i, line in enumerate(lines):
+            text = font_medium.render(line, True, TEXT_COLOR)
+            screen.blit(text, text.get_rect(center=(SCREEN_WIDTH//2, 300 + i * 50)))
+        self.play_again_button.draw(screen)
+        self.menu_button.draw(screen)
+
+
+class GameOverState(EndScreenState):
+    name = GAME_OVER
+
+    def handle_action(self, action):
+        if action.action == BACK and action.pressed:
+            self.game.state = START_MENU
+
+    def draw(self, screen):
+        lines = [f"Final Score: {self.game.score}"]
+        if self.game.player:
+            lines.append(f"Level Reached: {self.game.player.level}")
+        self.draw_lines(screen, "GAME OVER", (255, 100, 100), lines)
+
+
+class VictoryState(EndScreenState):
+    name = VICTORY
+
+    def update(self):
+        # After victory music plays once, return to menu
+        if not self.game.music.is_playing():
+            self.game.state = START_MENU
+
+    def draw(self, screen):
+        self.draw_lines(screen, "VICTORY!", (255, 215, 0),
+                        ["You defeated the Dragon Lord!", f"Final Score: {self.game.score}"])
+
+
+STATE_CLASSES = {cls.name: cls for cls in (StartMenuState, OpeningCutsceneState, CharacterSelectState,
+                                           OverworldState, BattleState, GameOverState, VictoryState)}
+
+
+class StateRegistry:
+    """Finds a game's state objects by name, creating each one on first use"""
+
+    def __init__(self, game):
+        self.game = game
+        self.states = {}
+
+    def get(self, name):
+        state = self.states.get(name)
+        if state is None:
+            state = self.states[name] = STATE_CLASSES[name](self.game)
+        return state
@@ -16,7 +16,6 @@ import pygame
 import math
 from ui.button import Button
 from config.constants import *
-from utils.android_utils import is_android
 
 
 # Main menu and character select buttons
@@ -422,39 +421,5 @@ def draw_android_controls(game, screen):
         game: The main Game instance
         screen: The pygame display surface
     """
-    if is_android() and game.android_buttons:
-        # D-pad
-        pygame.draw.rect(screen, (200,200,200), game.android_buttons['up'], border_radius=20)
-        pygame.draw.polygon(screen, (100,100,100), [
-            (game.android_buttons['up'].centerx, game.android_buttons['up'].top+15),
-            (game.android_buttons['up'].left+15, game.android_buttons['up'].bottom-15),
-            (game.android_buttons['up'].right-15, game.android_buttons['up'].bottom-15)
-        ])
-        pygame.draw.rect(screen, (200,200,200), game.android_buttons['down'], border_radius=20)
-        pygame.draw.polygon(screen, (100,100,100), [
-            (game.android_buttons['down'].centerx, game.android_buttons['down'].bottom-15),
-            (game.android_buttons['down'].left+15, game.android_buttons['down'].top+15),
-            (game.android_buttons['down'].right-15, game.android_buttons['down'].top+15)
-        ])
-        pygame.draw.rect(screen, (200,200,200), game.android_buttons['left'], border_radius=20)
-        pygame.draw.polygon(screen, (100,100,100), [
-            (game.android_buttons['left'].left+15, game.android_buttons['left'].centery),
-            (game.android_buttons['left'].right-15, game.android_buttons['left'].top+15),
-            (game.android_buttons['left'].right-15, game.android_buttons['left'].bottom-15)
-        ])
-        pygame.draw.rect(screen, (200,200,200), game.android_buttons['right'], border_radius=20)
-        pygame.draw.polygon(screen, (100,100,100), [
-            (game.android_buttons['right'].right-15, game.android_buttons['right'].centery),
-            (game.android_buttons['right'].left+15, game.android_buttons['right'].top+15),
-            (game.android_buttons['right'].left+15, game.android_buttons['right'].bottom-15)
-        ])
-        
-        # Enter
-        pygame.draw.rect(screen, (255,215,0), game.android_buttons['enter'], border_radius=20)
-        enter_text = font_small.render('ENT', True, (0,0,0))
-        screen.blit(enter_text, enter_text.get_rect(center=game.android_buttons['enter'].center))
-        
-        # Space
-        pygame.draw.rect(screen, (0,255,255), game.android_buttons['space'], border_radius=20)
-        space_text = font_small.render('SPC', True, (0,0,0))
-        screen.blit(space_text, space_text.get_rect(center=game.android_buttons['space'].center)) 
\ No newline at end of file
+    if game.input.touch:
+        game.input.touch.draw(screen)
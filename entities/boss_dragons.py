@@ -17,6 +17,7 @@ import random
 import math
 from entities.enemy import Enemy
 from config.constants import *
+from systems.quality_governor import quality
 
 
 class DragonBoss(Enemy):
@@ -278,11 +279,12 @@ class BossDragon(Enemy):
         x = self.x + offset_x
         y = self.y + offset_y
         
-        # Draw aura effect for final boss
-        aura_alpha = int(50 + 30 * math.sin(self.aura_timer * 0.1))
-        aura_surf = pygame.Surface((200, 200), pygame.SRCALPHA)
-        pygame.draw.circle(aura_surf, (*self.aura_color, aura_alpha), (100, 100), 80)
-        surface.blit(aura_surf, (x - 20, y - 20))
+        # Draw aura effect for final boss (skipped at lower quality settings)
+        if quality.boss_aura:
+            aura_alpha = int(50 + 30 * math.sin(self.aura_timer * 0.1))
+            aura_surf = pygame.Surface((200, 200), pygame.SRCALPHA)
+            pygame.draw.circle(aura_surf, (*self.aura_color, aura_alpha), (100, 100), 80)
+            surface.blit(aura_surf, (x - 20, y - 20))
         
         # --- Draw the ultimate dragon boss, facing left ---
         
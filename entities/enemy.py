@@ -169,12 +169,15 @@ class Enemy:
             dx = (dx / distance) * self.speed
             dy = (dy / distance) * self.speed
             
+            # Keep enemy within the bounds of the area it is in (x, y are world coordinates)
+            area_left = (self.x // AREA_WIDTH) * AREA_WIDTH
+            area_top = (self.y // AREA_HEIGHT) * AREA_HEIGHT
+            
             self.x += dx
             self.y += dy
             
-            # Keep enemy within screen bounds
-            self.x = max(self.size//2, min(SCREEN_WIDTH - self.size//2, self.x))
-            self.y = max(self.size//2, min(SCREEN_HEIGHT - self.size//2, self.y))
+            self.x = max(area_left + self.size//2, min(area_left + AREA_WIDTH - self.size//2, self.x))
+            self.y = max(area_top + self.size//2, min(area_top + AREA_HEIGHT - self.size//2, self.y))
         
         self.movement_cooldown = self.movement_delay
 
@@ -17,6 +17,7 @@ import math
 import random
 from config.constants import *
 from abc import ABC, abstractmethod
+from .character_stats import gain_exp, level_up
 # Import character classes (avoiding circular imports)
 # These will be imported when needed
 
@@ -50,6 +51,10 @@ class CharacterBase(ABC):
         """Draw the character's stats (HP, MP, EXP, etc.) on the given surface."""
         pass
 
+    # Experience and leveling (shared by every class, see character_stats.py)
+    gain_exp = gain_exp
+    level_up = level_up
+
 class Character:
     """
     Character factory/wrapper. Instantiates the correct subclass (Warrior, Mage, Rogue) based on char_type.
@@ -61,8 +61,10 @@ All the complex logic is in other modules:
 - entities/: Contains all the game characters and objects
 """
 
+import sys
 from core.game import Game
 from config.constants import *
+from systems.input_recorder import InputRecorder
 
 def main():
     """
@@ -78,8 +80,14 @@ def main():
     and all the complex parts (engine, transmission, etc.) work together.
     """
     print("Starting Dragon's Lair RPG...")
+    
+    # "python main.py --record session.dlr" records the session for replaying
+    # (see systems/input_recorder.py). The recorder must exist before the Game.
+    input_source = None
+    if len(sys.argv) >= 3 and sys.argv[1] == "--record":
+        input_source = InputRecorder(sys.argv[2])
     game = Game()
-    game.run()
+    game.run(input_source)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -1,10 +1,22 @@
 # Systems package initialization
 
-# Import all system classes for easy access
-from .particle_system import ParticleSystem
-from .boss_system import BossSystem
+# System classes are imported on first use so headless tools (the combat
+# engine and the balance simulator) can run without starting pygame.
+_LAZY_IMPORTS = {
+    'ParticleSystem': '.particle_system',
+    'BossSystem': '.boss_system',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'ParticleSystem',
     'BossSystem'
-] 
\ No newline at end of file
+]
\ No newline at end of file
@@ -0,0 +1,243 @@
+"""
+DRAGON'S LAIR RPG - Action Scheduler Module
+===========================================
+
+This module contains a timed scheduler for battle animations and actions.
+
+WHAT THIS FILE DOES:
+===================
+A battle is a little play: "You attack!" shows up, the fireball flies, it
+hits, the enemy flinches, then the enemy takes its turn. The ActionScheduler
+runs those steps at exact times:
+- queue() adds a step to a track; steps on one track run one after another
+- Different tracks run side by side (e.g. the turn sequence and an effect timer)
+- after() runs a single step after a delay, independent of any track
+- A step can return a number of ticks to wait before the next one on its track
+- hold()/release() pause a track (e.g. until the player presses continue)
+- cancel() and cancel_track() remove steps that haven't run yet
+- skip_to_end() runs everything that's left immediately (fast forward)
+
+Time is counted in "ticks" (the battle uses one tick per frame). Pending steps
+are kept in a heap sorted by the time they are due, so advance() only looks
+at steps that are actually ready - nothing is polled every frame.
+
+FOR NOVICE CODERS:
+==================
+Think of a track as a line of people waiting at a counter, and the heap as
+an alarm clock that rings when the next person's turn comes up. Several
+counters (tracks) can serve people at the same time.
+"""
+
+import heapq
+import itertools
+from collections import deque
+
+
+class ScheduledAction:
+    """
+    A step waiting to run. Returned by queue()/after() so it can be cancelled.
+    """
+    __slots__ = ("callback", "delay", "track", "time", "seq", "cancelled", "done")
+
+    def __init__(self, callback, delay, track):
+        self.callback = callback
+        self.delay = delay
+        self.track = track
+        self.time = None        # Tick it is due at (set once it's in the heap)
+        self.seq = 0            # Keeps steps due on the same tick in order
+        self.cancelled = False
+        self.done = False
+
+    def __lt__(self, other):
+        return (self.time, self.seq) < (other.time, other.seq)
+
+
+class ActionScheduler:
+    """
+    Runs callbacks at exact ticks, on sequential tracks or as one-shot timers.
+    """
+
+    def __init__(self):
+        self.now = 0
+        self._heap = []
+        self._tracks = {}        # track name -> deque of steps still waiting
+        self._armed = {}         # track name -> step currently in the heap
+        self._parked = {}        # track name -> due step held back by hold()
+        self._held = set()
+        self._running = None     # Track whose step is running right now
+        self._seq = itertools.count()
+
+    # ------------------------------------------------------------------
+    # Adding steps
+    # ------------------------------------------------------------------
+    def queue(self, callback, delay=0, track="main"):
+        """
+        Add a step to the end of a track.
+
+        Args:
+            callback: Function to call (may return ticks to wait before the next step)
+            delay: Ticks to wait after the previous step on this track
+            track: Name of the track
+
+        Returns:
+            ScheduledAction: Handle that can be passed to cancel()
+        """
+        action = ScheduledAction(callback, delay, track)
+        self._tracks.setdefault(track, deque()).append(action)
+        if track not in self._armed and track not in self._parked and track != self._running:
+            self._arm_next(track, self.now)
+        return action
+
+    def wait(self, ticks, track="main"):
+        """Add a pause of the given number of ticks to a track"""
+        return self.queue(None, ticks, track)
+
+    def after(self, delay, callback):
+        """
+        Run a callback once after a delay, independent of all tracks.
+
+        Returns:
+            ScheduledAction: Handle that can be passed to cancel()
+        """
+        action = ScheduledAction(callback, delay, None)
+        self._push(action, self.now + delay)
+        return action
+
+    # ------------------------------------------------------------------
+    # Removing and pausing steps
+    # ------------------------------------------------------------------
+    def cancel(self, action):
+        """Stop a step from running (does nothing if it already ran)"""
+        if action is None or action.done:
+            return
+        action.cancelled = True
+        track = action.track
+        if track is None:
+            return
+        if self._armed.get(track) is action:
+            del self._armed[track]
+            self._arm_next(track, self.now)
+        elif self._parked.get(track) is action:
+            del self._parked[track]
+            if track not in self._held:
+                self._arm_next(track, self.now)
+        else:
+            steps = self._tracks.get(track)
+            if steps and action in steps:
+                steps.remove(action)
+
+    def cancel_track(self, track):
+        """Remove every step that is still waiting on a track"""
+        steps = self._tracks.pop(track, None)
+        if steps:
+            for action in steps:
+                action.cancelled = True
+        for pending in (self._armed, self._parked):
+            action = pending.pop(track, None)
+            if action:
+                action.cancelled = True
+
+    def hold(self, track="main"):
+        """Pause a track: its next step waits until release() is called"""
+        self._held.add(track)
+
+    def release(self, track="main"):
+        """Let a held track continue from the current tick"""
+        self._held.discard(track)
+        action = self._parked.pop(track, None)
+        if action:
+            self._push(action, self.now)
+            self._armed[track] = action
+
+    # ------------------------------------------------------------------
+    # Running steps
+    # ------------------------------------------------------------------
+    def advance(self, ticks=1):
+        """
+        Move time forward and run every step that becomes due.
+
+        Args:
+            ticks: How many ticks to move forward
+        """
+        target = self.now + ticks
+        while self._heap and self._heap[0].time <= target:
+            self._run_next(ignore_holds=False)
+        self.now = target
+
+    def skip_to_end(self, track=None, ignore_holds=True, max_steps=10000):
+        """
+        Run all remaining steps immediately, ignoring their delays.
+
+        Args:
+            track: Only wait for this track to empty (other steps still run in time order)
+            ignore_holds: Also run steps on held tracks
+            max_steps: Safety limit in case steps keep queueing new steps
+        """
+        for _ in range(max_steps):
+            if not self.busy(track):
+                break
+            if ignore_holds and self._parked:
+                for name in list(self._parked):
+                    self.release(name)
+            if not self._heap:
+                break
+            self._run_next(ignore_holds)
+
+    def busy(self, track=None):
+        """
+        Check if steps are still waiting.
+
+        Args:
+            track: A track name, or None to check everything
+        """
+        if track is None:
+            return bool(self._heap or self._parked or any(self._tracks.values()))
+        return bool(self._tracks.get(track) or track in self._armed or track in self._parked)
+
+    def clear(self):
+        """Forget every waiting step"""
+        for track in list(self._tracks) + list(self._armed) + list(self._parked):
+            self.cancel_track(track)
+        for action in self._heap:
+            action.cancelled = True
+        self._heap = []
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _push(self, action, time):
+        action.time = time
+        action.seq = next(self._seq)
+        heapq.heappush(self._heap, action)
+
+    def _arm_next(self, track, start_time):
+        """Put the next step of a track into the heap"""
+        steps = self._tracks.get(track)
+        if not steps:
+            self._tracks.pop(track, None)
+            return
+        action = steps.popleft()
+        self._armed[track] = action
+        self._push(action, start_time + action.delay)
+
+    def _run_next(self, ignore_holds):
+        action = heapq.heappop(self._heap)
+        if action.cancelled:
+            return
+        self.now = max(self.now, action.time)
+        track = action.track
+        if track is not None:
+            if track in self._held and not ignore_holds:
+                # Keep the step until the track is released
+                del self._armed[track]
+                self._parked[track] = action
+                return
+            del self._armed[track]
+        action.done = True
+        self._running = track
+        try:
+            wait = action.callback() if action.callback else None
+        finally:
+            self._running = None
+        if track is not None and track not in self._armed and track not in self._parked:
+            self._arm_next(track, self.now + (wait or 0))
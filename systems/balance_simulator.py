@@ -0,0 +1,403 @@
+"""
+DRAGON'S LAIR RPG - Balance Simulator Module
+============================================
+
+This module runs huge numbers of headless fights to check game balance.
+
+WHAT THIS FILE DOES:
+===================
+Character base stats, level up bonuses and dragon boss scaling are tuned by
+hand. This simulator shows what those numbers actually do:
+- Every class (Warrior/Mage/Rogue) at every chosen player level
+- Against a regular Enemy, a DragonBoss of that level and the final BossDragon
+- Thousands (or millions) of fights each, spread over all CPU cores
+- Win rate, turns-to-kill and HP-remaining distributions saved as CSV/JSON
+
+The fights use systems.combat_engine, so no window or sound is ever created.
+Combat damage itself has no randomness, so the spread in the results comes
+from the player: the "varied" policy plays like a real person who doesn't
+always pick the best move (use --policy default for the fixed autopilot).
+Every batch of fights gets its own seeded random stream, which means the same
+seed always gives the same results no matter how many worker processes run.
+
+HOW TO USE IT:
+==============
+    python -m systems.balance_simulator run --fights 100000 --levels 1-10
+    python -m systems.balance_simulator stats my_stats.json
+    python -m systems.balance_simulator compare default my_stats.json
+
+"stats" writes the built-in stat table to a JSON file you can edit, and
+"compare" runs both tables with the same seed and prints the differences.
+
+FOR NOVICE CODERS:
+==================
+A "stat table" is just a dictionary of numbers, for example the Warrior's
+starting health. Change a number, run compare, and you'll see how much
+easier or harder every fight became.
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+from systems.combat_engine import (Combatant, CombatState, resolve_battle, default_policy,
+                                   MAGIC_MANA_COST, POTION_HEAL_AMOUNT)
+
+# Stat table matching the game's code:
+# - classes: Character.__new__ base stats
+# - level_up: character_stats.level_up bonuses per level
+# - enemies: [base, per_level] values from Enemy, DragonBoss and BossDragon
+# tests/test_balance_simulator.py fails if an entity is retuned without updating this
+DEFAULT_STAT_TABLE = {
+    "classes": {
+        "Warrior": {"health": 120, "mana": 50, "strength": 15, "defense": 10},
+        "Mage": {"health": 80, "mana": 120, "strength": 8, "defense": 6},
+        "Rogue": {"health": 100, "mana": 70, "strength": 12, "defense": 8},
+    },
+    "level_up": {"health": 20, "mana": 15, "strength": 3, "defense": 2},
+    "enemies": {
+        "Enemy": {"health": [50, 10], "strength": [8, 2]},
+        "DragonBoss": {"health": [200, 60], "strength": [18, 4]},
+        "BossDragon": {"health": [400, 0], "strength": [35, 0]},
+    },
+}
+
+CLASSES = ("Warrior", "Mage", "Rogue")
+ENEMIES = ("Enemy", "DragonBoss", "BossDragon")
+
+# Fights run per worker task (small enough to keep every core busy)
+FIGHTS_PER_TASK = 5000
+# Fights longer than this many player turns count as a timeout
+MAX_TURNS = 500
+
+# How often the "varied" player makes the sensible choice
+HEAL_CHANCE = 0.8
+MAGIC_CHANCE = 0.6
+
+CSV_FIELDS = ["class", "level", "enemy", "fights", "win_rate", "lose_rate",
+              "escape_rate", "timeout_rate", "turns_mean", "turns_p50",
+              "turns_p95", "hp_left_mean", "hp_left_p50", "hp_left_p5"]
+
+
+def load_stat_table(path=None):
+    """
+    Load a stat table from a JSON file.
+
+    Missing entries fall back to DEFAULT_STAT_TABLE, so a file only needs
+    the numbers you want to change. "default" (or None) gives the built-in table.
+    """
+    table = json.loads(json.dumps(DEFAULT_STAT_TABLE))
+    if path is None or path == "default":
+        return table
+    with open(path) as f:
+        overrides = json.load(f)
+    for section, entries in overrides.items():
+        for name, values in entries.items():
+            if isinstance(values, dict):
+                table[section].setdefault(name, {}).update(values)
+            else:
+                table[section][name] = values
+    return table
+
+
+def make_player(table, char_type, level):
+    """Create the player's stat block at a given level"""
+    base = table["classes"][char_type]
+    bonus = table["level_up"]
+    ups = level - 1
+    health = base["health"] + bonus["health"] * ups
+    mana = base["mana"] + bonus["mana"] * ups
+    return Combatant(char_type, health, health,
+                     base["strength"] + bonus["strength"] * ups,
+                     defense=base["defense"] + bonus["defense"] * ups,
+                     mana=mana, max_mana=mana, char_type=char_type)
+
+
+def make_enemy(table, enemy_name, level):
+    """Create an enemy's stat block for a player of the given level"""
+    stats = table["enemies"][enemy_name]
+    health = stats["health"][0] + stats["health"][1] * level
+    strength = stats["strength"][0] + stats["strength"][1] * level
+    return Combatant(enemy_name, health, health, strength, enemy_type=enemy_name)
+
+
+def varied_policy(state):
+    """
+    Player that usually, but not always, makes the sensible move:
+    heals when low, often uses magic when there's mana, otherwise attacks.
+    """
+    player = state.player
+    roll = state.rng.random()
+    if player.health * 4 < player.max_health and player.health + POTION_HEAL_AMOUNT < player.max_health:
+        if roll < HEAL_CHANCE:
+            return "item"
+    elif player.mana >= MAGIC_MANA_COST and roll < MAGIC_CHANCE:
+        return "magic"
+    return "attack"
+
+
+POLICIES = {
+    "varied": varied_policy,
+    "default": default_policy,
+}
+
+
+def task_seed(seed, char_type, level, enemy_name, chunk):
+    """Seed for one batch of fights (the same inputs always give the same stream)"""
+    return f"{seed}/{char_type}/{level}/{enemy_name}/{chunk}"
+
+
+def simulate_chunk(task):
+    """
+    Run one batch of fights (this is what each worker process does).
+
+    Args:
+        task: (table, char_type, level, enemy_name, chunk, fights, seed, policy name)
+
+    Returns:
+        tuple: (matchup key, results Counter, turns Counter, hp-left Counter)
+    """
+    table, char_type, level, enemy_name, chunk, fights, seed, policy_name = task
+    policy = POLICIES[policy_name]
+    rng = random.Random(task_seed(seed, char_type, level, enemy_name, chunk))
+    results = Counter()
+    turns = Counter()
+    hp_left = Counter()
+    for _ in range(fights):
+        state = CombatState(make_player(table, char_type, level),
+                            make_enemy(table, enemy_name, level), rng=rng)
+        result = resolve_battle(state, policy, MAX_TURNS) or "timeout"
+        results[result] += 1
+        if result == "win":
+            turns[state.turn_count] += 1
+            # Remaining health in percent, rounded down to whole numbers
+            hp_left[max(0, state.player.health) * 100 // state.player.max_health] += 1
+    return (char_type, level, enemy_name), results, turns, hp_left
+
+
+def percentile(histogram, fraction):
+    """Get a percentile from a {value: count} histogram"""
+    total = sum(histogram.values())
+    if not total:
+        return None
+    target = fraction * (total - 1)
+    seen = 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        if seen > target:
+            return value
+    return max(histogram)
+
+
+def mean(histogram):
+    total = sum(histogram.values())
+    if not total:
+        return None
+    return sum(value * count for value, count in histogram.items()) / total
+
+
+def summarize(key, results, turns, hp_left):
+    """Turn the merged counters of one matchup into a summary row"""
+    char_type, level, enemy_name = key
+    fights = sum(results.values())
+    return {
+        "class": char_type,
+        "level": level,
+        "enemy": enemy_name,
+        "fights": fights,
+        "win_rate": results["win"] / fights,
+        "lose_rate": results["lose"] / fights,
+        "escape_rate": results["escape"] / fights,
+        "timeout_rate": results["timeout"] / fights,
+        "turns_mean": mean(turns),
+        "turns_p50": percentile(turns, 0.5),
+        "turns_p95": percentile(turns, 0.95),
+        "hp_left_mean": mean(hp_left),
+        "hp_left_p50": percentile(hp_left, 0.5),
+        "hp_left_p5": percentile(hp_left, 0.05),
+        "turns_histogram": {str(k): v for k, v in sorted(turns.items())},
+        "hp_left_histogram": {str(k): v for k, v in sorted(hp_left.items())},
+    }
+
+
+def run_simulation(table, levels, fights, seed=0, workers=None,
+                   classes=CLASSES, enemies=ENEMIES, policy="varied"):
+    """
+    Simulate every class x level x enemy matchup.
+
+    Args:
+        table: Stat table dictionary
+        levels: Player levels to test
+        fights: Fights per matchup
+        seed: Base seed for all random streams
+        workers: Number of worker processes (default: one per CPU)
+        classes, enemies: Which classes and enemies to include
+        policy: Name of the player policy in POLICIES
+
+    Returns:
+        list: One summary dictionary per matchup
+    """
+    tasks = []
+    for char_type in classes:
+        for level in levels:
+            for enemy_name in enemies:
+                for chunk, start in enumerate(range(0, fights, FIGHTS_PER_TASK)):
+                    count = min(FIGHTS_PER_TASK, fights - start)
+                    tasks.append((table, char_type, level, enemy_name, chunk, count, seed, policy))
+
+    merged = {}
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        chunk_results = map(simulate_chunk, tasks)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(workers)
+        chunk_results = pool.imap_unordered(simulate_chunk, tasks)
+    try:
+        for key, results, turns, hp_left in chunk_results:
+            totals = merged.setdefault(key, (Counter(), Counter(), Counter()))
+            totals[0].update(results)
+            totals[1].update(turns)
+            totals[2].update(hp_left)
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+    return [summarize(key, *merged[key])
+            for key in sorted(merged, key=lambda k: (classes.index(k[0]), k[1], enemies.index(k[2])))]
+
+
+def write_results(rows, out_prefix, table=None, seed=None, policy=None):
+    """Write summary rows to <out_prefix>.csv and full distributions to <out_prefix>.json"""
+    with open(out_prefix + ".csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(out_prefix + ".json", "w") as f:
+        json.dump({"seed": seed, "policy": policy, "stat_table": table, "matchups": rows}, f, indent=2)
+    print(f"Results written to {out_prefix}.csv and {out_prefix}.json")
+
+
+def print_rows(rows):
+    print(f"{'class':8} {'lvl':>3} {'enemy':10} {'win%':>6} {'turns':>6} {'hp%':>5}")
+    for row in rows:
+        # Matchups the player never won have no turns/HP numbers
+        turns = "-" if row["turns_mean"] is None else f"{row['turns_mean']:.1f}"
+        hp = "-" if row["hp_left_mean"] is None else f"{row['hp_left_mean']:.0f}"
+        print(f"{row['class']:8} {row['level']:>3} {row['enemy']:10} {row['win_rate'] * 100:6.1f} {turns:>6} {hp:>5}")
+
+
+def compare_rows(rows_a, rows_b):
+    """
+    Pair up the matchups of two runs and compute the differences (b - a).
+
+    Returns:
+        list: Dictionaries with both win rates and the changes
+    """
+    def delta(a, b):
+        return None if a is None or b is None else b - a
+
+    index_b = {(r["class"], r["level"], r["enemy"]): r for r in rows_b}
+    diffs = []
+    for a in rows_a:
+        b = index_b.get((a["class"], a["level"], a["enemy"]))
+        if b is None:
+            continue
+        diffs.append({
+            "class": a["class"], "level": a["level"], "enemy": a["enemy"],
+            "win_rate_a": a["win_rate"], "win_rate_b": b["win_rate"],
+            "win_rate_change": b["win_rate"] - a["win_rate"],
+            "turns_change": delta(a["turns_mean"], b["turns_mean"]),
+            "hp_left_change": delta(a["hp_left_mean"], b["hp_left_mean"]),
+        })
+    return diffs
+
+
+def parse_levels(text):
+    """Parse "1-10" or "1,5,10" into a list of levels"""
+    levels = []
+    for part in text.split(","):
+        if "-" in part:
+            low, high = part.split("-")
+            levels.extend(range(int(low), int(high) + 1))
+        else:
+            levels.append(int(part))
+    return levels
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dragon's Lair RPG balance simulator")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_run_options(p):
+        p.add_argument("--fights", type=int, default=10000, help="fights per matchup")
+        p.add_argument("--levels", default="1-10", help='player levels, e.g. "1-10" or "1,5,10"')
+        p.add_argument("--seed", type=int, default=0)
+        p.add_argument("--workers", type=int, default=None, help="worker processes (default: all CPUs)")
+        p.add_argument("--classes", default=",".join(CLASSES))
+        p.add_argument("--enemies", default=",".join(ENEMIES))
+        p.add_argument("--policy", choices=sorted(POLICIES), default="varied")
+
+    run_parser = commands.add_parser("run", help="simulate one stat table")
+    run_parser.add_argument("--stats", default="default", help='stat table JSON file or "default"')
+    run_parser.add_argument("--out", default="balance_results", help="output path prefix")
+    add_run_options(run_parser)
+
+    compare_parser = commands.add_parser("compare", help="simulate two stat tables and show the differences")
+    compare_parser.add_argument("stats_a", help='stat table JSON file or "default"')
+    compare_parser.add_argument("stats_b", help='stat table JSON file or "default"')
+    compare_parser.add_argument("--out", default=None, help="optional CSV file for the differences")
+    add_run_options(compare_parser)
+
+    stats_parser = commands.add_parser("stats", help="write the built-in stat table to a JSON file")
+    stats_parser.add_argument("path")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "stats":
+        with open(args.path, "w") as f:
+            json.dump(DEFAULT_STAT_TABLE, f, indent=2)
+        print(f"Stat table written to {args.path}")
+        return 0
+
+    options = dict(levels=parse_levels(args.levels), fights=args.fights, seed=args.seed,
+                   workers=args.workers, classes=tuple(args.classes.split(",")),
+                   enemies=tuple(args.enemies.split(",")), policy=args.policy)
+
+    if args.command == "run":
+        table = load_stat_table(args.stats)
+        start = time.perf_counter()
+        rows = run_simulation(table, **options)
+        elapsed = time.perf_counter() - start
+        total = sum(row["fights"] for row in rows)
+        print_rows(rows)
+        print(f"Simulated {total} fights in {elapsed:.1f}s ({total / elapsed:,.0f} fights/s)")
+        write_results(rows, args.out, table, args.seed, args.policy)
+        return 0
+
+    # compare: same seed for both tables so only the stats differ
+    rows_a = run_simulation(load_stat_table(args.stats_a), **options)
+    rows_b = run_simulation(load_stat_table(args.stats_b), **options)
+    diffs = compare_rows(rows_a, rows_b)
+    print(f"{'class':8} {'lvl':>3} {'enemy':10} {'win% A':>7} {'win% B':>7} {'change':>7}")
+    for d in diffs:
+        print(f"{d['class']:8} {d['level']:>3} {d['enemy']:10} {d['win_rate_a'] * 100:7.1f} "
+              f"{d['win_rate_b'] * 100:7.1f} {d['win_rate_change'] * 100:+7.1f}")
+    if args.out:
+        with open(args.out, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(diffs[0].keys()) if diffs else ["class"])
+            writer.writeheader()
+            writer.writerows(diffs)
+        print(f"Differences written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
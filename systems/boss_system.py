@@ -11,6 +11,7 @@ RESOURCE: This module provides boss battle management for the game.
 import pygame
 from config.constants import *
 from entities.boss_dragons import DragonBoss, BossDragon
+from systems.event_bus import LEVEL_UP
 
 class BossSystem:
     """
@@ -33,6 +34,25 @@ class BossSystem:
         """Initialize the boss system"""
         self.boss_battle_triggered = False
         self.boss_defeated = False
+        self.pending_boss = None  # Boss waiting to be fought, set on level up
+    
+    def subscribe(self, events):
+        """Check for a boss battle on every level up (see systems/event_bus.py)"""
+        events.subscribe(LEVEL_UP, self.on_level_up)
+    
+    def on_level_up(self, player, level):
+        should_trigger, boss_enemy = self.check_boss_battle_trigger(player)
+        self.pending_boss = boss_enemy if should_trigger else None
+    
+    def take_pending_boss(self):
+        """
+        Get the boss the last level up earned (only once)
+        
+        Returns:
+            The boss enemy to fight now, or None
+        """
+        boss_enemy, self.pending_boss = self.pending_boss, None
+        return boss_enemy
     
     def check_boss_battle_trigger(self, player):
         """
@@ -148,6 +168,7 @@ class BossSystem:
         """Reset boss system state for new game"""
         self.boss_battle_triggered = False
         self.boss_defeated = False
+        self.pending_boss = None
     
     def get_boss_battle_music_state(self, battle_screen):
         """
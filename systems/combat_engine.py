@@ -0,0 +1,281 @@
+"""
+DRAGON'S LAIR RPG - Combat Engine Module
+========================================
+
+This module contains the turn-based combat rules with no drawing at all.
+
+WHAT THIS FILE DOES:
+===================
+Every fight follows the same rules: the player picks attack, magic, item or
+run, then the enemy hits back, until someone wins or the player escapes.
+This module runs those rules on plain numbers:
+- CombatState holds the player, the enemy, whose turn it is and the RNG
+- player_action() and enemy_turn() advance the fight by one step
+- Each step returns a list of events ("damage", "log", "battle_end", ...)
+- resolve_battle() plays a whole fight instantly (used for balance testing)
+
+The BattleScreen (ui/battle_screen.py) does not change health itself any
+more - it asks this engine what happened and animates the events it gets
+back. Because nothing here waits for frames, a full fight resolves in
+microseconds.
+
+FOR NOVICE CODERS:
+==================
+Think of this like a referee with a notebook:
+- The referee decides what happens and writes it down
+- The BattleScreen is the TV crew that replays the notes with effects
+
+EVENTS:
+=======
+Events are dictionaries with a "type" key:
+- {"type": "log", "message": str}
+- {"type": "player_attack", "style": "Warrior"/"Mage"/"Rogue"}
+- {"type": "player_magic"}
+- {"type": "damage", "target": "player"/"enemy", "amount": int, "health": int, "source": str}
+- {"type": "heal", "target": "player", "amount": int, "health": int}
+- {"type": "mana", "target": "player", "amount": int, "mana": int}
+- {"type": "enemy_attack", "element": str}
+- {"type": "turn", "turn": "player_turn"/"enemy_turn"}
+- {"type": "battle_end", "result": "win"/"lose"/"escape"}
+"""
+
+import random
+
+# Player choices, in the same order as the battle buttons
+ACTIONS = ("attack", "magic", "item", "run")
+
+# Combat rule numbers
+MAGIC_MANA_COST = 20
+MAGIC_DAMAGE_MULTIPLIER = 2
+POTION_HEAL_AMOUNT = 30
+ESCAPE_CHANCE = 0.7
+
+
+class Combatant:
+    """
+    Plain stat block for one side of a fight.
+    Copies only what the rules need from a Character or Enemy.
+    """
+    __slots__ = ("name", "type", "enemy_type", "health", "max_health",
+                 "mana", "max_mana", "strength", "defense")
+
+    def __init__(self, name, health, max_health, strength, defense=0,
+                 mana=0, max_mana=0, char_type=None, enemy_type=None):
+        self.name = name
+        self.type = char_type
+        self.enemy_type = enemy_type
+        self.health = health
+        self.max_health = max_health
+        self.mana = mana
+        self.max_mana = max_mana
+        self.strength = strength
+        self.defense = defense
+
+    @classmethod
+    def from_entity(cls, entity):
+        """Create a stat block from a Character or Enemy object"""
+        char_type = getattr(entity, 'type', None)
+        return cls(
+            name=getattr(entity, 'name', char_type),
+            health=entity.health,
+            max_health=entity.max_health,
+            strength=entity.strength,
+            defense=getattr(entity, 'defense', 0),
+            mana=getattr(entity, 'mana', 0),
+            max_mana=getattr(entity, 'max_mana', 0),
+            char_type=char_type,
+            enemy_type=getattr(entity, 'enemy_type', None),
+        )
+
+
+class CombatState:
+    """
+    Everything needed to continue a fight: both combatants, whose turn it is,
+    the result once the fight is over, and the random number generator.
+    """
+    def __init__(self, player, enemy, rng=None, seed=None):
+        """
+        Args:
+            player: Combatant (or Character) for the player
+            enemy: Combatant (or Enemy) for the enemy
+            rng: Optional random.Random to use for all rolls
+            seed: Seed for a new random.Random if rng is not given
+        """
+        self.player = player if isinstance(player, Combatant) else Combatant.from_entity(player)
+        self.enemy = enemy if isinstance(enemy, Combatant) else Combatant.from_entity(enemy)
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.turn = "player_turn"
+        self.result = None
+        self.turn_count = 0
+
+    @property
+    def ended(self):
+        return self.result is not None
+
+
+def _end_battle(state, result, message, events):
+    state.result = result
+    state.turn = "ended"
+    events.append({"type": "log", "message": message})
+    events.append({"type": "battle_end", "result": result})
+
+
+def _damage_enemy(state, damage, source, events):
+    enemy = state.enemy
+    enemy.health -= damage
+    events.append({"type": "damage", "target": "enemy", "amount": damage,
+                   "health": enemy.health, "source": source})
+
+
+def _start_enemy_turn(state, events):
+    if state.enemy.health <= 0:
+        _end_battle(state, "win", "You defeated the enemy!", events)
+    else:
+        state.turn = "enemy_turn"
+        events.append({"type": "turn", "turn": "enemy_turn"})
+
+
+def player_attack(state):
+    """Basic attack: deals the player's strength as damage"""
+    player, enemy = state.player, state.enemy
+    events = [{"type": "log", "message": "You attack!"},
+              {"type": "player_attack", "style": player.type}]
+    damage = player.strength
+    _damage_enemy(state, damage, "attack", events)
+    if player.type == "Mage":
+        message = f"Fireball dealt {damage} damage to {enemy.name}!"
+    elif player.type == "Rogue":
+        message = f"Knife throw dealt {damage} damage to {enemy.name}!"
+    else:
+        message = f"You dealt {damage} damage to {enemy.name}!"
+    events.append({"type": "log", "message": message})
+    _start_enemy_turn(state, events)
+    return events
+
+
+def player_magic(state):
+    """Magic attack: double damage for 20 mana (does not use a turn without mana)"""
+    player, enemy = state.player, state.enemy
+    if player.mana < MAGIC_MANA_COST:
+        return [{"type": "log", "message": "Not enough mana!"}]
+    events = [{"type": "log", "message": "You cast a fireball!"},
+              {"type": "player_magic"}]
+    damage = player.strength * MAGIC_DAMAGE_MULTIPLIER
+    _damage_enemy(state, damage, "magic", events)
+    player.mana -= MAGIC_MANA_COST
+    events.append({"type": "mana", "target": "player", "amount": -MAGIC_MANA_COST, "mana": player.mana})
+    events.append({"type": "log", "message": f"Fireball dealt {damage} damage to {enemy.name}!"})
+    _start_enemy_turn(state, events)
+    return events
+
+
+def player_item(state):
+    """Health potion: restores 30 HP (up to max health)"""
+    player = state.player
+    events = [{"type": "log", "message": "You used a health potion!"}]
+    player.health = min(player.max_health, player.health + POTION_HEAL_AMOUNT)
+    events.append({"type": "heal", "target": "player", "amount": POTION_HEAL_AMOUNT, "health": player.health})
+    events.append({"type": "log", "message": f"Restored {POTION_HEAL_AMOUNT} HP!"})
+    _start_enemy_turn(state, events)
+    return events
+
+
+def player_run(state):
+    """Try to escape: 70% chance, otherwise the enemy gets a turn"""
+    events = [{"type": "log", "message": "You attempt to escape..."}]
+    if state.rng.random() < ESCAPE_CHANCE:
+        _end_battle(state, "escape", "You successfully escaped!", events)
+    else:
+        events.append({"type": "log", "message": "Escape failed! The enemy attacks!"})
+        _start_enemy_turn(state, events)
+    return events
+
+
+PLAYER_ACTIONS = {
+    "attack": player_attack,
+    "magic": player_magic,
+    "item": player_item,
+    "run": player_run,
+}
+
+
+def player_action(state, action):
+    """
+    Run one player action.
+
+    Args:
+        state: The CombatState
+        action: One of ACTIONS ("attack", "magic", "item", "run")
+
+    Returns:
+        list: Events describing what happened (empty if it's not the player's turn)
+    """
+    if state.turn != "player_turn":
+        return []
+    state.turn_count += 1
+    return PLAYER_ACTIONS[action](state)
+
+
+def enemy_turn(state):
+    """
+    Run the enemy's attack.
+
+    Returns:
+        list: Events describing what happened (empty if it's not the enemy's turn)
+    """
+    if state.turn != "enemy_turn":
+        return []
+    player, enemy = state.player, state.enemy
+    damage = max(1, enemy.strength - player.defense // 3)
+    player.health -= damage
+    events = [{"type": "enemy_attack", "element": enemy.enemy_type},
+              {"type": "damage", "target": "player", "amount": damage,
+               "health": player.health, "source": "enemy_attack"},
+              {"type": "log", "message": f"{enemy.name} attacks for {damage} damage!"}]
+    if player.health <= 0:
+        _end_battle(state, "lose", "You were defeated...", events)
+    else:
+        state.turn = "player_turn"
+        events.append({"type": "turn", "turn": "player_turn"})
+        events.append({"type": "log", "message": "It's your turn!"})
+    return events
+
+
+def step(state, action="attack"):
+    """Advance the fight by one turn (player action or enemy attack)"""
+    if state.turn == "player_turn":
+        return player_action(state, action)
+    return enemy_turn(state)
+
+
+def default_policy(state):
+    """
+    Simple automatic player used for headless fights:
+    heal when low, use magic when there's mana, otherwise attack.
+    """
+    player = state.player
+    if player.health * 4 < player.max_health and player.health + POTION_HEAL_AMOUNT < player.max_health:
+        return "item"
+    if player.mana >= MAGIC_MANA_COST:
+        return "magic"
+    return "attack"
+
+
+def resolve_battle(state, policy=default_policy, max_turns=1000):
+    """
+    Play a whole fight with no rendering.
+
+    Args:
+        state: The CombatState to run (modified in place)
+        policy: Function(state) -> action name for the player's turns
+        max_turns: Safety limit on player turns
+
+    Returns:
+        str: The result ("win", "lose", "escape") or None if max_turns ran out
+    """
+    while state.result is None and state.turn_count < max_turns:
+        if state.turn == "player_turn":
+            player_action(state, policy(state))
+        else:
+            enemy_turn(state)
+    return state.result
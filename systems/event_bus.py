@@ -0,0 +1,124 @@
+"""
+DRAGON'S LAIR RPG - Event Bus Module
+====================================
+
+This module lets the game's systems react to things that happen instead of
+checking for them every frame.
+
+WHAT THIS FILE DOES:
+===================
+Game publishes an event when something changes, and every system that
+subscribed to it is called right away (synchronously, before publish()
+returns). The events and the keyword arguments their handlers receive:
+
+- state_changed   (old_state, new_state)  start_menu -> overworld -> battle ...
+- area_entered    (area, previous_area)   the player is in a new WorldArea
+- level_up        (player, level)         the player reached a new level
+- battle_started  (enemy, is_boss)        sent just before the state turns "battle"
+- battle_ended    (enemy, result, is_boss) result is "win", "lose" or "escape"
+- item_collected  (item)                  the player picked up an item
+
+Recorders see every event, which is handy for telemetry: an EventLog keeps
+the latest events with their time and can write them to a JSON file.
+
+HOW TO USE IT:
+=============
+    bus = EventBus()
+    bus.subscribe(LEVEL_UP, lambda player, level: print("Level", level))
+    bus.publish(LEVEL_UP, player=player, level=2)
+
+    log = EventLog()
+    bus.add_recorder(log)
+
+FOR NOVICE CODERS:
+==================
+It works like a newsletter: systems sign up for the topics they care about,
+and the game only has to announce news once - it doesn't need to know who is
+listening.
+"""
+
+import json
+import os
+import time
+from collections import deque
+
+STATE_CHANGED = "state_changed"
+AREA_ENTERED = "area_entered"
+LEVEL_UP = "level_up"
+BATTLE_STARTED = "battle_started"
+BATTLE_ENDED = "battle_ended"
+ITEM_COLLECTED = "item_collected"
+
+EVENTS = (STATE_CHANGED, AREA_ENTERED, LEVEL_UP, BATTLE_STARTED, BATTLE_ENDED, ITEM_COLLECTED)
+
+
+class EventBus:
+    """
+    Synchronous publish/subscribe.
+
+    Attributes:
+        handlers: event name -> list of handlers, called in subscription order
+        recorders: Called as recorder(event, data) for every published event
+    """
+
+    def __init__(self):
+        self.handlers = {event: [] for event in EVENTS}
+        self.recorders = []
+
+    def subscribe(self, event, handler):
+        """Call handler(**data) whenever `event` is published"""
+        if event not in self.handlers:
+            raise ValueError(f"Unknown event: {event}")
+        self.handlers[event].append(handler)
+
+    def unsubscribe(self, event, handler):
+        if handler in self.handlers.get(event, ()):
+            self.handlers[event].remove(handler)
+
+    def add_recorder(self, recorder):
+        self.recorders.append(recorder)
+
+    def publish(self, event, **data):
+        """Tell every subscriber about an event (returns once they're all done)"""
+        for recorder in self.recorders:
+            recorder(event, data)
+        # A copy, so handlers may subscribe or unsubscribe while being called
+        for handler in list(self.handlers[event]):
+            handler(**data)
+
+
+def describe(value):
+    """Short JSON-friendly description of an event argument"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    for attr in ("name", "type", "area_type"):
+        if isinstance(getattr(value, attr, None), str):
+            return getattr(value, attr)
+    return type(value).__name__
+
+
+class EventLog:
+    """Recorder that keeps the latest events, e.g. bus.add_recorder(EventLog())"""
+
+    def __init__(self, max_events=1000):
+        self.start = time.perf_counter()
+        self.events = deque(maxlen=max_events)
+
+    def __call__(self, event, data):
+        ms = (time.perf_counter() - self.start) * 1000
+        self.events.append((round(ms, 1), event, {key: describe(value) for key, value in data.items()}))
+
+    def counts(self):
+        counts = {}
+        for _ms, event, _data in self.events:
+            counts[event] = counts.get(event, 0) + 1
+        return counts
+
+    def dump(self, path):
+        """Write the logged events to a JSON file"""
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump([{"ms": ms, "event": event, **data} for ms, event, data in self.events], f, indent=1)
+        return path
@@ -0,0 +1,221 @@
+"""
+DRAGON'S LAIR RPG - Frame Profiler Module
+=========================================
+
+This module measures where the time of every frame goes.
+
+WHAT THIS FILE DOES:
+===================
+The game marks the start and end of its bigger jobs (updating particles,
+drawing the world area, the enemy loop, the battle screen, ...). While the
+profiler is switched on, each of those "sections" is timed every frame and:
+- The last PROFILER_WINDOW timings are kept per section and per game state,
+  so the overlay can show rolling p50/p95/p99 milliseconds
+- Every single timing is also logged (up to PROFILER_MAX_SAMPLES) and can be
+  exported to CSV or JSON for a closer look in a spreadsheet or script
+
+While it is switched off, start() and stop() return straight away, so the
+markers left in the game code cost next to nothing.
+
+HOW TO USE IT:
+==============
+In the game: F3 shows/hides the overlay (and switches timing on/off),
+F4 exports everything measured so far to the PROFILER_EXPORT_DIR folder.
+
+In code:
+    t = profiler.start()
+    self.particle_system.update()
+    profiler.stop("particles.update", t)
+
+FOR NOVICE CODERS:
+==================
+"p95 = 4.0 ms" means 95% of frames spent 4 ms or less in that section - the
+slowest 5% took longer. At 60 FPS a whole frame has about 16.7 ms to spend.
+"""
+
+import csv
+import json
+import os
+import time
+from collections import deque
+
+import pygame
+from config.constants import *
+
+perf_counter = time.perf_counter
+
+
+class FrameProfiler:
+    """
+    Times named sections of each frame, grouped by game state.
+
+    Attributes:
+        enabled: Whether timings are being recorded
+        show_hud: Whether the overlay is drawn
+        frame: Number of frames measured
+        state: Game state of the frame being measured
+        status: Extra name -> text lines shown on the overlay and exported (e.g. the quality level)
+    """
+
+    def __init__(self, window=PROFILER_WINDOW, max_samples=PROFILER_MAX_SAMPLES):
+        self.enabled = False
+        self.show_hud = False
+        self.window = window
+        self.frame = 0
+        self.state = None
+        self.status = {}
+        self.windows = {}                         # (state, section) -> deque of recent ms
+        self.samples = deque(maxlen=max_samples)  # (frame, state, section, ms) for export
+        self._frame_start = None
+        self._hud_surface = None
+        self._hud_frame = -PROFILER_HUD_REFRESH
+
+    # ------------------------------------------------------------------
+    # Timing
+    # ------------------------------------------------------------------
+    def start(self):
+        """Start timing a section; pass the result to stop()"""
+        if self.enabled:
+            return perf_counter()
+        return None
+
+    def stop(self, section, start):
+        """Record the time since start() under a section name"""
+        if start is None:
+            return
+        self.record(section, (perf_counter() - start) * 1000)
+
+    def record(self, section, ms):
+        """Add a timing (in milliseconds) measured some other way"""
+        key = (self.state, section)
+        samples = self.windows.get(key)
+        if samples is None:
+            samples = self.windows[key] = deque(maxlen=self.window)
+        samples.append(ms)
+        self.samples.append((self.frame, self.state, section, ms))
+
+    def begin_frame(self, state):
+        """Call at the top of every frame (an unfinished previous frame is dropped)"""
+        if not self.enabled:
+            return
+        self.frame += 1
+        self.state = state
+        self._frame_start = perf_counter()
+
+    def end_frame(self):
+        """Call once the frame's update and drawing are done"""
+        if self._frame_start is None:
+            return
+        self.record("frame", (perf_counter() - self._frame_start) * 1000)
+        self._frame_start = None
+
+    def toggle(self):
+        """Switch timing and the overlay on or off together"""
+        self.enabled = self.show_hud = not self.enabled
+        self._frame_start = None
+        print(f"Frame profiler {'on' if self.enabled else 'off'}")
+
+    def reset(self):
+        """Forget everything measured so far"""
+        self.windows.clear()
+        self.samples.clear()
+        self.frame = 0
+        self._hud_surface = None
+        self._hud_frame = -PROFILER_HUD_REFRESH
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+    def summary(self, state=None):
+        """
+        Get rolling percentiles.
+
+        Args:
+            state: Only this game state (None: every state)
+
+        Returns:
+            list: (state, section, count, p50, p95, p99) tuples, slowest p95 first
+        """
+        rows = []
+        for (row_state, section), samples in self.windows.items():
+            if state is not None and row_state != state:
+                continue
+            ordered = sorted(samples)
+            rows.append((row_state, section, len(ordered), percentile(ordered, 0.50),
+                         percentile(ordered, 0.95), percentile(ordered, 0.99)))
+        rows.sort(key=lambda row: row[4], reverse=True)
+        return rows
+
+    def export(self, folder=PROFILER_EXPORT_DIR):
+        """
+        Write the raw samples (CSV) and the samples plus percentiles (JSON).
+
+        Returns:
+            tuple: (csv path, json path), or None if nothing could be written
+        """
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        csv_path = os.path.join(folder, f"profile_{stamp}.csv")
+        json_path = os.path.join(folder, f"profile_{stamp}.json")
+        try:
+            os.makedirs(folder, exist_ok=True)
+            with open(csv_path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["frame", "state", "section", "ms"])
+                for frame, state, section, ms in self.samples:
+                    writer.writerow([frame, state, section, f"{ms:.4f}"])
+            summary = [{"state": state, "section": section, "count": count,
+                        "p50": p50, "p95": p95, "p99": p99}
+                       for state, section, count, p50, p95, p99 in self.summary()]
+            with open(json_path, "w") as f:
+                json.dump({"frames": self.frame, "window": self.window, "status": self.status, "summary": summary,
+                           "samples": [list(sample) for sample in self.samples]}, f)
+        except OSError as e:
+            print(f"Could not export profile: {e}")
+            return None
+        print(f"Profile exported to {csv_path} and {json_path}")
+        return csv_path, json_path
+
+    # ------------------------------------------------------------------
+    # Overlay
+    # ------------------------------------------------------------------
+    def draw(self, surface):
+        """Draw the overlay (re-rendered every PROFILER_HUD_REFRESH frames)"""
+        if not self.show_hud:
+            return
+        if self._hud_surface is None or self.frame - self._hud_frame >= PROFILER_HUD_REFRESH:
+            self._hud_surface = self._render_hud()
+            self._hud_frame = self.frame
+        surface.blit(self._hud_surface, (surface.get_width() - self._hud_surface.get_width() - 10, 10))
+
+    def _render_hud(self):
+        rows = self.summary(self.state)[:PROFILER_HUD_ROWS]
+        line_height = font_tiny.get_linesize()
+        status = [f"{name}: {text}" for name, text in self.status.items()]
+        panel = pygame.Surface((380, (len(rows) + len(status) + 2) * line_height + 12), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        pygame.draw.rect(panel, UI_BORDER, panel.get_rect(), 1)
+        panel.blit(font_tiny.render(f"PROFILER  {self.state}  (F4: export)", True, TEXT_COLOR), (8, 6))
+        for i, text in enumerate(status, start=1):
+            panel.blit(font_tiny.render(text, True, (220, 220, 220)), (8, 6 + i * line_height))
+        # Section names on the left, the three percentile columns right-aligned
+        lines = [("section", "p50", "p95", "p99", TEXT_COLOR)]
+        for _state, section, _count, p50, p95, p99 in rows:
+            lines.append((section, f"{p50:.2f}", f"{p95:.2f}", f"{p99:.2f}", (220, 220, 220)))
+        for i, (section, *columns, color) in enumerate(lines, start=1 + len(status)):
+            y = 6 + i * line_height
+            panel.blit(font_tiny.render(section, True, color), (8, y))
+            for right, text in zip((250, 310, 370), columns):
+                rendered = font_tiny.render(text, True, color)
+                panel.blit(rendered, (right - rendered.get_width(), y))
+        return panel
+
+
+def percentile(ordered, fraction):
+    """Get a percentile from an already sorted list"""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+# The one profiler the whole game reports to
+profiler = FrameProfiler()
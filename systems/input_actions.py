@@ -0,0 +1,180 @@
+"""
+DRAGON'S LAIR RPG - Input Actions Module
+========================================
+
+This module turns raw keyboard, mouse and touch events into game "actions".
+
+WHAT THIS FILE DOES:
+===================
+The game doesn't care whether you pressed UP or W - both mean "move up".
+InputMapper translates pygame events into ActionEvents such as "up",
+"confirm" or "map", and on top of that:
+- HELD-KEY REPEAT: holding a repeating action (the arrow keys) sends it
+  again after INPUT_REPEAT_DELAY frames, then every INPUT_REPEAT_INTERVAL
+  frames, so you can walk by holding a key
+- INPUT BUFFERING: a command that arrives while the game can't use it yet
+  (e.g. during the movement cooldown) can be buffered and is carried out as
+  soon as possible, instead of being lost. Buffered commands expire after
+  INPUT_BUFFER_FRAMES frames so a stale one doesn't fire much later
+- TOUCH: on Android, finger events go to TouchControls
+  (systems/touch_controls.py), which presses and releases actions directly
+- EVENT FILTERING: restrict_event_queue() tells pygame to only queue the
+  event types the game uses, so the queue isn't filled with mouse motion
+  and window events every frame
+
+States get the actions through their handle_action() hook
+(see core/game_state.py).
+
+FOR NOVICE CODERS:
+==================
+An ActionEvent is a small record:
+    ActionEvent("up", pressed=True, repeat=False, pos=None)
+`pressed` is False when the key is let go, `repeat` is True for the extra
+events sent while a key is held, and `pos` is the screen position for
+mouse (and touch) actions.
+"""
+
+from collections import namedtuple
+
+import pygame
+
+from config.constants import *
+
+# Actions
+UP = "up"
+DOWN = "down"
+LEFT = "left"
+RIGHT = "right"
+CONFIRM = "confirm"
+BACK = "back"
+TALK = "talk"
+MAP = "map"
+CLICK = "click"
+
+KEY_ACTIONS = {
+    pygame.K_UP: UP, pygame.K_w: UP,
+    pygame.K_DOWN: DOWN, pygame.K_s: DOWN,
+    pygame.K_LEFT: LEFT, pygame.K_a: LEFT,
+    pygame.K_RIGHT: RIGHT, pygame.K_d: RIGHT,
+    pygame.K_RETURN: CONFIRM,
+    pygame.K_ESCAPE: BACK,
+    pygame.K_SPACE: TALK,
+    pygame.K_m: MAP,
+}
+
+# Actions that repeat while held
+REPEATING_ACTIONS = {UP, DOWN, LEFT, RIGHT}
+
+# Movement actions as (dx, dy) grid steps
+MOVE_ACTIONS = {UP: (0, -1), DOWN: (0, 1), LEFT: (-1, 0), RIGHT: (1, 0)}
+
+# The only events the game reads from pygame's queue
+ALLOWED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+                  pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                  pygame.FINGERDOWN, pygame.FINGERMOTION, pygame.FINGERUP]
+FINGER_EVENTS = (pygame.FINGERDOWN, pygame.FINGERMOTION, pygame.FINGERUP)
+
+ActionEvent = namedtuple("ActionEvent", "action pressed repeat pos")
+
+
+def restrict_event_queue():
+    """Make pygame drop every event type the game doesn't use"""
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(ALLOWED_EVENTS)
+
+
+class InputMapper:
+    """
+    Turns each frame's pygame events into ActionEvents.
+
+    Attributes:
+        held: action -> frames it has been held (only actions from keys/buttons still down)
+        repeat_delay: Frames before a held action starts repeating
+        repeat_interval: Frames between repeats after that
+        touch: TouchControls for finger events (None: fingers are ignored)
+    """
+
+    def __init__(self, repeat_delay=INPUT_REPEAT_DELAY, repeat_interval=INPUT_REPEAT_INTERVAL,
+                 buffer_frames=INPUT_BUFFER_FRAMES):
+        self.repeat_delay = repeat_delay
+        self.repeat_interval = repeat_interval
+        self.buffer_frames = buffer_frames
+        self.held = {}
+        self.touch = None
+        self._held_keys = {}  # key -> action, so releasing W ends the "up" that W started
+        self._buffered = None
+        self._buffered_age = 0
+
+    def process(self, events):
+        """
+        Translate one frame of events. Call exactly once per frame (repeats are counted in frames).
+
+        Returns:
+            list: ActionEvents in the order they happened, then this frame's repeats
+        """
+        actions = []
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                action = KEY_ACTIONS.get(event.key)
+                if action:
+                    self._held_keys[event.key] = action
+                    self.held[action] = 0
+                    actions.append(ActionEvent(action, True, False, None))
+            elif event.type == pygame.KEYUP:
+                action = self._held_keys.pop(event.key, None)
+                if action and action not in self._held_keys.values():
+                    self.held.pop(action, None)
+                    actions.append(ActionEvent(action, False, False, None))
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                # Phones also send a mouse click for each tap; a tap on a touch button isn't a click
+                if self.touch and getattr(event, "touch", False) and self.touch.button_at(event.pos):
+                    continue
+                actions.append(ActionEvent(CLICK, True, False, event.pos))
+            elif event.type in FINGER_EVENTS and self.touch:
+                actions.extend(self.touch.process(event, self))
+        actions.extend(self.repeats())
+        self._age_buffer()
+        return actions
+
+    def press(self, action, pos=None):
+        """Start holding an action from something other than a key (touch controls)"""
+        self.held[action] = 0
+        return ActionEvent(action, True, False, pos)
+
+    def release(self, action, pos=None):
+        self.held.pop(action, None)
+        return ActionEvent(action, False, False, pos)
+
+    def repeats(self):
+        """Advance held actions by one frame and return the repeats that are due"""
+        due = []
+        for action, frames in self.held.items():
+            frames += 1
+            self.held[action] = frames
+            if action in REPEATING_ACTIONS and frames >= self.repeat_delay \
+                    and (frames - self.repeat_delay) % self.repeat_interval == 0:
+                due.append(ActionEvent(action, True, True, None))
+        return due
+
+    # ------------------------------------------------------------------
+    # Input buffering
+    # ------------------------------------------------------------------
+
+    def buffer(self, action_event):
+        """Keep a command that can't be used yet; a newer one replaces it"""
+        self._buffered = action_event
+        self._buffered_age = 0
+
+    def take_buffered(self):
+        """Get (and forget) the buffered command, or None"""
+        action_event, self._buffered = self._buffered, None
+        return action_event
+
+    def clear_buffer(self):
+        self._buffered = None
+
+    def _age_buffer(self):
+        if self._buffered is not None:
+            self._buffered_age += 1
+            if self._buffered_age > self.buffer_frames:
+                self._buffered = None
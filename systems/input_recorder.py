@@ -0,0 +1,507 @@
+"""
+DRAGON'S LAIR RPG - Input Recorder Module
+=========================================
+
+This module records everything the player does and plays it back later.
+
+WHAT THIS FILE DOES:
+===================
+Game.run() gets its input from an "input source" once per frame:
+- LiveInput reads the real keyboard and mouse (normal play)
+- InputRecorder does the same and also writes every frame to a file
+- ReplayInput feeds a recorded file back in, in real time or as fast as possible
+
+A recording holds:
+- The random seed the session started with (so enemy spawns, escape rolls
+  and particle effects come out exactly the same)
+- The mouse position and the key/mouse/finger events of every frame
+  (finger events drive the Android on-screen buttons)
+- A "state hash" every CHECKPOINT_INTERVAL frames and at the very end
+
+When a replay reaches a checkpoint it hashes its own game state and compares.
+A mismatch means the code now behaves differently from when the session was
+recorded - the first mismatching frame shows where to start looking.
+
+HOW TO USE IT:
+==============
+    python main.py --record session.dlr          (play normally, then quit)
+    python -m systems.input_recorder replay session.dlr             (headless, max speed)
+    python -m systems.input_recorder replay session.dlr --realtime  (watch it)
+    python -m systems.input_recorder info session.dlr
+
+A replay never touches the real save file. Sessions that press F9 (load)
+depend on the save file that existed at the time, so they can't be replayed
+exactly on another machine.
+
+FILE FORMAT:
+============
+    "DLRR" | version (1 byte) | varints: seed, fps, checkpoint interval
+    then records, each starting with a varint header = (value << 2) | tag:
+        TAG_FRAME       value = (event count << 1) | mouse moved
+                        [mouse dx, dy] then each event (code + its fields)
+        TAG_IDLE        value = number of frames with no input at all
+        TAG_CHECKPOINT  value = frame number, then a 16-byte state hash
+        TAG_END         value = total frames, then the final 16-byte state hash
+
+FOR NOVICE CODERS:
+==================
+A "varint" stores small numbers in fewer bytes: 7 bits per byte, and the top
+bit says "another byte follows". Most frames have no input at all, so long
+runs of them are stored as a single TAG_IDLE record - an hour of standing
+still takes only a few bytes.
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pygame
+
+from systems.render_target import render_target
+
+RECORDING_MAGIC = b"DLRR"
+RECORDING_VERSION = 2      # Version 2 added finger events
+RECORDING_FPS = 60         # The game runs at a fixed 60 frames per second
+CHECKPOINT_INTERVAL = 600  # Frames between state hashes (10 seconds at 60 FPS)
+HASH_SIZE = 16
+
+# Record tags (lowest 2 bits of a record header)
+TAG_FRAME = 0
+TAG_IDLE = 1
+TAG_CHECKPOINT = 2
+TAG_END = 3
+
+# Recorded event types (other pygame events aren't used by the game)
+EVENT_CODES = {
+    pygame.QUIT: 0,
+    pygame.KEYDOWN: 1,
+    pygame.KEYUP: 2,
+    pygame.MOUSEBUTTONDOWN: 3,
+    pygame.MOUSEBUTTONUP: 4,
+    pygame.FINGERDOWN: 5,
+    pygame.FINGERMOTION: 6,
+    pygame.FINGERUP: 7,
+}
+FINGER_EVENTS = (pygame.FINGERDOWN, pygame.FINGERMOTION, pygame.FINGERUP)
+FINGER_SCALE = 65535       # Finger positions (0.0 - 1.0) are stored as whole numbers
+EVENT_TYPES = {code: event_type for event_type, code in EVENT_CODES.items()}
+
+
+# ============================================================================
+# VARINTS
+# ============================================================================
+
+def write_varint(out, value):
+    """Append a non-negative whole number to a bytearray"""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, offset):
+    """Read a varint; returns (value, offset after it)"""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def zigzag(value):
+    """Map signed numbers to unsigned ones (0, -1, 1, -2, ... -> 0, 1, 2, 3, ...)"""
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def unzigzag(value):
+    return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+
+# ============================================================================
+# DETERMINISM HELPERS
+# ============================================================================
+
+def seed_random(seed):
+    """Seed every random number generator the game uses"""
+    random.seed(seed)
+    np.random.seed(seed & 0xFFFFFFFF)
+
+
+def state_hash(game):
+    """
+    Hash the gameplay state: screen, score, character, world, and the fight
+    in progress. Purely visual things (animations, particles) are left out.
+    """
+    from systems.save_system import take_snapshot
+    parts = [game.state, game.score, game.game_time]
+    if game.player:
+        parts.append(take_snapshot(game))
+    battle = game.battle_screen
+    if battle is not None:
+        combat = battle.combat
+        parts.append((combat.turn, combat.result, combat.turn_count, combat.player.health,
+                      combat.player.mana, combat.enemy.health))
+    return hashlib.blake2b(repr(parts).encode(), digest_size=HASH_SIZE).digest()
+
+
+# ============================================================================
+# INPUT SOURCES
+# ============================================================================
+
+class LiveInput:
+    """
+    Reads the real keyboard and mouse.
+
+    Attributes:
+        realtime: Whether the game loop should show frames and wait for the clock
+        deterministic: Whether the same input must give the same game (fixed quality preset)
+        frame: Number of frames polled so far
+    """
+    realtime = True
+    deterministic = False
+
+    def __init__(self):
+        self.frame = 0
+
+    def poll(self, game):
+        """
+        Get this frame's input.
+
+        Returns:
+            tuple: (mouse_pos, events), or None when there is no more input
+        """
+        self.frame += 1
+        # Positions in game pixels, whatever the window size (see systems/render_target.py)
+        events = [render_target.map_event(event) for event in pygame.event.get()]
+        return render_target.to_game_pos(pygame.mouse.get_pos()), events
+
+    def close(self, game):
+        """Called once when the game loop stops"""
+        pass
+
+
+class InputRecorder(LiveInput):
+    """
+    Reads the real keyboard and mouse and records every frame.
+
+    Create it BEFORE the Game: it seeds the random number generators, and the
+    Game uses them while it starts up.
+    """
+
+    deterministic = True
+
+    def __init__(self, path, seed=None, checkpoint_interval=CHECKPOINT_INTERVAL):
+        super().__init__()
+        self.path = path
+        self.seed = seed if seed is not None else int.from_bytes(os.urandom(8), "little")
+        self.checkpoint_interval = checkpoint_interval
+        self.data = bytearray(RECORDING_MAGIC)
+        self.data.append(RECORDING_VERSION)
+        for value in (self.seed, RECORDING_FPS, checkpoint_interval):
+            write_varint(self.data, value)
+        self._idle = 0
+        self._mouse = (0, 0)
+        seed_random(self.seed)
+
+    def poll(self, game):
+        if self.frame % self.checkpoint_interval == 0:
+            self._write_hash(TAG_CHECKPOINT, self.frame, state_hash(game))
+        mouse_pos, events = super().poll(game)
+        recorded = [event for event in events if event.type in EVENT_CODES]
+        moved = mouse_pos != self._mouse
+        if not recorded and not moved:
+            self._idle += 1
+        else:
+            self._flush_idle()
+            out = self.data
+            write_varint(out, (((len(recorded) << 1) | moved) << 2) | TAG_FRAME)
+            if moved:
+                write_varint(out, zigzag(mouse_pos[0] - self._mouse[0]))
+                write_varint(out, zigzag(mouse_pos[1] - self._mouse[1]))
+                self._mouse = mouse_pos
+            for event in recorded:
+                write_event(out, event)
+        return mouse_pos, events
+
+    def close(self, game):
+        """Finish the recording with the final state hash and write the file"""
+        from systems.save_system import write_save
+        try:
+            final = state_hash(game)
+        except Exception as e:  # The game crashed half-way; keep the input anyway
+            print(f"Could not hash the final game state: {e}")
+            final = bytes(HASH_SIZE)
+        self._write_hash(TAG_END, self.frame, final)
+        try:
+            write_save(self.path, bytes(self.data))
+            print(f"Recorded {self.frame} frames to {self.path} ({len(self.data)} bytes)")
+        except OSError as e:
+            print(f"Could not write recording {self.path}: {e}")
+
+    def _flush_idle(self):
+        if self._idle:
+            write_varint(self.data, (self._idle << 2) | TAG_IDLE)
+            self._idle = 0
+
+    def _write_hash(self, tag, frame, digest):
+        self._flush_idle()
+        write_varint(self.data, (frame << 2) | tag)
+        self.data += digest
+
+
+class ReplayInput(LiveInput):
+    """
+    Feeds a recording back into the game loop.
+
+    Create it BEFORE the Game (it seeds the random number generators with
+    the recorded seed).
+
+    Attributes:
+        mismatches: (frame, expected hash, actual hash) for every failed check
+        checks: Number of state hashes compared
+        finished: True once the whole recording was played
+    """
+
+    deterministic = True
+
+    def __init__(self, path, realtime=False, verify=True):
+        super().__init__()
+        with open(path, "rb") as f:
+            self.data = f.read()
+        if self.data[:4] != RECORDING_MAGIC:
+            raise ValueError(f"{path} is not a Dragon's Lair recording")
+        version = self.data[4]
+        if version > RECORDING_VERSION:
+            raise ValueError(f"recording version {version} is newer than this game ({RECORDING_VERSION})")
+        offset = 5
+        self.seed, offset = read_varint(self.data, offset)
+        self.fps, offset = read_varint(self.data, offset)
+        self.checkpoint_interval, offset = read_varint(self.data, offset)
+        self.offset = offset
+        self.realtime = realtime
+        self.verify = verify
+        self.mismatches = []
+        self.checks = 0
+        self.finished = False
+        self.total_frames = None
+        self.end_hash = None
+        self._idle = 0
+        self._mouse = (0, 0)
+        seed_random(self.seed)
+
+    def poll(self, game):
+        if self.realtime:
+            pygame.event.pump()  # Keep the window responsive; real input is ignored
+        if self._idle:
+            self._idle -= 1
+            self.frame += 1
+            return self._mouse, []
+        data = self.data
+        while True:
+            if self.offset >= len(data):  # Cut-off recording (the game crashed while recording)
+                self.finished = True
+                return None
+            header, self.offset = read_varint(data, self.offset)
+            tag, value = header & 3, header >> 2
+            if tag == TAG_IDLE:
+                self._idle = value - 1
+                self.frame += 1
+                return self._mouse, []
+            if tag == TAG_FRAME:
+                if value & 1:
+                    dx, self.offset = read_varint(data, self.offset)
+                    dy, self.offset = read_varint(data, self.offset)
+                    self._mouse = (self._mouse[0] + unzigzag(dx), self._mouse[1] + unzigzag(dy))
+                events = []
+                for _ in range(value >> 1):
+                    event, self.offset = read_event(data, self.offset)
+                    events.append(event)
+                self.frame += 1
+                return self._mouse, events
+            digest = data[self.offset:self.offset + HASH_SIZE]
+            self.offset += HASH_SIZE
+            if tag == TAG_CHECKPOINT:
+                self._check(value, digest, game)
+            else:  # TAG_END
+                self.total_frames = value
+                self.end_hash = digest
+                self.finished = True
+                return None
+
+    def close(self, game):
+        """Compare the final state (the game loop has stopped)"""
+        if not self.finished:
+            # The game quit by itself (a recorded QUIT); find the END record
+            offset = self.offset
+            while offset < len(self.data) and self.end_hash is None:
+                header, offset = read_varint(self.data, offset)
+                offset = self._record_end(header, offset)
+        if self.end_hash is None:
+            print("Recording has no final state hash (it was cut off)")
+            return
+        if self.frame != self.total_frames:
+            print(f"Replay stopped at frame {self.frame}, the recording has {self.total_frames}")
+        self._check(self.total_frames, self.end_hash, game)
+
+    def _record_end(self, header, offset):
+        """Skip over one record; remember it if it's the END record"""
+        tag, value = header & 3, header >> 2
+        if tag == TAG_END:
+            self.total_frames = value
+            self.end_hash = self.data[offset:offset + HASH_SIZE]
+        return skip_record(self.data, offset, header)
+
+    def _check(self, frame, expected, game):
+        if not self.verify:
+            return
+        self.checks += 1
+        actual = state_hash(game)
+        if actual != expected:
+            self.mismatches.append((frame, expected.hex(), actual.hex()))
+            if len(self.mismatches) == 1:
+                print(f"Replay diverged at frame {frame}")
+
+
+# ============================================================================
+# EVENTS
+# ============================================================================
+
+def write_event(out, event):
+    code = EVENT_CODES[event.type]
+    write_varint(out, code)
+    if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+        write_varint(out, event.key)
+        write_varint(out, getattr(event, "mod", 0))
+    elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        write_varint(out, event.button)
+        write_varint(out, zigzag(event.pos[0]))
+        write_varint(out, zigzag(event.pos[1]))
+    elif event.type in FINGER_EVENTS:
+        write_varint(out, zigzag(event.touch_id))  # SDL uses negative ids for some devices
+        write_varint(out, event.finger_id)
+        write_varint(out, round(min(max(event.x, 0.0), 1.0) * FINGER_SCALE))
+        write_varint(out, round(min(max(event.y, 0.0), 1.0) * FINGER_SCALE))
+
+
+def skip_record(data, offset, header):
+    """Get the offset after a record whose header was just read"""
+    tag, value = header & 3, header >> 2
+    if tag == TAG_FRAME:
+        if value & 1:
+            _, offset = read_varint(data, offset)
+            _, offset = read_varint(data, offset)
+        for _ in range(value >> 1):
+            _, offset = read_event(data, offset)
+    elif tag in (TAG_CHECKPOINT, TAG_END):
+        offset += HASH_SIZE
+    return offset
+
+
+def read_event(data, offset):
+    code, offset = read_varint(data, offset)
+    event_type = EVENT_TYPES[code]
+    if event_type in (pygame.KEYDOWN, pygame.KEYUP):
+        key, offset = read_varint(data, offset)
+        mod, offset = read_varint(data, offset)
+        return pygame.event.Event(event_type, key=key, mod=mod), offset
+    if event_type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        button, offset = read_varint(data, offset)
+        x, offset = read_varint(data, offset)
+        y, offset = read_varint(data, offset)
+        return pygame.event.Event(event_type, button=button, pos=(unzigzag(x), unzigzag(y))), offset
+    if event_type in FINGER_EVENTS:
+        touch_id, offset = read_varint(data, offset)
+        finger_id, offset = read_varint(data, offset)
+        x, offset = read_varint(data, offset)
+        y, offset = read_varint(data, offset)
+        return pygame.event.Event(event_type, touch_id=unzigzag(touch_id), finger_id=finger_id,
+                                  x=x / FINGER_SCALE, y=y / FINGER_SCALE), offset
+    return pygame.event.Event(event_type), offset
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def replay(path, realtime=False, verify=True):
+    """
+    Play a recording through the real game loop.
+
+    Returns:
+        ReplayInput: The finished replay (check .mismatches)
+    """
+    if not realtime:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    source = ReplayInput(path, realtime=realtime, verify=verify)
+    from core.game import Game
+    game = Game()
+    with tempfile.TemporaryDirectory() as folder:
+        # Quitting saves the game; keep that away from the real save file
+        game.autosaver.path = os.path.join(folder, "replay.dls")
+        start = time.perf_counter()
+        try:
+            game.play(source)
+        finally:
+            source.close(game)
+            game.autosaver.close()
+        elapsed = time.perf_counter() - start
+    print(f"Replayed {source.frame} frames in {elapsed:.2f} s ({source.frame / max(elapsed, 1e-9):.0f} frames/s)")
+    if verify:
+        if source.mismatches:
+            print(f"State hash MISMATCH at {len(source.mismatches)} of {source.checks} checks "
+                  f"(first at frame {source.mismatches[0][0]})")
+        else:
+            print(f"State hashes match ({source.checks} checks)")
+    return source
+
+
+def print_info(path):
+    source = ReplayInput(path, verify=False)
+    data = source.data
+    frames = events = checkpoints = 0
+    offset = source.offset
+    while offset < len(data):
+        header, offset = read_varint(data, offset)
+        tag, value = header & 3, header >> 2
+        if tag == TAG_IDLE:
+            frames += value
+        elif tag == TAG_FRAME:
+            frames += 1
+            events += value >> 1
+        elif tag == TAG_CHECKPOINT:
+            checkpoints += 1
+        offset = skip_record(data, offset, header)
+    seconds = frames / max(source.fps, 1)
+    print(f"{path}: {len(data)} bytes, seed {source.seed}")
+    print(f"  {frames} frames ({seconds:.1f} s at {source.fps} FPS), {events} events, {checkpoints} checkpoints")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dragon's Lair RPG input recordings")
+    commands = parser.add_subparsers(dest="command", required=True)
+    replay_parser = commands.add_parser("replay", help="play a recording through the game")
+    replay_parser.add_argument("path")
+    replay_parser.add_argument("--realtime", action="store_true", help="show the game at normal speed")
+    replay_parser.add_argument("--no-verify", action="store_true", help="skip the state hash checks")
+    info_parser = commands.add_parser("info", help="show what's in a recording")
+    info_parser.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "replay":
+        result = replay(args.path, realtime=args.realtime, verify=not args.no_verify)
+        return 1 if result.mismatches else 0
+    print_info(args.path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,405 @@
+"""
+DRAGON'S LAIR RPG - Memory Monitor Module
+=========================================
+
+This module finds out where the game's memory goes and whether it keeps growing.
+
+WHAT THIS FILE DOES:
+===================
+While the monitor is switched on, Python's tracemalloc remembers where every
+allocation was made. Each time the game state changes (start_menu ->
+overworld -> battle -> ...) the monitor writes a report with:
+- How much memory Python has allocated (now and at the peak)
+- The files ("subsystems") that allocated the most, with their biggest lines
+- Which lines grew the most since the previous report
+- How many Particles, Enemies, Items, Surfaces and audio buffers (Sounds) are
+  alive, plus ParticleSystems, BattleLogs and BattleScreens
+
+Every time a battle ends the numbers are also written down per battle, so
+growth across repeated battles (the classic leak) is easy to see.
+
+HOW TO USE IT:
+==============
+In the game: F6 starts/stops the monitor and shows its overlay, F7 writes all
+reports to the MEMORY_DUMP_DIR folder (a readable .txt and a .json).
+
+Without a window, fighting the same battle again and again:
+    python -m systems.memory_monitor battles --count 20
+
+FOR NOVICE CODERS:
+==================
+Python frees an object once nothing refers to it any more. A "leak" in Python
+means something still refers to objects we are done with - for example a list
+that only ever grows. If "Particles" or "BattleScreens" keep going up after
+every battle, something is holding on to them.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import pygame
+from config.constants import *
+from audio.audio_format import get_sound_nbytes
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TRACE_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),  # The monitor's own reports
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def subsystem_name(filename):
+    """Name the part of the game a source file belongs to (e.g. 'ui/battle_log.py')"""
+    path = os.path.abspath(filename)
+    if path.startswith(REPO_ROOT + os.sep):
+        return os.path.relpath(path, REPO_ROOT).replace(os.sep, "/")
+    if os.sep + "pygame" + os.sep in path:
+        return "pygame"
+    return "python"
+
+
+def line_name(frame):
+    """'ui/battle_log.py:29' for game files, 'json/encoder.py:70'-style short names otherwise"""
+    subsystem = subsystem_name(frame.filename)
+    if subsystem in ("pygame", "python"):
+        subsystem = "/".join(frame.filename.replace(os.sep, "/").split("/")[-2:])
+    return f"{subsystem}:{frame.lineno}"
+
+
+def count_live_objects():
+    """
+    Count the game objects that are still alive (after a garbage collection).
+
+    Surfaces and Sounds are not tracked by the garbage collector themselves,
+    so they are found through the objects that refer to them.
+
+    Returns:
+        dict: Counts per kind, plus surface_kb and audio_kb
+    """
+    from systems.particle_system import Particle, ParticleSystem
+    from entities.enemy import Enemy
+    from entities.item import Item
+    from ui.battle_log import BattleLog
+    from ui.battle_screen import BattleScreen
+
+    def with_subclasses(cls):
+        classes = [cls]
+        for sub in cls.__subclasses__():
+            classes.extend(with_subclasses(sub))
+        return classes
+
+    kinds = {}
+    for name, cls in (("Particles", Particle), ("Enemies", Enemy), ("Items", Item),
+                      ("ParticleSystems", ParticleSystem), ("BattleLogs", BattleLog),
+                      ("BattleScreens", BattleScreen)):
+        for sub in with_subclasses(cls):
+            kinds[sub] = name
+    counts = dict.fromkeys(kinds.values(), 0)
+
+    gc.collect()
+    objects = gc.get_objects()
+    for obj in objects:
+        name = kinds.get(type(obj))
+        if name:
+            counts[name] += 1
+
+    referents = gc.get_referents(*objects)
+    # Dicts and lists holding only Surfaces/Sounds aren't tracked either: look inside them too
+    referents += gc.get_referents(*[ref for ref in referents
+                                    if type(ref) in (dict, list, tuple) and not gc.is_tracked(ref)])
+    surfaces, sounds = {}, {}
+    for ref in referents:
+        if isinstance(ref, pygame.Surface):
+            surfaces[id(ref)] = ref
+        elif isinstance(ref, pygame.mixer.Sound):
+            sounds[id(ref)] = ref
+    del objects, referents
+    counts["Surfaces"] = len(surfaces)
+    counts["Sounds"] = len(sounds)
+    counts["surface_kb"] = sum(s.get_bytesize() * s.get_width() * s.get_height() for s in surfaces.values()) / 1024
+    counts["audio_kb"] = sum(get_sound_nbytes(s) for s in sounds.values()) / 1024
+    return counts
+
+
+class MemoryMonitor:
+    """
+    Takes tracemalloc snapshots on game state changes and keeps the reports.
+
+    Attributes:
+        enabled: Whether allocations are being traced
+        show_hud: Whether the overlay is drawn
+        reports: One report (dict) per state change, oldest first
+        battles: Memory numbers written down at the end of every battle
+    """
+
+    def __init__(self, max_reports=MEMORY_MAX_REPORTS):
+        self.enabled = False
+        self.show_hud = False
+        self.reports = []
+        self.max_reports = max_reports
+        self.battles = []
+        self._previous_snapshot = None
+        self._started = time.perf_counter()
+        self._hud_surface = None
+
+    def toggle(self):
+        """Start or stop tracing (the overlay follows)"""
+        if self.enabled:
+            self.stop()
+        else:
+            self.start()
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(MEMORY_TRACE_FRAMES)
+        self.enabled = self.show_hud = True
+        self._started = time.perf_counter()
+        print("Memory monitor on")
+        self.take_report(None, "monitor started")
+
+    def stop(self):
+        self.enabled = self.show_hud = False
+        self._previous_snapshot = None
+        self._hud_surface = None
+        tracemalloc.stop()
+        print("Memory monitor off")
+
+    def state_changed(self, old_state, new_state):
+        """Call whenever the game state changes (does nothing while switched off)"""
+        if not self.enabled:
+            return
+        report = self.take_report(old_state, new_state)
+        if old_state == "battle" and new_state != "battle":
+            self.battles.append({"battle": len(self.battles) + 1,
+                                 "traced_kb": report["traced_kb"],
+                                 "counts": report["counts"]})
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+    def take_report(self, old_state, new_state):
+        """Snapshot the memory now and add a report"""
+        counts = count_live_objects()
+        snapshot = tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+        current, peak = tracemalloc.get_traced_memory()
+
+        # Group the biggest lines by the file that allocated them
+        subsystems = {}
+        for stat in snapshot.statistics("lineno"):
+            frame = stat.traceback[0]
+            entry = subsystems.setdefault(subsystem_name(frame.filename),
+                                          {"kb": 0.0, "blocks": 0, "lines": []})
+            entry["kb"] += stat.size / 1024
+            entry["blocks"] += stat.count
+            if len(entry["lines"]) < MEMORY_TOP_LINES:
+                entry["lines"].append({"line": line_name(frame), "kb": stat.size / 1024})
+        top = sorted(subsystems.items(), key=lambda item: item[1]["kb"], reverse=True)[:MEMORY_TOP_SUBSYSTEMS]
+
+        growth = []
+        if self._previous_snapshot is not None:
+            for stat in snapshot.compare_to(self._previous_snapshot, "lineno")[:MEMORY_TOP_LINES * 2]:
+                if stat.size_diff <= 0:
+                    break
+                frame = stat.traceback[0]
+                growth.append({"line": line_name(frame), "kb": stat.size_diff / 1024})
+        self._previous_snapshot = snapshot
+
+        report = {
+            "seconds": round(time.perf_counter() - self._started, 2),
+            "from": old_state,
+            "to": new_state,
+            "traced_kb": current / 1024,
+            "peak_kb": peak / 1024,
+            "counts": counts,
+            "subsystems": [dict(name=name, **entry) for name, entry in top],
+            "growth": growth,
+        }
+        self.reports.append(report)
+        del self.reports[:-self.max_reports]
+        self._hud_surface = None
+        return report
+
+    def battle_growth(self):
+        """
+        How much memory and how many objects each battle leaves behind.
+
+        Returns:
+            dict: Average change per battle between the first and last battle
+                  (None before two battles have finished)
+        """
+        if len(self.battles) < 2:
+            return None
+        first, last = self.battles[0], self.battles[-1]
+        battles = last["battle"] - first["battle"]
+        per_battle = {name: (last["counts"][name] - first["counts"][name]) / battles
+                      for name in last["counts"]}
+        per_battle["traced_kb"] = (last["traced_kb"] - first["traced_kb"]) / battles
+        return {"battles": len(self.battles), "per_battle": per_battle}
+
+    def format_text(self):
+        """All reports as readable text"""
+        lines = []
+        for report in self.reports:
+            counts = report["counts"]
+            lines.append(f"[{report['seconds']:8.2f}s] {report['from']} -> {report['to']}: "
+                         f"traced {report['traced_kb']:.0f} KB (peak {report['peak_kb']:.0f} KB)")
+            lines.append("  live: " + ", ".join(f"{name} {counts[name]}" for name in counts
+                                                if not name.endswith("_kb"))
+                         + f" | surfaces {counts['surface_kb']:.0f} KB, audio {counts['audio_kb']:.0f} KB")
+            for subsystem in report["subsystems"]:
+                top_lines = ", ".join(f"{line['line']} {line['kb']:.1f} KB" for line in subsystem["lines"])
+                lines.append(f"  {subsystem['name']:<40} {subsystem['kb']:9.1f} KB  ({top_lines})")
+            for line in report["growth"]:
+                lines.append(f"  grew: {line['line']} +{line['kb']:.1f} KB")
+        growth = self.battle_growth()
+        if growth:
+            lines.append(f"Per battle over {growth['battles']} battles:")
+            lines.append("  " + ", ".join(f"{name} {value:+.1f}" for name, value in growth["per_battle"].items()))
+        return "\n".join(lines)
+
+    def dump(self, folder=MEMORY_DUMP_DIR):
+        """
+        Write every report to a text file and a JSON file.
+
+        Returns:
+            tuple: (text path, json path), or None if nothing could be written
+        """
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        text_path = os.path.join(folder, f"memory_{stamp}.txt")
+        json_path = os.path.join(folder, f"memory_{stamp}.json")
+        try:
+            os.makedirs(folder, exist_ok=True)
+            with open(text_path, "w") as f:
+                f.write(self.format_text() + "\n")
+            with open(json_path, "w") as f:
+                json.dump({"reports": self.reports, "battles": self.battles,
+                           "battle_growth": self.battle_growth()}, f, indent=1)
+        except OSError as e:
+            print(f"Could not write memory report: {e}")
+            return None
+        print(f"Memory report written to {text_path} and {json_path}")
+        return text_path, json_path
+
+    # ------------------------------------------------------------------
+    # Overlay
+    # ------------------------------------------------------------------
+    def draw(self, surface):
+        """Draw the overlay (re-rendered only when a new report arrives)"""
+        if not self.show_hud or not self.reports:
+            return
+        if self._hud_surface is None:
+            self._hud_surface = self._render_hud()
+        surface.blit(self._hud_surface, (10, surface.get_height() - self._hud_surface.get_height() - 10))
+
+    def _render_hud(self):
+        report = self.reports[-1]
+        counts = report["counts"]
+        lines = [
+            (f"MEMORY  {report['from']} -> {report['to']}  (F7: dump)", TEXT_COLOR),
+            (f"traced {report['traced_kb'] / 1024:.1f} MB   peak {report['peak_kb'] / 1024:.1f} MB", TEXT_COLOR),
+            (f"Particles {counts['Particles']}   Enemies {counts['Enemies']}   Items {counts['Items']}", (220, 220, 220)),
+            (f"Surfaces {counts['Surfaces']} ({counts['surface_kb'] / 1024:.1f} MB)   "
+             f"Sounds {counts['Sounds']} ({counts['audio_kb'] / 1024:.1f} MB)", (220, 220, 220)),
+            (f"ParticleSystems {counts['ParticleSystems']}   BattleLogs {counts['BattleLogs']}   "
+             f"BattleScreens {counts['BattleScreens']}", (220, 220, 220)),
+        ]
+        growth = self.battle_growth()
+        if growth:
+            per_battle = growth["per_battle"]
+            lines.append((f"per battle ({growth['battles']}): {per_battle['traced_kb']:+.1f} KB, "
+                          f"Particles {per_battle['Particles']:+.1f}, "
+                          f"BattleScreens {per_battle['BattleScreens']:+.1f}", ITEM_COLOR))
+        for subsystem in report["subsystems"]:
+            lines.append((f"{subsystem['name']}  {subsystem['kb']:.0f} KB", (180, 180, 200)))
+
+        rendered = [font_tiny.render(text, True, color) for text, color in lines]
+        line_height = font_tiny.get_linesize()
+        width = max(line.get_width() for line in rendered) + 16
+        panel = pygame.Surface((width, len(rendered) * line_height + 12), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        pygame.draw.rect(panel, UI_BORDER, panel.get_rect(), 1)
+        for i, line in enumerate(rendered):
+            panel.blit(line, (8, 6 + i * line_height))
+        return panel
+
+
+# The one memory monitor the whole game reports to
+memory_monitor = MemoryMonitor()
+
+
+# ============================================================================
+# REPEATED BATTLES (headless)
+# ============================================================================
+
+class BattleLoopInput:
+    """
+    Input source that starts a battle, fights it with plain attacks, and
+    starts the next one as soon as the player is back in the overworld.
+    """
+    realtime = False
+
+    def __init__(self, battles, max_frames):
+        self.battles = battles
+        self.max_frames = max_frames
+        self.frame = 0
+
+    def poll(self, game):
+        from entities.enemy import Enemy
+        self.frame += 1
+        if len(memory_monitor.battles) >= self.battles or self.frame > self.max_frames:
+            return None
+        if game.state == "overworld":
+            game.start_battle(Enemy(game.player.level))
+            return (0, 0), []
+        if game.state == "battle" and game.battle_screen:
+            game.battle_screen.selected_option = 0  # Attack
+            return (0, 0), [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, mod=0)]
+        return (0, 0), []
+
+    def close(self, game):
+        pass
+
+
+def run_battles(count, max_frames=200000):
+    """Fight `count` battles without a window and print the memory reports"""
+    from systems.scenario_bench import boot_game, enter_area
+    game = boot_game()
+    enter_area(game, "Warrior", 1, 1)
+    game.player.health = game.player.max_health = 10 ** 6  # Never lose (the game over screen ends the run)
+    memory_monitor.start()
+    started = time.perf_counter()
+    game.play(BattleLoopInput(count, max_frames))
+    print(memory_monitor.format_text())
+    print(f"{len(memory_monitor.battles)} battles in {time.perf_counter() - started:.1f} s")
+    return memory_monitor
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dragon's Lair RPG memory monitor")
+    commands = parser.add_subparsers(dest="command", required=True)
+    battles_parser = commands.add_parser("battles", help="fight battles headless and report memory growth")
+    battles_parser.add_argument("--count", type=int, default=10, help="battles to fight (default: 10)")
+    battles_parser.add_argument("--dump", action="store_true", help=f"also write the reports to {MEMORY_DUMP_DIR}/")
+    args = parser.parse_args(argv)
+
+    if args.command == "battles":
+        monitor = run_battles(args.count)
+        if args.dump:
+            monitor.dump()
+    return 0
+
+
+if __name__ == "__main__":
+    # "python -m" runs this file as __main__, a second copy of the module with its
+    # own memory_monitor. Game reports to the one in systems.memory_monitor, so run
+    # main() from there
+    import systems.memory_monitor
+    sys.exit(systems.memory_monitor.main(sys.argv[1:]))
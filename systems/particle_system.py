@@ -9,6 +9,7 @@ import pygame
 import random
 import math
 from config.constants import *
+from systems.quality_governor import quality
 
 class Particle:
     """
@@ -52,8 +53,8 @@ class ParticleSystem:
         self.particles.append(Particle(x, y, color, velocity, size, lifetime))
         
     def add_explosion(self, x, y, color, count=20, size_range=(2, 5), speed_range=(1, 3), lifetime_range=(20, 40)):
-        """Create an explosion effect with multiple particles"""
-        for _ in range(count):
+        """Create an explosion effect with multiple particles (fewer at lower quality settings)"""
+        for _ in range(quality.particle_count(count)):
             angle = random.uniform(0, math.pi*2)
             speed = random.uniform(*speed_range)
             velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
@@ -71,7 +72,7 @@ class ParticleSystem:
         for i in range(steps):
             px = x1 + (dx * i/steps)
             py = y1 + (dy * i/steps)
-            for _ in range(particle_count):
+            for _ in range(quality.particle_count(particle_count)):
                 angle = random.uniform(0, math.pi*2)
                 velocity = (math.cos(angle) * 0.2, math.sin(angle) * 0.2)
                 self.add_particle(px, py, color, velocity, width, 15)
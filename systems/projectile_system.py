@@ -0,0 +1,220 @@
+"""
+DRAGON'S LAIR RPG - Projectile System Module
+============================================
+
+This module contains the pool of projectiles (fireballs, knives, ...) used in battle.
+
+WHAT THIS FILE DOES:
+===================
+Every projectile type is described once in PROJECTILE_TYPES:
+- How fast it flies and whether it homes in on its target
+- How long it flies before it hits (in frames)
+- How it looks (sprite, size, colors, spin)
+- Particle effects for launching, its trail, and its impact
+
+ProjectilePool keeps all projectiles in preallocated numpy arrays, so moving
+them is a handful of array operations no matter how many are flying. Spells
+that throw several projectiles at once, or at several targets, just call
+spawn() more than once.
+
+FOR NOVICE CODERS:
+==================
+A "pool" is a fixed number of slots made when the battle starts. Launching a
+projectile fills a free slot; when it hits, the slot is freed again. Nothing
+new is created or thrown away during the fight.
+"""
+
+import math
+import random
+import numpy as np
+from config.constants import *
+
+# Projectile definitions
+# ======================
+# launch/trail/impact describe particle effects:
+# - launch: burst around the start point (moving outwards)
+# - trail: particles left behind every frame
+# - impact: explosion when it hits (passed to ParticleSystem.add_explosion)
+# A missing "color" in an effect means "use the projectile's own color".
+PROJECTILE_TYPES = {
+    "fireball": {
+        "sprite": "orb",
+        "speed": 56,
+        "size": 12,
+        "homing": True,
+        "lifetime": 48,  # 0.8 seconds at 60 FPS
+        "spin": 0,
+        "colors": FIRE_COLORS,
+        "launch": {"count": 10, "spread": 8, "speed": 0.3, "size": 2, "lifetime": 20},
+        "trail": {"count": 2, "spread": 6, "speed": 0.5, "size": 2, "lifetime": 15},
+        "impact": {"count": 30, "size_range": (3, 8), "speed_range": (2, 6), "lifetime_range": (20, 35)},
+    },
+    "knife": {
+        "sprite": "knife",
+        "speed": 48,
+        "size": 16,
+        "homing": True,
+        "lifetime": 36,  # 0.6 seconds at 60 FPS
+        "spin": 60,      # Degrees per frame
+        "colors": [(100, 100, 100)],  # Steel gray
+        "launch": {"count": 8, "spread": 6, "speed": 0.4, "size": 1, "lifetime": 15, "color": (150, 150, 150)},
+        "trail": {"count": 1, "spread": 4, "speed": 0.3, "size": 1, "lifetime": 10, "color": (120, 120, 120)},
+        "impact": {"count": 20, "size_range": (2, 6), "speed_range": (1, 4), "lifetime_range": (15, 25),
+                   "color": (80, 80, 80)},
+    },
+}
+
+PROJECTILE_POOL_SIZE = 32
+
+
+class ProjectilePool:
+    """
+    Fixed-size pool of projectiles with array-based movement.
+
+    Attributes:
+        x, y: Positions (numpy float arrays, one entry per slot)
+        rotation: Sprite rotation in degrees
+        active: Which slots are in use
+    """
+
+    def __init__(self, particle_system=None, capacity=PROJECTILE_POOL_SIZE, types=PROJECTILE_TYPES):
+        self.particle_system = particle_system
+        self.capacity = capacity
+        self.type_names = list(types)
+        self.types = [types[name] for name in self.type_names]
+
+        # Per-type numbers as arrays so they can be looked up for all slots at once
+        self.type_speed = np.array([t["speed"] for t in self.types], dtype=float)
+        self.type_spin = np.array([t.get("spin", 0) for t in self.types], dtype=float)
+        self.type_homing = np.array([t.get("homing", False) for t in self.types], dtype=bool)
+
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.target_x = np.zeros(capacity)
+        self.target_y = np.zeros(capacity)
+        self.rotation = np.zeros(capacity)
+        self.age = np.zeros(capacity, dtype=int)
+        self.lifetime = np.zeros(capacity, dtype=int)
+        self.kind = np.zeros(capacity, dtype=int)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.colors = [None] * capacity
+        self.on_impact = [None] * capacity
+
+    def spawn(self, type_name, x, y, target_x, target_y, color=None, on_impact=None):
+        """
+        Launch a projectile.
+
+        Args:
+            type_name: Key in PROJECTILE_TYPES
+            x, y: Start position
+            target_x, target_y: Where it flies to
+            color: Optional color (default: a random one from the type's colors)
+            on_impact: Optional function(slot) called when it hits
+
+        Returns:
+            int: The slot used, or None if the pool is full
+        """
+        free = np.flatnonzero(~self.active)
+        if not len(free):
+            print(f"Projectile pool full, {type_name} not launched")
+            return None
+        slot = int(free[0])
+        kind = self.type_names.index(type_name)
+        definition = self.types[kind]
+        self.kind[slot] = kind
+        self.x[slot], self.y[slot] = x, y
+        self.target_x[slot], self.target_y[slot] = target_x, target_y
+        dx, dy = target_x - x, target_y - y
+        distance = math.hypot(dx, dy) or 1
+        self.vx[slot] = dx / distance * definition["speed"]
+        self.vy[slot] = dy / distance * definition["speed"]
+        self.rotation[slot] = 0
+        self.age[slot] = 0
+        self.lifetime[slot] = definition["lifetime"]
+        self.colors[slot] = color or random.choice(definition["colors"])
+        self.on_impact[slot] = on_impact
+        self.active[slot] = True
+        self._emit(slot, definition.get("launch"), outwards=True)
+        return slot
+
+    def retarget(self, slot, target_x, target_y):
+        """Change where a (homing) projectile is flying to"""
+        self.target_x[slot], self.target_y[slot] = target_x, target_y
+
+    def update(self):
+        """Move every projectile one frame, add trails, and handle impacts"""
+        active = self.active
+        if not active.any():
+            return
+        speed = self.type_speed[self.kind]
+
+        # Homing projectiles steer towards their target and stop on it
+        dx = self.target_x - self.x
+        dy = self.target_y - self.y
+        distance = np.hypot(dx, dy)
+        step = np.minimum(speed, distance) / np.maximum(distance, 1e-9)
+        homing = active & self.type_homing[self.kind]
+        straight = active & ~self.type_homing[self.kind]
+        self.x += np.where(homing, dx * step, np.where(straight, self.vx, 0))
+        self.y += np.where(homing, dy * step, np.where(straight, self.vy, 0))
+        self.rotation[active] += self.type_spin[self.kind[active]]
+        self.age[active] += 1
+
+        for slot in np.flatnonzero(active):
+            self._emit(slot, self.types[self.kind[slot]].get("trail"))
+
+        for slot in np.flatnonzero(active & (self.age >= self.lifetime)):
+            self.impact(slot)
+
+    def impact(self, slot):
+        """Make a projectile hit now: impact effect, callback, and free its slot"""
+        if not self.active[slot]:
+            return
+        self.active[slot] = False
+        effect = self.types[self.kind[slot]].get("impact")
+        if effect and self.particle_system:
+            self.particle_system.add_explosion(
+                self.target_x[slot], self.target_y[slot], effect.get("color", self.colors[slot]),
+                count=effect["count"], size_range=effect["size_range"],
+                speed_range=effect["speed_range"], lifetime_range=effect["lifetime_range"])
+        callback = self.on_impact[slot]
+        self.on_impact[slot] = None
+        if callback:
+            callback(int(slot))
+
+    def finish_all(self):
+        """Make every projectile in flight hit right away"""
+        for slot in np.flatnonzero(self.active):
+            self.impact(slot)
+
+    def clear(self):
+        """Remove every projectile without any impact effects"""
+        self.active[:] = False
+        self.on_impact = [None] * self.capacity
+
+    def active_slots(self):
+        """Get the slots of all projectiles in flight"""
+        return np.flatnonzero(self.active)
+
+    def get_type(self, slot):
+        """Get the definition of the projectile in a slot"""
+        return self.types[self.kind[slot]]
+
+    def _emit(self, slot, effect, outwards=False):
+        """Add launch or trail particles around a projectile"""
+        if not effect or not self.particle_system:
+            return
+        color = effect.get("color", self.colors[slot])
+        for _ in range(effect["count"]):
+            angle = random.uniform(0, math.pi * 2)
+            dist = random.uniform(0, effect["spread"])
+            px = self.x[slot] + math.cos(angle) * dist
+            py = self.y[slot] + math.sin(angle) * dist
+            if outwards:
+                velocity = (math.cos(angle) * effect["speed"], math.sin(angle) * effect["speed"])
+            else:
+                velocity = (random.uniform(-effect["speed"], effect["speed"]),
+                            random.uniform(-effect["speed"], effect["speed"]))
+            self.particle_system.add_particle(px, py, color, velocity, effect["size"], effect["lifetime"])
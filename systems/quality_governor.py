@@ -0,0 +1,134 @@
+"""
+DRAGON'S LAIR RPG - Quality Governor Module
+===========================================
+
+This module turns visual effects down when a device can't keep up, and back
+up when it can.
+
+WHAT THIS FILE DOES:
+===================
+Each frame Game tells the governor how long its work took (update + draw,
+not the time spent waiting for the next frame). While the average over the
+last QUALITY_WINDOW frames is over QUALITY_FRAME_BUDGET_MS, it steps down
+one quality level; once frames have stayed well under budget
+(QUALITY_UP_HEADROOM) for QUALITY_UP_FRAMES frames, it steps back up.
+The gap between the two thresholds (hysteresis), and the fresh window
+needed after every change, stop it flickering between two levels.
+
+Each level sets these "knobs", which the game reads where it draws:
+- particles:   share of particles spawned by area emitters, town effects,
+               add_explosion and add_beam (1.0 = all of them)
+- grass:       share of grass tufts drawn in town (used when an area is
+               pre-rendered, so it affects areas rendered after a change)
+- stars:       how many of the 150 background stars move and are drawn
+- dragons:     how many of the 5 background dragons fly
+- button_glow: the soft glow around hovered buttons
+- boss_aura:   the pulsing aura around the final dragon boss
+
+F8 locks a fixed preset (high -> medium -> low -> minimal -> automatic).
+The current level is shown on the frame profiler's overlay (F3).
+
+Recordings, replays and benchmarks always run at a fixed preset (the locked
+one, otherwise "high"): particle counts change how many random numbers are
+used, and the same input has to give the same game every time.
+
+FOR NOVICE CODERS:
+==================
+It's like a car's cruise control: it doesn't switch the engine off when
+going uphill, it just eases off a little, then speeds back up on the flat.
+"""
+
+from collections import deque
+
+from config.constants import *
+from systems.frame_profiler import profiler
+
+# Best first; the governor moves one step at a time along this list
+QUALITY_LEVELS = ["high", "medium", "low", "minimal"]
+QUALITY_PRESETS = {
+    "high":    {"particles": 1.0,  "grass": 1.0,  "stars": 150, "dragons": 5, "button_glow": True,  "boss_aura": True},
+    "medium":  {"particles": 0.6,  "grass": 0.6,  "stars": 90,  "dragons": 3, "button_glow": True,  "boss_aura": True},
+    "low":     {"particles": 0.35, "grass": 0.35, "stars": 50,  "dragons": 1, "button_glow": False, "boss_aura": False},
+    "minimal": {"particles": 0.15, "grass": 0.15, "stars": 20,  "dragons": 0, "button_glow": False, "boss_aura": False},
+}
+
+
+class QualityGovernor:
+    """
+    Picks a quality level from recent frame times.
+
+    Attributes:
+        level: Name of the current level
+        locked: Preset chosen by the player (None: automatic)
+        adaptive: Whether the input source allows automatic changes (False for replays)
+        changes: Automatic level changes so far
+    """
+
+    def __init__(self, preset=QUALITY_PRESET, budget_ms=QUALITY_FRAME_BUDGET_MS):
+        if preset != "auto" and preset not in QUALITY_PRESETS:
+            raise ValueError(f"Unknown quality preset: {preset}")
+        self.budget_ms = budget_ms
+        self.locked = None if preset == "auto" else preset
+        self.adaptive = True
+        self.changes = 0
+        self.frame_times = deque(maxlen=QUALITY_WINDOW)
+        self.frames_at_level = 0
+        self._set_level(self.locked or QUALITY_LEVELS[0])
+
+    def _set_level(self, level):
+        self.level = level
+        for knob, value in QUALITY_PRESETS[level].items():
+            setattr(self, knob, value)
+        self.frame_times.clear()
+        self.frames_at_level = 0
+        profiler.status["quality"] = f"{level} ({'locked' if self.locked else 'auto'})"
+
+    def record(self, ms):
+        """Add one frame's work time (ms) and change level if needed"""
+        if self.locked or not self.adaptive:
+            return
+        self.frame_times.append(ms)
+        self.frames_at_level += 1
+        if len(self.frame_times) < QUALITY_WINDOW:
+            return
+        average = sum(self.frame_times) / len(self.frame_times)
+        index = QUALITY_LEVELS.index(self.level)
+        if average > self.budget_ms and index < len(QUALITY_LEVELS) - 1:
+            self.step(index + 1, average)
+        elif (average < self.budget_ms * QUALITY_UP_HEADROOM and index > 0
+              and self.frames_at_level >= QUALITY_UP_FRAMES):
+            self.step(index - 1, average)
+
+    def step(self, index, average):
+        self.changes += 1
+        print(f"Quality {self.level} -> {QUALITY_LEVELS[index]} (frames averaged {average:.1f} ms)")
+        self._set_level(QUALITY_LEVELS[index])
+
+    def lock(self, preset):
+        """Use a fixed preset (None: go back to automatic, starting from the best level)"""
+        if preset is not None and preset not in QUALITY_PRESETS:
+            raise ValueError(f"Unknown quality preset: {preset}")
+        self.locked = preset
+        self._set_level(preset or QUALITY_LEVELS[0])
+
+    def cycle_lock(self):
+        """F8: automatic -> high -> medium -> low -> minimal -> automatic"""
+        order = [None] + QUALITY_LEVELS
+        self.lock(order[(order.index(self.locked) + 1) % len(order)])
+        print(f"Quality: {self.level} ({'locked' if self.locked else 'auto'})")
+
+    def set_adaptive(self, adaptive):
+        """Allow automatic changes; without them the level goes back to the fixed preset"""
+        self.adaptive = adaptive
+        if not adaptive:
+            self._set_level(self.locked or QUALITY_LEVELS[0])
+
+    def particle_count(self, count):
+        """How many of `count` particles to spawn at this level (at least one)"""
+        if count <= 0:
+            return 0
+        return max(1, int(count * self.particles + 0.5))
+
+
+# The one governor the whole game reads its quality knobs from
+quality = QualityGovernor()
@@ -0,0 +1,143 @@
+"""
+DRAGON'S LAIR RPG - Render Target Module
+========================================
+
+This module lets the window be a different size from the game.
+
+WHAT THIS FILE DOES:
+===================
+Every position in the game - the HP bar, the battle buttons, the grid - is
+in "game pixels" on a SCREEN_WIDTH x SCREEN_HEIGHT (1000x700) picture. The
+window doesn't have to match: set WINDOW_SIZE in config/constants.py (or
+(0, 0) for full screen on a phone) and, once a frame is finished, the
+picture is scaled into the window with RENDER_SCALE_MODE:
+
+- "integer": the biggest whole-number scale that fits (1x, 2x, 3x...),
+  nearest neighbour - crisp pixels, cheapest, may leave wide black bars
+- "fast": as big as fits while keeping the shape, nearest neighbour
+- "smooth": as big as fits, with smoothscale - softest look, costs the most
+
+This is for fitting the game to a window or screen, NOT a performance
+mode: the game always draws the same 1000x700 pixels, and a window of any
+other size adds one scale pass on top (a few milliseconds at phone
+resolutions, see the modes above). When the window IS the game's size
+nothing is scaled and this module costs nothing, which is the default.
+To make a slow device faster, let the quality governor
+(systems/quality_governor.py) turn effects down instead.
+
+With HUD_NATIVE_RESOLUTION the profiler and memory monitor overlays are
+drawn after scaling, straight onto the window, so their small text stays
+sharp.
+
+Mouse and finger positions arrive in window pixels; LiveInput turns them
+back into game pixels with map_event(), so states, buttons and recordings
+never notice the window size.
+
+HOW TO USE IT:
+=============
+    from systems.render_target import render_target
+    render_target.present(overlays=[profiler.draw])   # once per frame, before flip
+    pos = render_target.to_game_pos(pygame.mouse.get_pos())
+
+FOR NOVICE CODERS:
+==================
+It's like drawing on a sheet of paper of fixed size and then putting it on
+a photocopier set to "fit to page" - the drawing code never has to know how
+big the page is.
+"""
+
+import pygame
+
+from config.constants import *
+
+SCALE_MODES = ("integer", "fast", "smooth")
+
+
+class RenderTarget:
+    """
+    Scales the game's picture (the canvas) into the window.
+
+    Attributes:
+        window: The display surface
+        canvas: What the game draws on (the window itself when no scaling is needed)
+        rect: Where the scaled picture goes in the window
+        scaled: Whether the canvas is a separate surface that has to be scaled
+    """
+
+    def __init__(self, window, canvas, mode=RENDER_SCALE_MODE):
+        if mode not in SCALE_MODES:
+            raise ValueError(f"Unknown scale mode: {mode} (use one of {SCALE_MODES})")
+        self.window = window
+        self.canvas = canvas
+        self.mode = mode
+        self.scaled = window is not canvas
+        self.rect = canvas.get_rect()
+        self._target = None  # Part of the window the canvas is scaled into
+        self._bars = []      # Black bars around it
+        if self.scaled:
+            self._layout()
+
+    def _layout(self):
+        window_w, window_h = self.window.get_size()
+        canvas_w, canvas_h = self.canvas.get_size()
+        factor = min(window_w // canvas_w, window_h // canvas_h)
+        if self.mode != "integer" or factor < 1:
+            factor = min(window_w / canvas_w, window_h / canvas_h)
+        self.rect = pygame.Rect(0, 0, int(canvas_w * factor), int(canvas_h * factor))
+        self.rect.center = (window_w // 2, window_h // 2)
+        self._target = self.window.subsurface(self.rect)
+
+        # Letterbox bars: left/right or top/bottom of the picture
+        self._bars = [pygame.Rect(0, 0, window_w, self.rect.top),
+                      pygame.Rect(0, self.rect.bottom, window_w, window_h - self.rect.bottom),
+                      pygame.Rect(0, self.rect.top, self.rect.left, self.rect.height),
+                      pygame.Rect(self.rect.right, self.rect.top, window_w - self.rect.right, self.rect.height)]
+        self._bars = [bar for bar in self._bars if bar.width > 0 and bar.height > 0]
+
+    def present(self, overlays=()):
+        """
+        Put the finished frame in the window (call before pygame.display.flip).
+
+        Args:
+            overlays: draw(surface) functions for debug HUDs, drawn on top
+        """
+        if not self.scaled or not HUD_NATIVE_RESOLUTION:
+            for draw in overlays:
+                draw(self.canvas)
+        if not self.scaled:
+            return
+        if self.mode == "smooth":
+            pygame.transform.smoothscale(self.canvas, self.rect.size, self._target)
+        else:
+            pygame.transform.scale(self.canvas, self.rect.size, self._target)
+        # Bars are cleared every frame because native-resolution overlays may cover them
+        for bar in self._bars:
+            self.window.fill((0, 0, 0), bar)
+        if HUD_NATIVE_RESOLUTION:
+            for draw in overlays:
+                draw(self.window)
+
+    def to_game_pos(self, pos):
+        """Window pixels -> game pixels (may be outside the game inside the black bars)"""
+        if not self.scaled:
+            return pos
+        canvas_w, canvas_h = self.canvas.get_size()
+        return (int((pos[0] - self.rect.x) * canvas_w / self.rect.width),
+                int((pos[1] - self.rect.y) * canvas_h / self.rect.height))
+
+    def map_event(self, event):
+        """Change a mouse or finger event's position from the window to the game"""
+        if not self.scaled:
+            return event
+        if hasattr(event, "pos"):
+            event.pos = self.to_game_pos(event.pos)
+        elif event.type in (pygame.FINGERDOWN, pygame.FINGERMOTION, pygame.FINGERUP):
+            # Finger positions are fractions of the window; make them fractions of the game
+            window_w, window_h = self.window.get_size()
+            x, y = self.to_game_pos((event.x * window_w, event.y * window_h))
+            event.x = x / self.canvas.get_width()
+            event.y = y / self.canvas.get_height()
+        return event
+
+
+render_target = RenderTarget(window, screen)
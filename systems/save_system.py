@@ -0,0 +1,575 @@
+"""
+DRAGON'S LAIR RPG - Save System Module
+======================================
+
+This module saves and loads the player's progress.
+
+WHAT THIS FILE DOES:
+===================
+A save file holds everything needed to continue an adventure:
+- The character (class, level, exp, health, mana, stats, position, kills)
+- Boss progress (last_boss_level, boss_cooldown, final boss defeated)
+- Which world areas were visited (and whose entrance cutscene already played)
+- The enemies and items still waiting in every area
+- Score and play time
+
+Saving happens in two steps:
+1. take_snapshot() copies the game state into plain tuples. This is quick and
+   happens on the main thread, between two frames.
+2. Autosaver packs, compresses and writes that snapshot on a background
+   thread. The file is written to a temporary name first and then renamed,
+   so a crash in the middle of saving never leaves a broken save behind.
+
+FILE FORMAT:
+============
+    header:  "DLRS" | version (1 byte) | flags (1 byte) | payload size (4 bytes) | crc32 (4 bytes)
+    payload: zlib-compressed records (little endian):
+             string table  - every type name used below, stored once
+             player        - PLAYER_RECORD
+             progress      - PROGRESS_RECORD (score, play time, boss flags)
+             world         - WORLD_RECORD, then one AREA_RECORD per area,
+                             each followed by its ENEMY_RECORDs and ITEM_RECORDs
+
+Names like "Warrior" or "volcano" are written as an index into the string
+table, so the format doesn't need updating when new types are added.
+SAVE_VERSION goes up whenever the record layouts change; older files are
+converted when they are read and newer ones are refused.
+
+HOW TO USE IT:
+==============
+    python -m systems.save_system bench --level 10
+    python -m systems.save_system info savegame.dls
+
+"bench" builds a max-level save (every area visited and full of enemies and
+items) and times how long it takes to load.
+
+FOR NOVICE CODERS:
+==================
+"struct" turns numbers into a fixed number of bytes, for example "<H" is a
+2-byte whole number. Reading is the exact reverse of writing, in the same
+order - that's why the record layouts are defined once at the top.
+"""
+
+import argparse
+import os
+import statistics
+import struct
+import sys
+import threading
+import time
+import zlib
+
+SAVE_MAGIC = b"DLRS"
+SAVE_VERSION = 1
+DEFAULT_SAVE_PATH = "savegame.dls"
+
+# Record layouts ("<" = little endian, no padding)
+HEADER_RECORD = struct.Struct("<4sBBII")
+# type, level, exp, exp_to_level, health, max_health, mana, max_mana,
+# strength, defense, speed, x, y, kills, items_collected, last_boss_level, flags
+PLAYER_RECORD = struct.Struct("<HHIIiiiiHHHiiIIHB")
+# score, game_time, flags
+PROGRESS_RECORD = struct.Struct("<IIB")
+# current_area_x, current_area_y, area count
+WORLD_RECORD = struct.Struct("<hhH")
+# area_x, area_y, type, flags, enemy count, item count
+AREA_RECORD = struct.Struct("<hhHBBB")
+# type, x, y, health, max_health, strength, speed
+ENEMY_RECORD = struct.Struct("<HiiiHHH")
+# type, x, y
+ITEM_RECORD = struct.Struct("<Hii")
+
+# Flag bits
+PLAYER_JUST_LEVELED_UP = 1
+PLAYER_BOSS_COOLDOWN = 2
+BOSS_BATTLE_TRIGGERED = 1
+BOSS_DEFEATED = 2
+AREA_VISITED = 1
+AREA_CUTSCENE_SEEN = 2
+
+COMPRESSION_LEVEL = 6
+
+
+# ============================================================================
+# SNAPSHOTS - plain, read-only copies of the game state
+# ============================================================================
+# A snapshot is a dict of tuples. Tuples can't be changed, so the background
+# thread can pack one while the game keeps playing and changing the real objects.
+#   "player":   (type, level, exp, ..., last_boss_level, just_leveled_up, boss_cooldown)
+#   "progress": (score, game_time, boss_battle_triggered, boss_defeated)
+#   "world":    (current_area_x, current_area_y, areas)
+#   areas:      ((area_x, area_y, area_type, visited, cutscene_seen, enemies, items), ...)
+#   enemies:    ((enemy_type, x, y, health, max_health, strength, speed), ...)
+#   items:      ((item_type, x, y), ...)
+
+def take_snapshot(game):
+    """
+    Copy everything a save needs out of the running game.
+
+    Call this on the main thread (between frames). It only reads attributes,
+    so it is cheap enough to do while playing.
+
+    Returns:
+        dict: The snapshot (see the layout above)
+    """
+    p = game.player
+    player = (p.type, p.level, int(p.exp), int(p.exp_to_level), int(p.health), int(p.max_health),
+              int(p.mana), int(p.max_mana), p.strength, p.defense, p.speed, int(p.x), int(p.y),
+              p.kills, p.items_collected, p.last_boss_level, p.just_leveled_up, p.boss_cooldown)
+    boss_system = game.boss_system
+    progress = (game.score, game.game_time,
+                boss_system.boss_battle_triggered, boss_system.boss_defeated)
+    world_map = game.world_map
+    areas = [area_snapshot(area) for area in world_map.areas.values()]
+    # Areas the residency manager has packed away are saved too
+    areas.extend(world_map.residency.stored_snapshots())
+    world = (world_map.current_area_x, world_map.current_area_y, tuple(areas))
+    return {"version": SAVE_VERSION, "player": player, "progress": progress, "world": world}
+
+
+def area_snapshot(area):
+    """Copy one WorldArea into an area tuple (see the snapshot layout above)"""
+    enemies = tuple((e.enemy_type, int(e.x), int(e.y), int(e.health), int(e.max_health),
+                     e.strength, e.speed) for e in area.enemies)
+    items = tuple((i.type, int(i.x), int(i.y)) for i in area.items)
+    return (area.area_x, area.area_y, area.area_type, area.visited,
+            getattr(area, 'entrance_cutscene_triggered', False), enemies, items)
+
+
+# ============================================================================
+# ENCODING AND DECODING
+# ============================================================================
+
+def encode_snapshot(snapshot, level=COMPRESSION_LEVEL):
+    """Pack and compress a snapshot into the bytes of a save file"""
+    strings = {}
+
+    def string_id(text):
+        if text not in strings:
+            strings[text] = len(strings)
+        return strings[text]
+
+    player = snapshot["player"]
+    flags = ((PLAYER_JUST_LEVELED_UP if player[16] else 0) |
+             (PLAYER_BOSS_COOLDOWN if player[17] else 0))
+    body = [PLAYER_RECORD.pack(string_id(player[0]), *player[1:16], flags)]
+
+    score, game_time, triggered, defeated = snapshot["progress"]
+    body.append(PROGRESS_RECORD.pack(score, game_time,
+                                     (BOSS_BATTLE_TRIGGERED if triggered else 0) |
+                                     (BOSS_DEFEATED if defeated else 0)))
+
+    current_x, current_y, areas = snapshot["world"]
+    body.append(WORLD_RECORD.pack(current_x, current_y, len(areas)))
+    for area in areas:
+        _pack_area(body, area, string_id)
+
+    # The string table goes first, so it's known before any record refers to it
+    raw = _pack_strings(strings) + b"".join(body)
+    payload = zlib.compress(raw, level)
+    header = HEADER_RECORD.pack(SAVE_MAGIC, SAVE_VERSION, 0, len(raw), zlib.crc32(payload))
+    return header + payload
+
+
+def decode_snapshot(data):
+    """
+    Read the bytes of a save file back into a snapshot.
+
+    Raises:
+        ValueError: If the data isn't a save file, is damaged, or is from a newer version
+    """
+    if len(data) < HEADER_RECORD.size:
+        raise ValueError("save file is too short")
+    magic, version, _flags, raw_size, crc = HEADER_RECORD.unpack_from(data)
+    if magic != SAVE_MAGIC:
+        raise ValueError("not a Dragon's Lair save file")
+    if version > SAVE_VERSION:
+        raise ValueError(f"save file version {version} is newer than this game ({SAVE_VERSION})")
+    payload = data[HEADER_RECORD.size:]
+    if zlib.crc32(payload) != crc:
+        raise ValueError("save file is damaged (checksum mismatch)")
+    raw = zlib.decompress(payload)
+    if len(raw) != raw_size:
+        raise ValueError("save file is damaged (wrong size)")
+    return _DECODERS[version](raw)
+
+
+def encode_area(area):
+    """
+    Pack one area tuple into a small uncompressed blob: its own string table,
+    then the same AREA/ENEMY/ITEM records a save file uses.
+    """
+    strings = {}
+
+    def string_id(text):
+        if text not in strings:
+            strings[text] = len(strings)
+        return strings[text]
+
+    body = []
+    _pack_area(body, area, string_id)
+    return _pack_strings(strings) + b"".join(body)
+
+
+def decode_area(data):
+    """Read a blob from encode_area() back into an area tuple"""
+    strings, offset = _unpack_strings(data, 0)
+    area, _offset = _unpack_area(data, offset, strings)
+    return area
+
+
+def _pack_strings(strings):
+    table = [struct.pack("<H", len(strings))]
+    for text in strings:
+        data = text.encode("utf-8")
+        table.append(struct.pack("<B", len(data)) + data)
+    return b"".join(table)
+
+
+def _unpack_strings(raw, offset):
+    (count,) = struct.unpack_from("<H", raw, offset)
+    offset += 2
+    strings = []
+    for _ in range(count):
+        length = raw[offset]
+        strings.append(raw[offset + 1:offset + 1 + length].decode("utf-8"))
+        offset += 1 + length
+    return strings, offset
+
+
+def _pack_area(body, area, string_id):
+    area_x, area_y, area_type, visited, cutscene_seen, enemies, items = area
+    flags = (AREA_VISITED if visited else 0) | (AREA_CUTSCENE_SEEN if cutscene_seen else 0)
+    body.append(AREA_RECORD.pack(area_x, area_y, string_id(area_type), flags,
+                                 len(enemies), len(items)))
+    for enemy in enemies:
+        body.append(ENEMY_RECORD.pack(string_id(enemy[0]), *enemy[1:]))
+    for item in items:
+        body.append(ITEM_RECORD.pack(string_id(item[0]), *item[1:]))
+
+
+def _unpack_area(raw, offset, strings):
+    area_x, area_y, type_id, flags, enemy_count, item_count = AREA_RECORD.unpack_from(raw, offset)
+    offset += AREA_RECORD.size
+    enemy_size, item_size = ENEMY_RECORD.size, ITEM_RECORD.size
+    enemies = []
+    for values in ENEMY_RECORD.iter_unpack(raw[offset:offset + enemy_count * enemy_size]):
+        enemies.append((strings[values[0]],) + values[1:])
+    offset += enemy_count * enemy_size
+    items = []
+    for values in ITEM_RECORD.iter_unpack(raw[offset:offset + item_count * item_size]):
+        items.append((strings[values[0]],) + values[1:])
+    offset += item_count * item_size
+    area = (area_x, area_y, strings[type_id], bool(flags & AREA_VISITED),
+            bool(flags & AREA_CUTSCENE_SEEN), tuple(enemies), tuple(items))
+    return area, offset
+
+
+def _decode_v1(raw):
+    strings, offset = _unpack_strings(raw, 0)
+
+    values = PLAYER_RECORD.unpack_from(raw, offset)
+    offset += PLAYER_RECORD.size
+    flags = values[16]
+    player = ((strings[values[0]],) + values[1:16] +
+              (bool(flags & PLAYER_JUST_LEVELED_UP), bool(flags & PLAYER_BOSS_COOLDOWN)))
+
+    score, game_time, flags = PROGRESS_RECORD.unpack_from(raw, offset)
+    offset += PROGRESS_RECORD.size
+    progress = (score, game_time, bool(flags & BOSS_BATTLE_TRIGGERED), bool(flags & BOSS_DEFEATED))
+
+    current_x, current_y, area_count = WORLD_RECORD.unpack_from(raw, offset)
+    offset += WORLD_RECORD.size
+    areas = []
+    for _ in range(area_count):
+        area, offset = _unpack_area(raw, offset, strings)
+        areas.append(area)
+
+    return {"version": 1, "player": player, "progress": progress,
+            "world": (current_x, current_y, tuple(areas))}
+
+
+# One decoder per file version. A new version adds its own decoder, and old
+# decoders keep returning snapshots in the current layout.
+_DECODERS = {1: _decode_v1}
+
+
+# ============================================================================
+# FILES
+# ============================================================================
+
+def write_save(path, data):
+    """Write save bytes atomically (temporary file, then rename over the old save)"""
+    folder = os.path.dirname(os.path.abspath(path))
+    os.makedirs(folder, exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def load_snapshot(path=DEFAULT_SAVE_PATH):
+    """
+    Read a save file.
+
+    Returns:
+        dict: The snapshot, or None if there is no save or it can't be read
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            return decode_snapshot(f.read())
+    except (OSError, ValueError, zlib.error, struct.error, IndexError) as e:
+        print(f"Could not load save file {path}: {e}")
+        return None
+
+
+def apply_snapshot(game, snapshot):
+    """
+    Put a loaded snapshot back into the game (replaces the player and the world).
+    """
+    from entities.player_characters.character import Character
+    from world.world_map import WorldMap
+    from world.world_area import WorldArea
+
+    values = snapshot["player"]
+    player = Character(values[0])
+    (player.level, player.exp, player.exp_to_level, player.health, player.max_health,
+     player.mana, player.max_mana, player.strength, player.defense, player.speed,
+     player.x, player.y, player.kills, player.items_collected, player.last_boss_level,
+     player.just_leveled_up, player.boss_cooldown) = values[1:]
+    game.player = player
+
+    score, game_time, triggered, defeated = snapshot["progress"]
+    game.score = score
+    game.game_time = game_time
+    game.boss_system.boss_battle_triggered = triggered
+    game.boss_system.boss_defeated = defeated
+
+    current_x, current_y, areas = snapshot["world"]
+    world_map = WorldMap()
+    for area_tuple in areas:
+        area_x, area_y, area_type = area_tuple[:3]
+        # Only areas around the player are rebuilt now, the rest stay packed until visited
+        if not world_map.residency.is_hot(area_x, area_y, current_x, current_y):
+            world_map.areas.pop((area_x, area_y), None)
+            world_map.residency.store_snapshot(area_tuple)
+            continue
+        area = world_map.areas.get((area_x, area_y))
+        if area is None or area.area_type != area_type:
+            area = world_map.areas[(area_x, area_y)] = WorldArea(area_x, area_y, area_type)
+        restore_area(area, area_tuple)
+    world_map.current_area_x = current_x
+    world_map.current_area_y = current_y
+    world_map.update_camera(player.x, player.y)
+    game.world_map = world_map
+
+    current_area = world_map.get_current_area()
+    game.enemies = current_area.enemies if current_area else []
+    game.items = current_area.items if current_area else []
+
+
+def restore_area(area, area_tuple):
+    """Put an area tuple's enemies, items and flags back into a WorldArea"""
+    from entities.enemy import Enemy
+    from entities.item import Item
+    from config.constants import ENEMY_COLORS, ITEM_COLOR, MANA_COLOR
+
+    _x, _y, _type, visited, cutscene_seen, enemies, items = area_tuple
+    area.visited = visited
+    area.entrance_cutscene_triggered = cutscene_seen
+    area.enemies = []
+    for enemy_type, x, y, health, max_health, strength, speed in enemies:
+        enemy = Enemy(1)
+        enemy.enemy_type = enemy_type
+        enemy.name = f"{enemy_type.title()} Enemy"
+        enemy.color = ENEMY_COLORS.get(enemy_type, (255, 0, 0))
+        enemy.x, enemy.y = x, y
+        enemy.health, enemy.max_health = health, max_health
+        enemy.strength, enemy.speed = strength, speed
+        area.enemies.append(enemy)
+    area.items = []
+    for item_type, x, y in items:
+        item = Item()
+        item.type = item_type
+        item.color = ITEM_COLOR if item_type == "health" else MANA_COLOR
+        item.x, item.y = x, y
+        area.items.append(item)
+
+
+# ============================================================================
+# BACKGROUND SAVING
+# ============================================================================
+
+class Autosaver:
+    """
+    Writes save files on a background thread.
+
+    save() only hands over a snapshot and returns straight away. If the game
+    asks for several saves before the thread gets to them, only the newest
+    one is written - older snapshots are out of date anyway.
+
+    Attributes:
+        saves_written: Number of save files written
+        last_save_ms: How long packing + writing the last save took
+        last_error: The error from the last failed save (or None)
+    """
+
+    def __init__(self, path=DEFAULT_SAVE_PATH):
+        self.path = path
+        self.saves_written = 0
+        self.last_save_ms = 0.0
+        self.last_error = None
+        self._pending = None
+        self._busy = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def save(self, snapshot):
+        """Queue a snapshot to be written (replaces any snapshot still waiting)"""
+        with self._condition:
+            if self._closed:
+                return
+            self._pending = snapshot
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._worker, name="autosave", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def wait(self, timeout=None):
+        """Block until every queued save has been written"""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending is None and not self._busy, timeout)
+
+    def close(self, timeout=5.0):
+        """Write the last queued save (if any) and stop the thread"""
+        self.wait(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or self._closed)
+                if self._pending is None:
+                    return
+                snapshot, self._pending = self._pending, None
+                self._busy = True
+            start = time.perf_counter()
+            try:
+                write_save(self.path, encode_snapshot(snapshot))
+                self.saves_written += 1
+                self.last_error = None
+            except (OSError, ValueError, struct.error) as e:
+                self.last_error = e
+                print(f"Autosave failed: {e}")
+            self.last_save_ms = (time.perf_counter() - start) * 1000
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+
+
+# ============================================================================
+# COMMAND LINE (benchmark and save inspection)
+# ============================================================================
+
+def make_bench_snapshot(level=10, world_size=3, enemies_per_area=3, items_per_area=2):
+    """
+    Build the biggest save a normal game can make: a character at `level`,
+    every area visited and every area holding the most enemies and items.
+    """
+    from systems.balance_simulator import DEFAULT_STAT_TABLE
+    base = DEFAULT_STAT_TABLE["classes"]["Warrior"]
+    bonus = DEFAULT_STAT_TABLE["level_up"]
+    levels = level - 1
+    exp_to_level = 100
+    for _ in range(levels):
+        exp_to_level = int(exp_to_level * 1.5)
+    health = base["health"] + bonus["health"] * levels
+    mana = base["mana"] + bonus["mana"] * levels
+    player = ("Warrior", level, exp_to_level - 1, exp_to_level, health, health, mana, mana,
+              base["strength"] + bonus["strength"] * levels, base["defense"] + bonus["defense"] * levels,
+              7 + levels, 1500, 1100, 999, 999, level - 1, False, True)
+    area_types = ("mountain", "forest", "desert", "swamp", "beach", "volcano", "ice", "town", "cave")
+    enemy_types = ("fiery", "shadow", "ice")
+    enemy_health = 50 + level * 10
+    areas = []
+    for y in range(world_size):
+        for x in range(world_size):
+            enemies = tuple((enemy_types[i % 3], x * 1000 + 100 + i * 50, y * 700 + 100, enemy_health,
+                             enemy_health, 8 + level * 2, 3 + level // 3) for i in range(enemies_per_area))
+            items = tuple(("health" if i % 2 else "mana", x * 1000 + 200 + i * 50, y * 700 + 300)
+                          for i in range(items_per_area))
+            areas.append((x, y, area_types[(y * world_size + x) % len(area_types)], True, True,
+                          enemies, items))
+    world = (world_size // 2, world_size // 2, tuple(areas))
+    return {"version": SAVE_VERSION, "player": player, "progress": (9999, 216000, False, False),
+            "world": world}
+
+
+def run_bench(level, world_size, runs):
+    snapshot = make_bench_snapshot(level, world_size)
+    data = encode_snapshot(snapshot)
+    if decode_snapshot(data) != snapshot:
+        raise SystemExit("Round trip failed: loaded save differs from the saved snapshot")
+
+    def timed(func):
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) * 1000)
+        samples.sort()
+        return statistics.mean(samples), samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+    raw_size = HEADER_RECORD.unpack_from(data)[3]
+    print(f"Level {level} save, {world_size}x{world_size} areas: "
+          f"{len(data)} bytes on disk ({raw_size} bytes uncompressed)")
+    for name, func in (("encode", lambda: encode_snapshot(snapshot)),
+                       ("decode", lambda: decode_snapshot(data))):
+        average, p95 = timed(func)
+        print(f"  {name:<8} mean {average:.3f} ms   p95 {p95:.3f} ms")
+
+
+def print_info(path):
+    snapshot = load_snapshot(path)
+    if snapshot is None:
+        raise SystemExit(f"No readable save at {path}")
+    player = snapshot["player"]
+    score, game_time, _triggered, defeated = snapshot["progress"]
+    current_x, current_y, areas = snapshot["world"]
+    print(f"{path}: version {snapshot['version']}, {os.path.getsize(path)} bytes")
+    print(f"  {player[0]} level {player[1]}  HP {player[4]}/{player[5]}  MP {player[6]}/{player[7]}"
+          f"  last boss level {player[15]}  boss cooldown {player[17]}")
+    print(f"  score {score}  time {game_time}  final boss defeated {defeated}")
+    visited = sum(1 for area in areas if area[3])
+    enemies = sum(len(area[5]) for area in areas)
+    items = sum(len(area[6]) for area in areas)
+    print(f"  area ({current_x}, {current_y})  {visited}/{len(areas)} visited  "
+          f"{enemies} enemies  {items} items")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dragon's Lair RPG save files")
+    commands = parser.add_subparsers(dest="command", required=True)
+    bench_parser = commands.add_parser("bench", help="time saving and loading a max-level save")
+    bench_parser.add_argument("--level", type=int, default=10, help="character level (default: 10)")
+    bench_parser.add_argument("--world-size", type=int, default=3, help="areas per side (default: 3)")
+    bench_parser.add_argument("--runs", type=int, default=1000, help="timing runs (default: 1000)")
+    info_parser = commands.add_parser("info", help="show what's in a save file")
+    info_parser.add_argument("path", nargs="?", default=DEFAULT_SAVE_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "bench":
+        run_bench(args.level, args.world_size, args.runs)
+    else:
+        print_info(args.path)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,395 @@
+"""
+DRAGON'S LAIR RPG - Scenario Benchmark Module
+=============================================
+
+This module boots the real game without a window and times scripted scenes.
+
+WHAT THIS FILE DOES:
+===================
+Every scenario puts the game into a demanding situation and runs the normal
+game loop (Game.play) for a fixed number of frames:
+- town_cutscene:    the town gate while Captain Marcus gives his speech
+- mage_boss_fight:  a Mage casting spells at Malakor (BossDragon) with the
+                    battle particle system kept full
+- volcano_emitters: the volcano area spawning lava particles every frame
+- overworld_200:    200 enemies chasing the player in one area
+- opening_cutscene: the story introduction
+
+For each scenario it measures frames per second and the per-frame time
+(mean, p50, p95, p99, max). Results can be saved as a baseline for this
+machine and later runs compared against it, so a change that makes a scene
+slower shows up as a REGRESSION.
+
+HOW TO USE IT:
+==============
+    python -m systems.scenario_bench list
+    python -m systems.scenario_bench run --save-baseline
+    python -m systems.scenario_bench compare --threshold 0.10
+    python -m systems.scenario_bench run --scenario mage_boss_fight --sections
+    python -m systems.scenario_bench run --quality low   (a fixed quality preset)
+
+Baselines are stored in BENCH_BASELINE_PATH, one entry per machine (see
+machine_key()), because timings from different computers can't be compared.
+--sections also records the frame profiler's per-subsystem timings.
+Scenarios run at the "high" quality preset unless --quality picks another
+one (the automatic quality governor is off, so every run does the same work).
+
+FOR NOVICE CODERS:
+==================
+A benchmark is only fair if every run does exactly the same work: the random
+numbers are seeded the same way and the scenario scripts press the same keys
+on the same frames. The first BENCH_WARMUP_FRAMES frames are not counted
+(caches are still being filled then).
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+BENCH_FRAMES = 600
+BENCH_WARMUP_FRAMES = 60
+BENCH_SEED = 2024
+BENCH_BASELINE_PATH = os.path.join("benchmarks", "baselines.json")
+BENCH_THRESHOLD = 0.10          # 10% slower counts as a regression
+BOSS_FIGHT_PARTICLES = 1500     # Battle particles kept alive during the boss fight
+OVERWORLD_ENEMY_COUNT = 200
+
+
+def machine_key():
+    """Name for this computer + Python version (baselines are stored per key)"""
+    return (f"{platform.node()}/{platform.system()}-{platform.machine()}/"
+            f"py{sys.version_info.major}.{sys.version_info.minor}")
+
+
+def percentile(ordered, fraction):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+# ============================================================================
+# SCENARIO INPUT - scripted input that also times every frame
+# ============================================================================
+
+class ScenarioInput:
+    """
+    Input source for Game.play() that follows a scenario script.
+
+    The time between two poll() calls is one whole frame (update + draw;
+    headless runs don't wait for the clock). The script's own work is not
+    counted.
+    """
+    realtime = False
+
+    def __init__(self, script, frames, warmup=BENCH_WARMUP_FRAMES):
+        self.script = script
+        self.frames = frames
+        self.warmup = warmup
+        self.frame = 0
+        self.frame_ms = []
+        self._last = None
+
+    def poll(self, game):
+        now = time.perf_counter()
+        if self._last is not None and self.frame > self.warmup:
+            self.frame_ms.append((now - self._last) * 1000)
+        if self.frame >= self.frames + self.warmup:
+            return None
+        self.frame += 1
+        events = self.script(game, self.frame) or []
+        self._last = time.perf_counter()
+        return (0, 0), events
+
+    def close(self, game):
+        pass
+
+
+# ============================================================================
+# SCENARIOS
+# ============================================================================
+# Each setup function prepares the game and returns the per-frame script:
+# script(game, frame) -> list of pygame events for that frame.
+
+def enter_area(game, char_type, area_x, area_y):
+    """Start a fresh game with the player in the middle of an area"""
+    from entities.player_characters.character import Character
+    from config.constants import AREA_WIDTH, AREA_HEIGHT
+    game.player = Character(char_type)
+    game.start_game()
+    game.particle_system.particles.clear()
+    world_map = game.world_map
+    area = world_map.get_area(area_x, area_y)
+    area.visited = True
+    world_map.current_area_x, world_map.current_area_y = area_x, area_y
+    area_world_x, area_world_y = area.get_world_position()
+    game.player.x = area_world_x + AREA_WIDTH // 2
+    game.player.y = area_world_y + AREA_HEIGHT // 2
+    game.enter_current_area()
+    game.state = "overworld"
+    return area
+
+
+def setup_town_cutscene(game):
+    area = enter_area(game, "Warrior", 1, 2)
+    area_world_x, area_world_y = area.get_world_position()
+    # Standing at the gate starts the guard's speech; nobody presses SPACE, so it keeps going
+    game.player.x = area_world_x + 500
+    game.player.y = area_world_y + 260
+    return lambda game, frame: None
+
+
+def setup_mage_boss_fight(game):
+    import pygame
+    from entities.boss_dragons import BossDragon
+    from config.constants import MAGIC_COLORS
+
+    enter_area(game, "Mage", 1, 1)
+    player = game.player
+    # Both sides get enormous health so the fight lasts the whole benchmark
+    player.health = player.max_health = 10 ** 6
+    player.mana = player.max_mana = 10 ** 6
+    boss = BossDragon()
+    boss.health = boss.max_health = 10 ** 7
+    game.start_battle(boss, rng=random.Random(BENCH_SEED))
+    game.boss_system.start_boss_battle(player, boss)
+
+    def script(game, frame):
+        battle = game.battle_screen
+        if battle is None:
+            return None
+        particles = battle.particle_system
+        missing = BOSS_FIGHT_PARTICLES - len(particles.particles)
+        if missing > 0:
+            particles.add_explosion(random.randint(100, 900), random.randint(100, 500),
+                                    random.choice(MAGIC_COLORS), count=missing)
+        battle.selected_option = 1  # Always cast magic
+        return [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, mod=0)]
+    return script
+
+
+def setup_volcano_emitters(game):
+    area = enter_area(game, "Rogue", 2, 1)
+    area.particle_interval = 1  # Lava emitters fire every frame
+    return lambda game, frame: None
+
+
+def setup_overworld_200(game):
+    from entities.enemy import Enemy
+    from config.constants import AREA_WIDTH, AREA_HEIGHT
+    # Area (0, 0): enemies are kept inside the window's coordinates, which match this area's
+    area = enter_area(game, "Warrior", 0, 0)
+    player = game.player
+    rng = random.Random(BENCH_SEED)
+    for _ in range(OVERWORLD_ENEMY_COUNT):
+        enemy = Enemy(player.level)
+        # Far enough from the player that nobody reaches them during the run
+        while True:
+            enemy.x = rng.randint(40, AREA_WIDTH - 40)
+            enemy.y = rng.randint(40, AREA_HEIGHT - 40)
+            if abs(enemy.x - player.x) > 250 or abs(enemy.y - player.y) > 250:
+                break
+        area.enemies.append(enemy)
+    game.spawn_timer = -10 ** 9  # No extra spawns
+    return lambda game, frame: None
+
+
+def setup_opening_cutscene(game):
+    game.player = None
+    game.state = "opening_cutscene"
+
+    def script(game, frame):
+        if game.state != "opening_cutscene":  # Finished: watch it again (entering starts a fresh one)
+            game.state = "opening_cutscene"
+    return script
+
+
+SCENARIOS = {
+    "town_cutscene": setup_town_cutscene,
+    "mage_boss_fight": setup_mage_boss_fight,
+    "volcano_emitters": setup_volcano_emitters,
+    "overworld_200": setup_overworld_200,
+    "opening_cutscene": setup_opening_cutscene,
+}
+
+
+# ============================================================================
+# RUNNING
+# ============================================================================
+
+def boot_game():
+    """Create a headless Game (random numbers seeded for repeatable runs)"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from systems.input_recorder import seed_random
+    seed_random(BENCH_SEED)
+    from core.game import Game
+    game = Game()
+    game.autosaver.save = lambda snapshot: None  # Benchmarks never write save files
+    return game
+
+
+def run_scenario(game, name, frames=BENCH_FRAMES, sections=False):
+    """
+    Run one scenario.
+
+    Returns:
+        dict: fps and frame time percentiles (plus per-section p95s if sections=True)
+    """
+    from systems.input_recorder import seed_random
+    from systems.frame_profiler import profiler
+    seed_random(BENCH_SEED)
+    game.battle_screen = None
+    script = SCENARIOS[name](game)
+    source = ScenarioInput(script, frames)
+    if sections:
+        profiler.reset()
+        profiler.enabled = True
+    try:
+        game.play(source)
+    finally:
+        profiler.enabled = False
+    ordered = sorted(source.frame_ms)
+    total = sum(ordered)
+    result = {
+        "frames": len(ordered),
+        "fps": len(ordered) / (total / 1000) if total else 0.0,
+        "mean_ms": total / len(ordered) if ordered else 0.0,
+        "p50_ms": percentile(ordered, 0.50),
+        "p95_ms": percentile(ordered, 0.95),
+        "p99_ms": percentile(ordered, 0.99),
+        "max_ms": ordered[-1] if ordered else 0.0,
+    }
+    if sections:
+        result["sections_p95_ms"] = {f"{state}:{section}": round(p95, 4)
+                                     for state, section, _count, _p50, p95, _p99 in profiler.summary()}
+    return result
+
+
+def run_all(names, frames=BENCH_FRAMES, sections=False):
+    game = boot_game()
+    results = {}
+    for name in names:
+        results[name] = run_scenario(game, name, frames, sections)
+        print_result(name, results[name])
+    return results
+
+
+def print_result(name, result):
+    print(f"{name:<18} {result['fps']:8.1f} fps   mean {result['mean_ms']:6.2f}   p50 {result['p50_ms']:6.2f}"
+          f"   p95 {result['p95_ms']:6.2f}   p99 {result['p99_ms']:6.2f}   max {result['max_ms']:6.2f} ms")
+
+
+# ============================================================================
+# BASELINES
+# ============================================================================
+
+def load_baselines(path=BENCH_BASELINE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(results, frames, path=BENCH_BASELINE_PATH):
+    """Store results as this machine's baseline (other machines' entries are kept)"""
+    baselines = load_baselines(path)
+    entry = baselines.setdefault(machine_key(), {"scenarios": {}})
+    entry["recorded"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    entry["frames"] = frames
+    entry["scenarios"].update(results)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+    print(f"Baseline for {machine_key()} saved to {path}")
+
+
+def compare_results(baseline, results, threshold=BENCH_THRESHOLD):
+    """
+    Compare a run against a baseline.
+
+    A scenario regresses when its fps drops, or its p95 frame time grows, by
+    more than `threshold` (0.10 = 10%). p99 is shown but not judged: a handful
+    of slow frames is too noisy to flag on.
+
+    Returns:
+        list: Names of the scenarios that regressed
+    """
+    regressions = []
+    print(f"{'scenario':<18} {'fps':>16} {'p95 ms':>16} {'p99 ms':>16}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<18} (no baseline)")
+            continue
+
+        def change(key):
+            return (result[key] - base[key]) / base[key] if base[key] else 0.0
+
+        fps_change, p95_change, p99_change = change("fps"), change("p95_ms"), change("p99_ms")
+        regressed = fps_change < -threshold or p95_change > threshold
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<18} {result['fps']:8.1f} ({fps_change:+5.0%}) {result['p95_ms']:7.2f} ({p95_change:+5.0%})"
+              f" {result['p99_ms']:7.2f} ({p99_change:+5.0%})  {'REGRESSION' if regressed else 'ok'}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dragon's Lair RPG scenario benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_run_options(p):
+        p.add_argument("--scenario", action="append", choices=list(SCENARIOS),
+                       help="scenario to run (repeatable, default: all)")
+        p.add_argument("--frames", type=int, default=BENCH_FRAMES,
+                       help=f"measured frames per scenario (default: {BENCH_FRAMES})")
+        p.add_argument("--baseline", default=BENCH_BASELINE_PATH, help="baseline file")
+        p.add_argument("--sections", action="store_true", help="also record per-subsystem timings")
+        p.add_argument("--quality", help="quality preset to run at: high, medium, low or minimal (default: high)")
+
+    commands.add_parser("list", help="list the scenarios")
+    run_parser = commands.add_parser("run", help="run scenarios")
+    add_run_options(run_parser)
+    run_parser.add_argument("--save-baseline", action="store_true", help="store the results as this machine's baseline")
+    run_parser.add_argument("--out", help="also write the results to this JSON file")
+    compare_parser = commands.add_parser("compare", help="run scenarios and compare with this machine's baseline")
+    add_run_options(compare_parser)
+    compare_parser.add_argument("--threshold", type=float, default=BENCH_THRESHOLD,
+                                help=f"allowed slowdown before flagging (default: {BENCH_THRESHOLD})")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name, setup in SCENARIOS.items():
+            print(name)
+        return 0
+
+    names = args.scenario or list(SCENARIOS)
+    if args.quality:
+        from systems.quality_governor import quality
+        quality.lock(args.quality)
+    if args.command == "compare":
+        baseline = load_baselines(args.baseline).get(machine_key())
+        if baseline is None:
+            print(f"No baseline for {machine_key()} in {args.baseline} (run with --save-baseline first)")
+            return 2
+        results = run_all(names, args.frames, args.sections)
+        regressions = compare_results(baseline["scenarios"], results, args.threshold)
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}")
+            return 1
+        return 0
+
+    results = run_all(names, args.frames, args.sections)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"machine": machine_key(), "frames": args.frames, "scenarios": results}, f, indent=2)
+    if args.save_baseline:
+        save_baseline(results, args.frames, args.baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
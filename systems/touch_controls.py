@@ -0,0 +1,137 @@
+"""
+DRAGON'S LAIR RPG - Touch Controls Module
+=========================================
+
+This module is the on-screen D-pad and ENT/SPC buttons used on Android.
+
+WHAT THIS FILE DOES:
+===================
+TouchControls reads pygame's finger events (FINGERDOWN, FINGERMOTION,
+FINGERUP) and turns them straight into actions (see
+systems/input_actions.py) - there are no pretend key presses posted back
+into the event queue, so a tap acts in the same frame.
+
+- MULTI-TOUCH: every finger is tracked on its own, so you can hold the
+  D-pad with one thumb and tap ENT with the other
+- HOLD TO MOVE: a finger resting on an arrow holds that action, and the
+  InputMapper repeats it just like a held key. Sliding the finger to
+  another arrow switches direction without lifting it
+- CACHED OVERLAY: each button (normal and pressed) is drawn once into a
+  small surface; drawing the controls is then six blits per frame
+
+HOW TO USE IT:
+=============
+Game creates one on Android and gives it to its InputMapper:
+    game.input.touch = TouchControls()
+The mapper passes finger events to it, and Game draws it in the overworld
+and in battles with game.input.touch.draw(screen).
+
+FOR NOVICE CODERS:
+==================
+Finger positions come as fractions of the window (0.0 to 1.0), not pixels.
+Multiplying by the screen size gives the position in game coordinates, so
+the buttons line up however big the phone's screen is.
+"""
+
+import pygame
+
+from config.constants import *
+from systems.input_actions import UP, DOWN, LEFT, RIGHT, CONFIRM, TALK
+
+BUTTON_COLORS = {
+    UP: (200, 200, 200), DOWN: (200, 200, 200), LEFT: (200, 200, 200), RIGHT: (200, 200, 200),
+    CONFIRM: (255, 215, 0), TALK: (0, 255, 255),
+}
+BUTTON_LABELS = {CONFIRM: "ENT", TALK: "SPC"}
+
+
+class TouchControls:
+    """
+    On-screen buttons driven by finger events.
+
+    Attributes:
+        buttons: action -> pygame.Rect of its button
+        pointers: (touch_id, finger_id) -> action under that finger (None if it's on no button)
+    """
+
+    def __init__(self, size=TOUCH_BUTTON_SIZE, margin=TOUCH_BUTTON_MARGIN):
+        screen_w, screen_h = SCREEN_WIDTH, SCREEN_HEIGHT
+        self.buttons = {
+            # D-pad
+            UP: pygame.Rect(margin + size, screen_h - 3*size, size, size),
+            DOWN: pygame.Rect(margin + size, screen_h - size, size, size),
+            LEFT: pygame.Rect(margin, screen_h - 2*size, size, size),
+            RIGHT: pygame.Rect(margin + 2*size, screen_h - 2*size, size, size),
+            # Enter/Space
+            CONFIRM: pygame.Rect(screen_w - margin - size, screen_h - 2*size, size, size),
+            TALK: pygame.Rect(screen_w - margin - 2*size, screen_h - 2*size, size, size),
+        }
+        self.pointers = {}
+        self._images = None  # action -> (normal, pressed) surfaces, made on first draw
+
+    def button_at(self, pos):
+        """The action of the button at a screen position, or None"""
+        for action, rect in self.buttons.items():
+            if rect.collidepoint(pos):
+                return action
+        return None
+
+    def process(self, event, mapper):
+        """
+        Handle one finger event.
+
+        Returns:
+            list: The ActionEvents it caused (presses and releases)
+        """
+        pointer = (event.touch_id, event.finger_id)
+        pos = (int(event.x * SCREEN_WIDTH), int(event.y * SCREEN_HEIGHT))
+        old = self.pointers.get(pointer)
+        if event.type == pygame.FINGERUP:
+            self.pointers.pop(pointer, None)
+            new = None
+        else:
+            new = self.button_at(pos)
+            self.pointers[pointer] = new
+        if new == old:
+            return []
+
+        actions = []
+        # An action stays held while any finger is still on its button
+        if old and old not in self.pointers.values():
+            actions.append(mapper.release(old, pos))
+        if new and list(self.pointers.values()).count(new) == 1:
+            actions.append(mapper.press(new, pos))
+        return actions
+
+    def is_pressed(self, action):
+        return action in self.pointers.values()
+
+    def draw(self, screen):
+        if self._images is None:
+            self._images = {action: (self._render(action, rect.size, False), self._render(action, rect.size, True))
+                            for action, rect in self.buttons.items()}
+        for action, rect in self.buttons.items():
+            normal, pressed = self._images[action]
+            screen.blit(pressed if self.is_pressed(action) else normal, rect)
+
+    @staticmethod
+    def _render(action, size, pressed):
+        """Draw one button into its own surface"""
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        rect = surface.get_rect()
+        color = BUTTON_COLORS[action]
+        if pressed:
+            color = tuple(channel // 2 for channel in color)
+        pygame.draw.rect(surface, color, rect, border_radius=20)
+        arrows = {
+            UP: [(rect.centerx, rect.top+15), (rect.left+15, rect.bottom-15), (rect.right-15, rect.bottom-15)],
+            DOWN: [(rect.centerx, rect.bottom-15), (rect.left+15, rect.top+15), (rect.right-15, rect.top+15)],
+            LEFT: [(rect.left+15, rect.centery), (rect.right-15, rect.top+15), (rect.right-15, rect.bottom-15)],
+            RIGHT: [(rect.right-15, rect.centery), (rect.left+15, rect.top+15), (rect.left+15, rect.bottom-15)],
+        }
+        if action in arrows:
+            pygame.draw.polygon(surface, (100, 100, 100), arrows[action])
+        else:
+            text = font_small.render(BUTTON_LABELS[action], True, (0, 0, 0))
+            surface.blit(text, text.get_rect(center=rect.center))
+        return surface
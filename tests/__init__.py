@@ -5,9 +5,15 @@ Test Suite Package
 This package contains all test files for the Dragon's Lair RPG project.
 
 Files:
+- test_balance_simulator.py: Balance simulator stat table tests
 - test_boss_system.py: Boss system tests
+- test_combat_engine.py: Combat engine rules tests
 - test_dark_knight.py: Dark knight entity tests
 - test_guard_entities.py: Guard entity tests
+- test_input_actions.py: Input mapping, key repeat and buffering tests
+- test_input_recorder.py: Input recording format tests
+- test_quality_governor.py: Quality governor tests
+- test_save_system.py: Save file format tests
 """
 
 __version__ = "1.0.0"
@@ -0,0 +1,51 @@
+"""
+Balance Simulator Test Script
+=============================
+
+This script checks that the balance simulator's built-in stat table still
+matches the game. The table copies numbers from the character and enemy
+classes; if someone retunes an entity without updating the table, the
+simulated win rates would quietly stop describing the real game.
+
+RESOURCE: This demonstrates the systems.balance_simulator module.
+"""
+
+from systems.balance_simulator import DEFAULT_STAT_TABLE, CLASSES, make_player, make_enemy
+from entities.player_characters.character import Character
+from entities.enemy import Enemy
+from entities.boss_dragons import DragonBoss, BossDragon
+
+LEVELS = (1, 2, 5, 10)
+ENEMY_CLASSES = {"Enemy": Enemy, "DragonBoss": DragonBoss, "BossDragon": lambda level: BossDragon()}
+
+
+def test_players_match_characters():
+    """Every class at several levels has the same stats as a real Character"""
+    for char_type in CLASSES:
+        character = Character(char_type)
+        for level in range(1, max(LEVELS) + 1):
+            if level > 1:
+                character.level_up()
+            if level not in LEVELS:
+                continue
+            simulated = make_player(DEFAULT_STAT_TABLE, char_type, level)
+            assert (simulated.max_health, simulated.max_mana, simulated.strength, simulated.defense) == \
+                (character.max_health, character.max_mana, character.strength, character.defense), \
+                f"{char_type} level {level}"
+
+
+def test_enemies_match_entities():
+    """Every enemy at several player levels has the same stats as the real one"""
+    assert set(DEFAULT_STAT_TABLE["enemies"]) == set(ENEMY_CLASSES)
+    for name, make_entity in ENEMY_CLASSES.items():
+        for level in LEVELS:
+            entity = make_entity(level)
+            simulated = make_enemy(DEFAULT_STAT_TABLE, name, level)
+            assert (simulated.max_health, simulated.strength) == (entity.max_health, entity.strength), \
+                f"{name} at player level {level}"
+
+
+if __name__ == "__main__":
+    test_players_match_characters()
+    test_enemies_match_entities()
+    print("All balance simulator tests passed!")
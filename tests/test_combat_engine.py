@@ -0,0 +1,73 @@
+"""
+Combat Engine Test Script
+=========================
+
+This script checks the rendering-free combat rules.
+It runs fights with no window at all, so it finishes instantly.
+
+RESOURCE: This demonstrates the systems.combat_engine module.
+"""
+
+import time
+from systems.combat_engine import (Combatant, CombatState, player_action, enemy_turn,
+                                   resolve_battle, MAGIC_MANA_COST)
+
+
+def make_fight(seed=0):
+    """Create a level 1 Warrior vs a level 1 enemy"""
+    player = Combatant("Hero", 120, 120, 15, defense=10, mana=50, max_mana=50, char_type="Warrior")
+    enemy = Combatant("Ice Enemy", 60, 60, 10, enemy_type="ice")
+    return CombatState(player, enemy, seed=seed)
+
+
+def test_attack_then_enemy_turn():
+    """An attack damages the enemy and hands the turn over"""
+    state = make_fight()
+    events = player_action(state, "attack")
+    assert state.enemy.health == 45
+    assert state.turn == "enemy_turn"
+    assert events[-1] == {"type": "turn", "turn": "enemy_turn"}
+    events = enemy_turn(state)
+    assert state.player.health == 120 - (10 - 10 // 3)
+    assert state.turn == "player_turn"
+
+
+def test_magic_needs_mana():
+    """Magic without enough mana only logs a message"""
+    state = make_fight()
+    state.player.mana = MAGIC_MANA_COST - 1
+    events = player_action(state, "magic")
+    assert events == [{"type": "log", "message": "Not enough mana!"}]
+    assert state.turn == "player_turn"
+
+
+def test_same_seed_same_fight():
+    """Fights with the same seed always end the same way"""
+    results = []
+    for _ in range(2):
+        state = make_fight(seed=42)
+        while not state.ended:
+            if state.turn == "player_turn":
+                player_action(state, "run")
+            else:
+                enemy_turn(state)
+        results.append((state.result, state.turn_count, state.player.health))
+    assert results[0] == results[1]
+
+
+def test_resolve_battle_speed():
+    """Resolve many full fights and report how long each one takes"""
+    start = time.perf_counter()
+    count = 1000
+    for seed in range(count):
+        assert resolve_battle(make_fight(seed)) == "win"
+    elapsed = time.perf_counter() - start
+    print(f"Resolved {count} battles, {elapsed / count * 1e6:.1f} us per battle")
+
+
+if __name__ == "__main__":
+    test_attack_then_enemy_turn()
+    test_magic_needs_mana()
+    test_same_seed_same_fight()
+    test_resolve_battle_speed()
+    print("All combat engine tests passed!")
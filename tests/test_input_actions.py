@@ -0,0 +1,87 @@
+"""
+Input Actions Test Script
+=========================
+
+This script checks how InputMapper turns key presses into actions: held-key
+repeat timing, two keys bound to the same action, and buffered commands
+running out. It feeds made-up pygame events, so no window is needed.
+
+RESOURCE: This demonstrates the systems.input_actions module.
+"""
+
+import pygame
+from systems.input_actions import InputMapper, ActionEvent, UP, CONFIRM, CLICK
+
+
+def key(event_type, key_code):
+    return pygame.event.Event(event_type, key=key_code, mod=0)
+
+
+def test_press_and_release():
+    """A key press and release each give one action event"""
+    mapper = InputMapper()
+    assert mapper.process([key(pygame.KEYDOWN, pygame.K_RETURN)]) == [ActionEvent(CONFIRM, True, False, None)]
+    assert mapper.process([key(pygame.KEYUP, pygame.K_RETURN)]) == [ActionEvent(CONFIRM, False, False, None)]
+    assert mapper.process([key(pygame.KEYDOWN, pygame.K_F1)]) == []  # Not bound to anything
+    click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(10, 20))
+    assert mapper.process([click]) == [ActionEvent(CLICK, True, False, (10, 20))]
+
+
+def test_held_key_repeat_timing():
+    """A held arrow repeats after repeat_delay frames, then every repeat_interval frames"""
+    mapper = InputMapper(repeat_delay=3, repeat_interval=2)
+    repeat_frames = []
+    for frame in range(9):
+        events = [key(pygame.KEYDOWN, pygame.K_UP)] if frame == 0 else []
+        for action in mapper.process(events):
+            if action.repeat:
+                assert action == ActionEvent(UP, True, True, None)
+                repeat_frames.append(frame)
+    # The press frame counts as the first frame held
+    assert repeat_frames == [2, 4, 6, 8]
+    mapper.process([key(pygame.KEYUP, pygame.K_UP)])
+    assert mapper.process([]) == [] and UP not in mapper.held
+
+
+def test_confirm_does_not_repeat():
+    """Only movement repeats; holding ENTER confirms once"""
+    mapper = InputMapper(repeat_delay=1, repeat_interval=1)
+    actions = mapper.process([key(pygame.KEYDOWN, pygame.K_RETURN)])
+    for _ in range(10):
+        actions += mapper.process([])
+    assert actions == [ActionEvent(CONFIRM, True, False, None)]
+
+
+def test_two_keys_for_one_action():
+    """Letting go of W while UP is still down keeps "up" held"""
+    mapper = InputMapper()
+    mapper.process([key(pygame.KEYDOWN, pygame.K_w), key(pygame.KEYDOWN, pygame.K_UP)])
+    assert mapper.process([key(pygame.KEYUP, pygame.K_w)]) == []
+    assert UP in mapper.held
+    assert mapper.process([key(pygame.KEYUP, pygame.K_UP)]) == [ActionEvent(UP, False, False, None)]
+    assert UP not in mapper.held
+
+
+def test_buffer_expires():
+    """A buffered command is kept for buffer_frames frames, then dropped"""
+    mapper = InputMapper(buffer_frames=3)
+    command = ActionEvent(UP, True, False, None)
+    mapper.buffer(command)
+    for _ in range(3):
+        mapper.process([])
+    assert mapper.take_buffered() == command
+    assert mapper.take_buffered() is None  # Taking it forgets it
+
+    mapper.buffer(command)
+    for _ in range(4):
+        mapper.process([])
+    assert mapper.take_buffered() is None
+
+
+if __name__ == "__main__":
+    test_press_and_release()
+    test_held_key_repeat_timing()
+    test_confirm_does_not_repeat()
+    test_two_keys_for_one_action()
+    test_buffer_expires()
+    print("All input action tests passed!")
@@ -0,0 +1,105 @@
+"""
+Input Recorder Test Script
+==========================
+
+This script checks the recording format: varints, signed numbers, every
+recorded event type, and that old (version 1) recordings still replay.
+No game window is needed, so it finishes instantly.
+
+RESOURCE: This demonstrates the systems.input_recorder module.
+"""
+
+import os
+import tempfile
+import pygame
+from systems.input_recorder import (write_varint, read_varint, zigzag, unzigzag, write_event,
+                                    read_event, ReplayInput, FINGER_SCALE)
+
+# A version 1 recording (before finger events existed), byte by byte
+VERSION_1_RECORDING = bytes(
+    [0x44, 0x4C, 0x52, 0x52, 0x01,   # "DLRR", version 1
+     0x07, 0x3C, 0xD8, 0x04,         # seed 7, 60 FPS, checkpoint every 600 frames
+     0x0C, 0xE8, 0x07, 0xBC, 0x05,   # frame: mouse moved by (500, 350), 1 event...
+     0x01, 0x0D, 0x00,               # ...KEYDOWN RETURN, no modifiers
+     0x0D,                           # 3 idle frames
+     0x08, 0x03, 0x01, 0xE8, 0x07, 0xA4, 0x08,  # frame: left click at (500, 530)
+     0x17] + [0] * 16                # end after 5 frames, final state hash
+)
+
+
+def round_trip(event):
+    """Write one event and read it back"""
+    out = bytearray()
+    write_event(out, event)
+    copy, offset = read_event(bytes(out), 0)
+    assert offset == len(out)
+    return copy
+
+
+def test_varints():
+    """Small numbers take one byte, big ones more, and all read back the same"""
+    for value, size in ((0, 1), (127, 1), (128, 2), (300, 2), (2 ** 64 - 1, 10)):
+        out = bytearray()
+        write_varint(out, value)
+        assert len(out) == size
+        assert read_varint(bytes(out) + b"\xff", 0) == (value, size)
+
+
+def test_zigzag():
+    """Signed numbers map to small unsigned ones and back"""
+    assert [zigzag(v) for v in (0, -1, 1, -2, 2)] == [0, 1, 2, 3, 4]
+    for value in (0, 1, -1, 63, -64, 1000, -1000, -2 ** 40):
+        assert unzigzag(zigzag(value)) == value
+
+
+def test_key_and_mouse_events():
+    """Keys keep their key and modifiers, clicks their button and position"""
+    for event_type in (pygame.KEYDOWN, pygame.KEYUP):
+        event = round_trip(pygame.event.Event(event_type, key=pygame.K_a, mod=pygame.KMOD_SHIFT))
+        assert (event.type, event.key, event.mod) == (event_type, pygame.K_a, pygame.KMOD_SHIFT)
+    for event_type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        event = round_trip(pygame.event.Event(event_type, button=3, pos=(-20, 699)))
+        assert (event.type, event.button, event.pos) == (event_type, 3, (-20, 699))
+    assert round_trip(pygame.event.Event(pygame.QUIT)).type == pygame.QUIT
+
+
+def test_finger_events():
+    """Finger events keep their ids, and positions to within one step"""
+    for event_type in (pygame.FINGERDOWN, pygame.FINGERMOTION, pygame.FINGERUP):
+        event = round_trip(pygame.event.Event(event_type, touch_id=-3, finger_id=2, x=0.25, y=0.8))
+        assert (event.type, event.touch_id, event.finger_id) == (event_type, -3, 2)
+        assert abs(event.x - 0.25) <= 1 / FINGER_SCALE and abs(event.y - 0.8) <= 1 / FINGER_SCALE
+    # Positions just outside the window are stored as its edge
+    event = round_trip(pygame.event.Event(pygame.FINGERMOTION, touch_id=0, finger_id=0, x=-0.1, y=1.5))
+    assert (event.x, event.y) == (0.0, 1.0)
+
+
+def test_replay_version_1():
+    """A version 1 recording still plays back frame by frame"""
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "old.dlr")
+        with open(path, "wb") as f:
+            f.write(VERSION_1_RECORDING)
+        replay = ReplayInput(path, verify=False)
+    assert (replay.seed, replay.fps, replay.checkpoint_interval) == (7, 60, 600)
+    frames = []
+    while True:
+        polled = replay.poll(None)
+        if polled is None:
+            break
+        frames.append((polled[0], [(e.type, getattr(e, "key", None), getattr(e, "pos", None)) for e in polled[1]]))
+    assert frames == [
+        ((500, 350), [(pygame.KEYDOWN, pygame.K_RETURN, None)]),
+        ((500, 350), []), ((500, 350), []), ((500, 350), []),
+        ((500, 350), [(pygame.MOUSEBUTTONDOWN, None, (500, 530))]),
+    ]
+    assert replay.finished and replay.total_frames == 5
+
+
+if __name__ == "__main__":
+    test_varints()
+    test_zigzag()
+    test_key_and_mouse_events()
+    test_finger_events()
+    test_replay_version_1()
+    print("All input recorder tests passed!")
@@ -0,0 +1,94 @@
+"""
+Quality Governor Test Script
+============================
+
+This script checks how the quality governor reacts to frame times: one
+step down per window of slow frames, and back up only after a long run of
+fast ones. It uses made-up frame times, so it finishes instantly.
+
+RESOURCE: This demonstrates the systems.quality_governor module.
+"""
+
+from config.constants import QUALITY_WINDOW, QUALITY_UP_FRAMES, QUALITY_UP_HEADROOM
+from systems.quality_governor import QualityGovernor, QUALITY_LEVELS, QUALITY_PRESETS
+
+BUDGET_MS = 10.0
+SLOW_MS = BUDGET_MS * 2
+FAST_MS = BUDGET_MS * QUALITY_UP_HEADROOM / 2
+IN_BETWEEN_MS = BUDGET_MS * (1 + QUALITY_UP_HEADROOM) / 2  # Under budget, but not by enough to step up
+
+
+def feed(governor, ms, frames):
+    for _ in range(frames):
+        governor.record(ms)
+
+
+def test_steps_down_once_per_window():
+    """Slow frames lower the quality by one level per full window, down to the lowest"""
+    governor = QualityGovernor(preset="auto", budget_ms=BUDGET_MS)
+    assert governor.level == "high"
+    feed(governor, SLOW_MS, QUALITY_WINDOW - 1)
+    assert governor.level == "high"
+    for expected in QUALITY_LEVELS[1:]:
+        feed(governor, SLOW_MS, QUALITY_WINDOW)
+        assert governor.level == expected
+    feed(governor, SLOW_MS, QUALITY_WINDOW * 3)
+    assert governor.level == "minimal"
+    assert governor.changes == len(QUALITY_LEVELS) - 1
+    assert governor.particles == QUALITY_PRESETS["minimal"]["particles"]
+
+
+def test_steps_up_only_after_up_frames():
+    """Fast frames raise the quality only after QUALITY_UP_FRAMES at the current level"""
+    governor = QualityGovernor(preset="auto", budget_ms=BUDGET_MS)
+    feed(governor, SLOW_MS, QUALITY_WINDOW)
+    assert governor.level == "medium"
+    # Under budget but inside the hysteresis gap: stays put however long it lasts
+    feed(governor, IN_BETWEEN_MS, QUALITY_UP_FRAMES * 2)
+    assert governor.level == "medium"
+
+    governor.lock(None)
+    feed(governor, SLOW_MS, QUALITY_WINDOW)
+    feed(governor, FAST_MS, QUALITY_UP_FRAMES - 1)
+    assert governor.level == "medium"
+    feed(governor, FAST_MS, 1)
+    assert governor.level == "high"
+
+
+def test_lock_and_adaptive():
+    """A locked preset ignores frame times; replays go back to the fixed preset"""
+    governor = QualityGovernor(preset="auto", budget_ms=BUDGET_MS)
+    governor.lock("low")
+    feed(governor, SLOW_MS, QUALITY_WINDOW * 5)
+    assert governor.level == "low" and not governor.button_glow
+
+    governor.lock(None)
+    feed(governor, SLOW_MS, QUALITY_WINDOW)
+    assert governor.level == "medium"
+    governor.set_adaptive(False)
+    assert governor.level == "high"
+    feed(governor, SLOW_MS, QUALITY_WINDOW * 5)
+    assert governor.level == "high"
+
+    try:
+        governor.lock("ultra")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("locked an unknown preset")
+
+
+def test_particle_count():
+    """Particle counts shrink with the level but never to zero"""
+    governor = QualityGovernor(preset="minimal")
+    assert governor.particle_count(20) == 3
+    assert governor.particle_count(1) == 1
+    assert governor.particle_count(0) == 0
+
+
+if __name__ == "__main__":
+    test_steps_down_once_per_window()
+    test_steps_up_only_after_up_frames()
+    test_lock_and_adaptive()
+    test_particle_count()
+    print("All quality governor tests passed!")
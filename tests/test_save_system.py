@@ -0,0 +1,78 @@
+"""
+Save System Test Script
+=======================
+
+This script checks the binary save format: packing a snapshot into bytes,
+reading it back, and refusing files that aren't saves or are damaged.
+No game window is needed, so it finishes instantly.
+
+RESOURCE: This demonstrates the systems.save_system module.
+"""
+
+from systems.save_system import (encode_snapshot, decode_snapshot, encode_area, decode_area,
+                                 make_bench_snapshot, HEADER_RECORD, SAVE_MAGIC, SAVE_VERSION)
+
+# A small version 1 save written by the first release of the format.
+# Decoding it must keep working in every later version of the game.
+VERSION_1_SAVE = bytes.fromhex(
+    "444c52530100870000005aafdeac789c636160f14d4c4f654bcb2f4a2d2e612bce484cc92f67cb484dcc29c960"
+    "606066d06060607808c401401c05c415403c0d887918d8183818be303230c401313b5084850104182f01690951"
+    "208311c46380928c8c4c0c1b80323a40be0d50c88d810b68383343052b03d81000111c1154"
+)
+VERSION_1_SNAPSHOT = {
+    "version": 1,
+    "player": ("Mage", 3, 40, 225, 80, 90, 120, 150, 12, 6, 8, 500, 350, 7, 4, 0, True, False),
+    "progress": (1234, 5400, True, False),
+    "world": (1, 0, ((1, 0, "forest", True, False,
+                      (("shadow", 1200, 300, 60, 70, 10, 3),),
+                      (("health", 1400, 500),)),)),
+}
+
+
+def expect_error(data, message):
+    """decode_snapshot must refuse the data with a ValueError mentioning `message`"""
+    try:
+        decode_snapshot(data)
+    except ValueError as e:
+        assert message in str(e), e
+    else:
+        raise AssertionError(f"decoded bad data without an error ({message})")
+
+
+def test_round_trip():
+    """A full-size save decodes back to exactly the snapshot that was saved"""
+    snapshot = make_bench_snapshot(level=10, world_size=5)
+    data = encode_snapshot(snapshot)
+    assert data[:4] == SAVE_MAGIC
+    assert decode_snapshot(data) == snapshot
+
+
+def test_area_blob_round_trip():
+    """Areas packed on their own (for stored areas) decode back the same"""
+    area = make_bench_snapshot(world_size=2)["world"][2][3]
+    assert decode_area(encode_area(area)) == area
+
+
+def test_rejects_bad_files():
+    """Files that aren't saves, are cut short or come from a newer game are refused"""
+    data = encode_snapshot(make_bench_snapshot())
+    expect_error(b"NOPE" + data[4:], "not a Dragon's Lair save file")
+    expect_error(data[:HEADER_RECORD.size - 1], "too short")
+    expect_error(data[:-10], "checksum")
+    _magic, _version, flags, raw_size, crc = HEADER_RECORD.unpack_from(data)
+    newer = HEADER_RECORD.pack(SAVE_MAGIC, SAVE_VERSION + 1, flags, raw_size, crc)
+    expect_error(newer + data[HEADER_RECORD.size:], "newer")
+
+
+def test_decode_version_1():
+    """A stored version 1 file still loads"""
+    assert VERSION_1_SAVE[4] == 1  # Version byte of the header
+    assert decode_snapshot(VERSION_1_SAVE) == VERSION_1_SNAPSHOT
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_area_blob_round_trip()
+    test_rejects_bad_files()
+    test_decode_version_1()
+    print("All save system tests passed!")
@@ -1,63 +1,121 @@
 # Action methods extracted from BattleScreen class
+# The combat rules live in systems/combat_engine.py; these methods ask the engine
+# what happened and then animate the events it returns.
 import random
+from config.constants import *
+from systems.combat_engine import player_action, enemy_turn
 
 # These functions are meant to be used as methods of BattleScreen, so they expect 'self' as the first argument.
 def execute_attack(self):
-    damage = self.player.strength
-    self.enemy.health -= damage
-    if self.player.type == "Mage":
-        self.add_log(f"Fireball dealt {damage} damage to {self.enemy.name}!")
-    elif self.player.type == "Rogue":
-        self.add_log(f"Knife throw dealt {damage} damage to {self.enemy.name}!")
-    else:
-        self.add_log(f"You dealt {damage} damage to {self.enemy.name}!")
-        if self.enemy.enemy_type == "fiery":
-            self.particle_system.add_explosion(700 + 30, 250 + 30, FIRE_COLORS[0], count=30, size_range=(2, 6), speed_range=(1, 4), lifetime_range=(15, 30))
-        elif self.enemy.enemy_type == "shadow":
-            self.particle_system.add_explosion(700 + 30, 250 + 30, SHADOW_COLORS[1], count=20, size_range=(3, 8), speed_range=(0.5, 2), lifetime_range=(20, 40))
-        else:
-            self.particle_system.add_explosion(700 + 30, 250 + 30, ICE_COLORS[2], count=25, size_range=(2, 5), speed_range=(1, 3), lifetime_range=(15, 25))
-    self.damage_target = "enemy"
-    self.damage_amount = damage
-    self.damage_effect_timer = 20
-    self.enemy.start_hit_animation()
-    self.add_screen_shake(5, 8)
-    self.state = "enemy_turn"
-    self.action_cooldown = self.action_delay
+    self.present_events(player_action(self.combat, "attack"))
 
 def execute_magic(self):
-    damage = self.player.strength * 2
-    self.enemy.health -= damage
-    self.player.mana -= 20
-    self.add_log(f"Fireball dealt {damage} damage to {self.enemy.name}!")
-    self.damage_target = "enemy"
-    self.damage_amount = damage
-    self.damage_effect_timer = 20
-    self.enemy.start_hit_animation()
-    self.add_screen_shake(8, 10)
-    self.particle_system.add_beam(200 + 25, 350 + 15, 700 + 30, 250 + 30, self.magic_effect['color'], width=5, particle_count=15, speed=3)
-    self.particle_system.add_explosion(700 + 30, 250 + 30, self.magic_effect['color'], count=40, size_range=(3, 7), speed_range=(1, 5), lifetime_range=(15, 30))
-    self.state = "enemy_turn"
-    self.action_cooldown = self.action_delay
+    self.present_events(player_action(self.combat, "magic"))
 
 def execute_item(self):
-    heal_amount = 30
-    self.player.health = min(self.player.max_health, self.player.health + heal_amount)
-    self.add_log(f"Restored {heal_amount} HP!")
-    for _ in range(20):
-        x = random.randint(200, 200 + PLAYER_SIZE)
-        y = random.randint(300, 300 + PLAYER_SIZE)
-        self.particle_system.add_particle(x, y, HEALTH_COLOR, (random.uniform(-0.5, 0.5), random.uniform(-1, -0.5)), 3, 30)
-    self.state = "enemy_turn"
-    self.action_cooldown = self.action_delay
+    self.present_events(player_action(self.combat, "item"))
 
 def execute_run(self):
-    if random.random() < 0.7:
-        self.add_log("You successfully escaped!")
+    self.present_events(player_action(self.combat, "run"))
+
+def execute_enemy_turn(self):
+    self.present_events(enemy_turn(self.combat))
+
+def present_events(self, events):
+    """
+    Queue engine events on the scheduler's "actions" track so they play back
+    one frame apart (or later, if an event asks the track to wait).
+    Args:
+        events (list): Events returned by the combat engine.
+    """
+    for event in events:
+        self.scheduler.queue(lambda event=event: self.play_event(event), delay=1, track="actions")
+
+def wait_for_continue(self):
+    """
+    Pause the "actions" track until the player dismisses the battle log.
+    """
+    if self.waiting_for_continue:
+        self.scheduler.hold("actions")
+
+def fast_forward(self):
+    """
+    Skip the remaining animations and play every queued step right away,
+    up to the player's next decision.
+    """
+    self.waiting_for_continue = False
+    self.projectiles.finish_all()
+    self.scheduler.skip_to_end("actions")
+
+def play_event(self, event):
+    """
+    Animate a single combat engine event and copy its result onto the
+    real player/enemy objects.
+    Args:
+        event (dict): Event returned by the combat engine.
+    Returns:
+        int: Frames the "actions" track should wait before the next step (or None).
+    """
+    kind = event["type"]
+    if kind == "log":
+        self.add_log(event["message"])
+    elif kind == "player_attack":
+        # The hit lands when the projectile (if any) reaches the enemy
+        return self.start_attack_animation()
+    elif kind == "player_magic":
+        self.start_magic_animation()
+    elif kind == "damage":
+        target = self.enemy if event["target"] == "enemy" else self.player
+        target.health = event["health"]
+        self.damage_target = event["target"]
+        self.damage_amount = event["amount"]
+        self.damage_effect_timer = 20
+        if event["target"] == "enemy":
+            self.enemy.start_hit_animation()
+            if event["source"] == "magic":
+                self.add_screen_shake(8, 10)
+                self.particle_system.add_beam(200 + 25, 350 + 15, 700 + 30, 250 + 30, self.magic_effect['color'], width=5, particle_count=15, speed=3)
+                self.particle_system.add_explosion(700 + 30, 250 + 30, self.magic_effect['color'], count=40, size_range=(3, 7), speed_range=(1, 5), lifetime_range=(15, 30))
+            else:
+                self.add_screen_shake(5, 8)
+                # Mage and Rogue impacts come from their projectiles
+                if self.player.type not in ("Mage", "Rogue"):
+                    if self.enemy.enemy_type == "fiery":
+                        self.particle_system.add_explosion(700 + 30, 250 + 30, FIRE_COLORS[0], count=30, size_range=(2, 6), speed_range=(1, 4), lifetime_range=(15, 30))
+                    elif self.enemy.enemy_type == "shadow":
+                        self.particle_system.add_explosion(700 + 30, 250 + 30, SHADOW_COLORS[1], count=20, size_range=(3, 8), speed_range=(0.5, 2), lifetime_range=(20, 40))
+                    else:
+                        self.particle_system.add_explosion(700 + 30, 250 + 30, ICE_COLORS[2], count=25, size_range=(2, 5), speed_range=(1, 3), lifetime_range=(15, 25))
+        else:
+            self.player.start_hit_animation()
+            self.add_screen_shake(3, 5)
+    elif kind == "heal":
+        self.player.health = event["health"]
+        for _ in range(20):
+            x = random.randint(200, 200 + PLAYER_SIZE)
+            y = random.randint(300, 300 + PLAYER_SIZE)
+            self.particle_system.add_particle(x, y, HEALTH_COLOR, (random.uniform(-0.5, 0.5), random.uniform(-1, -0.5)), 3, 30)
+    elif kind == "mana":
+        self.player.mana = event["mana"]
+    elif kind == "enemy_attack":
+        self.enemy.start_attack_animation()
+        # Elemental effect after dialog
+        self.scheduler.cancel(self.elemental_effect_timer)
+        self.pending_elemental_effect = event["element"]
+        self.elemental_effect_timer = self.scheduler.after(20, self.clear_elemental_effect)
+    elif kind == "turn":
+        self.state = event["turn"]
+        if self.state == "enemy_turn":
+            # The enemy moves once the player has read the log
+            self.scheduler.queue(self.wait_for_continue, track="actions")
+            self.scheduler.queue(self.execute_enemy_turn, track="actions")
+        return self.action_delay
+    elif kind == "battle_end":
         self.battle_ended = True
-        self.result = "escape"
+        self.result = event["result"]
         self.show_summary = True
-    else:
-        self.add_log("Escape failed! The enemy attacks!")
-        self.state = "enemy_turn"
-        self.action_cooldown = self.action_delay 
\ No newline at end of file
+        self.battle_log.close()
+
+def clear_elemental_effect(self):
+    self.pending_elemental_effect = None
+    self.elemental_effect_timer = None
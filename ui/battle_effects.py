@@ -1,6 +1,9 @@
 # Effect and animation methods extracted from BattleScreen class
 # These functions are designed to be used as methods of BattleScreen (pass self as first argument)
 import random
+import math
+from config.constants import *
+from systems.projectile_system import PROJECTILE_TYPES
 
 
 def add_screen_shake(self, intensity=5, duration=10):
@@ -18,68 +21,18 @@ def start_attack_animation(self):
     """
     Starts the attack animation for the player, including projectiles and particles
     based on the character class (Warrior, Mage, Rogue).
+    Returns:
+        int: Frames until the attack reaches the enemy (0 for melee attacks).
     """
     self.player.start_attack_animation()
     self.attack_effect_timer = 20
-    # Clear any existing projectiles to prevent stacking
-    if hasattr(self, 'fireball_projectile'):
-        delattr(self, 'fireball_projectile')
-    if hasattr(self, 'knife_projectile'):
-        delattr(self, 'knife_projectile')
     # Character-specific attack animations
     if self.player.type == "Mage":
         # Fireball attack animation
-        self.fireball_projectile = {
-            'active': True,
-            'x': 200 + 25,  # Player center
-            'y': 350 + 15,  # Player center
-            'target_x': 700 + 30,  # Enemy center
-            'target_y': 250 + 30,  # Enemy center
-            'speed': 56,  # Slightly faster than knife
-            'size': 12,
-            'color': random.choice(FIRE_COLORS),
-            'trail_particles': [],
-            'timer': 0,  # Timer for 0.8 seconds
-            'max_timer': 48  # 0.8 seconds at 60 FPS
-        }
-        # Create fireball trail particles
-        for _ in range(10):
-            angle = random.uniform(0, math.pi*2)
-            dist = random.uniform(0, 8)
-            px = self.fireball_projectile['x'] + math.cos(angle) * dist
-            py = self.fireball_projectile['y'] + math.sin(angle) * dist
-            self.particle_system.add_particle(
-                px, py, self.fireball_projectile['color'],
-                (math.cos(angle) * 0.3, math.sin(angle) * 0.3),
-                2, 20
-            )
+        return launch_projectile(self, "fireball")
     elif self.player.type == "Rogue":
         # Knife throw attack animation
-        self.knife_projectile = {
-            'active': True,
-            'x': 200 + 25,  # Player center
-            'y': 350 + 15,  # Player center
-            'target_x': 700 + 30,  # Enemy center
-            'target_y': 250 + 30,  # Enemy center
-            'speed': 48,  # 4 times faster (12 * 4)
-            'size': 16,  # 2 times bigger (8 * 2)
-            'rotation': 0,
-            'color': (100, 100, 100),  # Steel gray
-            'trail_particles': [],
-            'timer': 0,  # Timer for 0.6 seconds
-            'max_timer': 36  # 0.6 seconds at 60 FPS
-        }
-        # Create knife throw particles
-        for _ in range(8):
-            angle = random.uniform(0, math.pi*2)
-            dist = random.uniform(0, 6)
-            px = self.knife_projectile['x'] + math.cos(angle) * dist
-            py = self.knife_projectile['y'] + math.sin(angle) * dist
-            self.particle_system.add_particle(
-                px, py, (150, 150, 150),
-                (math.cos(angle) * 0.4, math.sin(angle) * 0.4),
-                1, 15
-            )
+        return launch_projectile(self, "knife")
     else:
         # Warrior/Paladin holy attack animation
         # Create holy energy particles around the player
@@ -97,6 +50,20 @@ def start_attack_animation(self):
                 (math.cos(angle) * 0.8, math.sin(angle) * 0.8),
                 4, 25
             )
+        return 0
+
+
+def launch_projectile(self, type_name, target_x=700 + 30, target_y=250 + 30):
+    """
+    Launches a projectile from the player's center towards a target (the enemy's center by default).
+    Args:
+        type_name (str): Projectile type from systems.projectile_system.PROJECTILE_TYPES.
+    Returns:
+        int: Frames until it hits (0 if the pool was full and nothing was launched).
+    """
+    if self.projectiles.spawn(type_name, 200 + 25, 350 + 15, target_x, target_y) is None:
+        return 0
+    return PROJECTILE_TYPES[type_name]["lifetime"]
 
 
 def start_magic_animation(self):
@@ -0,0 +1,170 @@
+# Layer caching helpers for BattleScreen
+# The battle scene is built from cached layers that are only redrawn when what
+# they show changes. Screen shake just moves where the combatant layers are blitted.
+# Projectile sprites are pre-rendered (and pre-rotated) here too.
+import pygame
+from config.constants import *
+
+
+class CachedLayer:
+    """
+    A surface that is redrawn only when its key changes.
+
+    Args:
+        size: (width, height) of the layer
+        draw_func: Function(surface) that draws the layer's contents
+        key_func: Function() returning anything comparable; a new value means "redraw"
+        alpha: Whether the layer needs per-pixel transparency
+    """
+
+    def __init__(self, size, draw_func, key_func, alpha=True):
+        flags = pygame.SRCALPHA if alpha else 0
+        self.surface = pygame.Surface(size, flags)
+        self.alpha = alpha
+        self.draw_func = draw_func
+        self.key_func = key_func
+        self.key = object()  # Never equal to a real key, so the first get() draws
+        self.redraws = 0
+
+    def get(self):
+        """Get the layer surface, redrawing it first if its key changed"""
+        key = self.key_func()
+        if key != self.key:
+            if self.alpha:
+                self.surface.fill((0, 0, 0, 0))
+            self.draw_func(self.surface)
+            self.key = key
+            self.redraws += 1
+        return self.surface
+
+    def invalidate(self):
+        """Force a redraw on the next get()"""
+        self.key = object()
+
+
+def draw_entity_at(entity, surface, x, y):
+    """
+    Draw a character or enemy onto a layer at layer coordinates,
+    restoring its real position afterwards.
+    """
+    original_x, original_y = entity.x, entity.y
+    entity.x, entity.y = x, y
+    entity.draw(surface)
+    entity.x, entity.y = original_x, original_y
+
+
+def animation_key(entity):
+    """Key describing how an entity currently looks (offset in whole pixels, animation frames)"""
+    return (int(getattr(entity, 'animation_offset', 0)),
+            getattr(entity, 'attack_animation', 0),
+            getattr(entity, 'hit_animation', 0))
+
+
+class RotationCache:
+    """
+    A sprite pre-rotated to a fixed number of angles.
+    get() picks the nearest angle, so nothing is rotated while drawing.
+    """
+
+    def __init__(self, surface, steps=ROTATION_CACHE_STEPS):
+        self.step = 360 / steps
+        self.frames = []
+        for i in range(steps):
+            rotated = pygame.transform.rotate(surface, i * self.step)
+            # Store the offset from the sprite's center to its top-left corner
+            self.frames.append((rotated, (rotated.get_width() // 2, rotated.get_height() // 2)))
+
+    def get(self, angle):
+        """Get (surface, center offset) for the angle nearest to `angle` (degrees)"""
+        return self.frames[int(round(angle / self.step)) % len(self.frames)]
+
+
+def draw_orb_sprite(size, color):
+    """Draw a glowing orb (fireball) centered in its own surface"""
+    radius = size + 9  # Outermost glow ring
+    orb = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    # Outer glow
+    for i in range(3, 0, -1):
+        glow_size = size + i * 3
+        glow_alpha = 100 - i * 30
+        glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(glow_surf, (*color[:3], glow_alpha), (glow_size, glow_size), glow_size)
+        orb.blit(glow_surf, (radius - glow_size, radius - glow_size))
+    # Main fireball
+    pygame.draw.circle(orb, color, (radius, radius), size)
+    pygame.draw.circle(orb, (255, 255, 200), (radius, radius), size // 2)
+    return orb
+
+
+def draw_knife_sprite(size, color):
+    """Draw a knife pointing up, centered in a (size * 2) square surface"""
+    knife_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    # Knife blade (pointed oval)
+    blade_points = [
+        (size, 0),  # Tip
+        (size - 4, size // 2),  # Top edge
+        (size - 2, size),  # Bottom edge
+        (size + 2, size),  # Bottom edge
+        (size + 4, size // 2),  # Top edge
+    ]
+    pygame.draw.polygon(knife_surf, color, blade_points)
+    # Knife handle
+    handle_rect = pygame.Rect(size - 2, size, 4, size // 2)
+    pygame.draw.rect(knife_surf, (139, 69, 19), handle_rect)  # Brown handle
+    # Metallic shine on the blade
+    shine_points = [
+        (size, 2),  # Tip shine
+        (size - 2, size // 2 - 2),  # Top shine
+        (size + 2, size // 2 - 2),  # Top shine
+    ]
+    pygame.draw.polygon(knife_surf, (200, 200, 200), shine_points)
+    return knife_surf
+
+
+class ProjectileSprites:
+    """
+    Pre-rendered projectile sprites, one set per (projectile type, color).
+
+    Orbs are drawn once per color; spinning sprites (like the knife) are also
+    pre-rotated with RotationCache. Sprites are shared by every battle.
+    """
+
+    def __init__(self):
+        self.sprites = {}
+
+    def prepare(self, types):
+        """Render every color of every projectile type ahead of time"""
+        for name, definition in types.items():
+            for color in definition["colors"]:
+                if (name, color) not in self.sprites:
+                    self._build(name, definition, color)
+
+    def get(self, name, definition, color, angle=0):
+        """
+        Get (surface, center offset) to draw a projectile.
+
+        Args:
+            name: Projectile type name
+            definition: Its entry in PROJECTILE_TYPES
+            color: The projectile's color
+            angle: Its rotation in degrees
+        """
+        sprite = self.sprites.get((name, color))
+        if sprite is None:
+            sprite = self._build(name, definition, color)
+        if isinstance(sprite, RotationCache):
+            return sprite.get(angle)
+        return sprite
+
+    def _build(self, name, definition, color):
+        size = definition["size"]
+        if definition["sprite"] == "knife":
+            sprite = RotationCache(draw_knife_sprite(size, color))
+        else:
+            orb = draw_orb_sprite(size, color)
+            sprite = (orb, (orb.get_width() // 2, orb.get_height() // 2))
+        self.sprites[(name, color)] = sprite
+        return sprite
+
+
+projectile_sprites = ProjectileSprites()
@@ -1,4 +1,120 @@
 # Battle log management extracted from BattleScreen class
+# BattleLog keeps only the most recent messages (a ring buffer) and renders each
+# page of the log to a surface once, when that page changes.
+import os
+import queue
+import threading
+import time
+from collections import deque
+
+import pygame
+from config.constants import *
+
+
+class BattleLog:
+    """
+    Fixed-size battle log with paged, pre-rendered views.
+
+    Only the newest `capacity` messages are kept. Page 0 is the newest
+    `lines_per_page` messages, page 1 the ones before that, and so on.
+    A rendered page is cached until a new message changes it, so drawing
+    the log costs one blit per frame.
+
+    If `archive_dir` is set, every message is also written to a text file in
+    that folder by a background thread, so the full fight can be read later.
+    """
+
+    def __init__(self, messages=(), capacity=BATTLE_LOG_CAPACITY, lines_per_page=3,
+                 archive_dir=BATTLE_LOG_ARCHIVE_DIR):
+        self.entries = deque(maxlen=capacity)
+        self.lines_per_page = lines_per_page
+        self.total_messages = 0  # Every message ever added (also counts dropped ones)
+        self._page_cache = {}    # page -> (total_messages when rendered, surface)
+        self._archive_queue = None
+        if archive_dir:
+            self._start_archive(archive_dir)
+        for message in messages:
+            self.append(message)
+
+    def append(self, message):
+        """Add a message (the oldest one is dropped when the log is full)"""
+        self.entries.append(message)
+        self.total_messages += 1
+        if self._archive_queue is not None:
+            self._archive_queue.put(message)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self.entries)[index]
+        return self.entries[index]
+
+    def page_count(self):
+        return max(1, -(-len(self.entries) // self.lines_per_page))
+
+    def get_page(self, page=0):
+        """
+        Get the messages shown on a page.
+
+        The newest page always shows the last `lines_per_page` messages, so new
+        messages scroll in one line at a time. Older pages step back a whole page.
+        """
+        page = max(0, min(page, self.page_count() - 1))
+        end = len(self.entries) - page * self.lines_per_page
+        start = max(0, end - self.lines_per_page)
+        return [self.entries[i] for i in range(start, end)]
+
+    def render_page(self, font, color, page=0, line_height=30):
+        """
+        Get a page of the log as a transparent surface (rendered only when it changed).
+        """
+        cached = self._page_cache.get(page)
+        if cached and cached[0] == self.total_messages:
+            return cached[1]
+        lines = self.get_page(page)
+        surface = pygame.Surface((760, self.lines_per_page * line_height), pygame.SRCALPHA)
+        for i, line in enumerate(lines):
+            surface.blit(font.render(line, True, color), (0, i * line_height))
+        self._page_cache[page] = (self.total_messages, surface)
+        return surface
+
+    def _start_archive(self, archive_dir):
+        """Open a background thread that writes every message to a log file"""
+        try:
+            os.makedirs(archive_dir, exist_ok=True)
+        except OSError as e:
+            print(f"Battle log archive disabled: {e}")
+            return
+        path = os.path.join(archive_dir, time.strftime("battle_%Y%m%d_%H%M%S.log"))
+        self.archive_path = path
+        self._archive_queue = queue.Queue()
+        self._archive_thread = threading.Thread(target=self._archive_worker, args=(path,), daemon=True)
+        self._archive_thread.start()
+
+    def _archive_worker(self, path):
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                while True:
+                    message = self._archive_queue.get()
+                    if message is None:
+                        break
+                    f.write(message + "\n")
+                    # Write out whatever has piled up before waiting again
+                    if self._archive_queue.empty():
+                        f.flush()
+        except OSError as e:
+            print(f"Could not write battle log archive: {e}")
+
+    def close(self):
+        """Finish writing the archive (if there is one)"""
+        if self._archive_queue is not None:
+            self._archive_queue.put(None)
+            self._archive_queue = None
 
 
 def add_log(self, message):
@@ -8,6 +124,18 @@ def add_log(self, message):
         message (str): The message to display in the battle log.
     """
     self.battle_log.append(message)
+    self.log_page = 0  # Jump back to the newest messages
     self.waiting_for_continue = True
 
-# (Add any additional log formatting or paging helpers here as needed) 
\ No newline at end of file
+def continue_log(self):
+    """
+    Dismisses the "press to continue" prompt and lets queued battle actions resume.
+    """
+    self.waiting_for_continue = False
+    self.scheduler.release("actions")
+
+def scroll_log(self, pages):
+    """
+    Scrolls the battle log view back (positive) or forward (negative) by whole pages.
+    """
+    self.log_page = max(0, min(self.log_page + pages, self.battle_log.page_count() - 1))
@@ -13,6 +13,16 @@ The BattleScreen handles:
 - Screen shake and visual effects
 - Battle log and UI management
 - Victory/defeat conditions
+
+Combat rules (damage, healing, escaping, the enemy's turn) are not decided
+here: they run in systems.combat_engine, and BattleScreen acts as the
+presenter that animates the events the engine returns. The animation steps
+and their timing run on a systems.action_scheduler.ActionScheduler.
+
+Drawing uses cached layers (ui/battle_layers.py): a static backdrop, one
+sprite layer per combatant that is redrawn only when its animation changes,
+a status layer for the health bars, and the moving effects drawn on top.
+Screen shake just offsets where the combatant layers are blitted.
 """
 
 import pygame
@@ -23,10 +33,22 @@ from ui.button import Button
 from systems.particle_system import ParticleSystem
 
 # Import extracted battle components
-from ui.battle_actions import execute_attack, execute_magic, execute_item, execute_run
-from ui.battle_effects import add_screen_shake, start_attack_animation, start_magic_animation
-from ui.battle_log import add_log
+from ui.battle_actions import (execute_attack, execute_magic, execute_item, execute_run,
+                               execute_enemy_turn, present_events, play_event,
+                               wait_for_continue, fast_forward, clear_elemental_effect)
+from ui.battle_effects import (add_screen_shake, start_attack_animation, start_magic_animation,
+                               launch_projectile)
+from ui.battle_log import BattleLog, add_log, continue_log, scroll_log
 from ui.battle_ui import create_battle_buttons
+from ui.battle_layers import CachedLayer, draw_entity_at, animation_key, projectile_sprites
+from systems.combat_engine import CombatState, ACTIONS, MAGIC_MANA_COST
+from systems.action_scheduler import ActionScheduler
+from systems.projectile_system import ProjectilePool, PROJECTILE_TYPES
+from systems.frame_profiler import profiler
+from systems.input_actions import UP, DOWN, LEFT, RIGHT, CONFIRM, TALK, CLICK
+
+# How each direction moves the highlight around the 2x2 action buttons
+SELECTION_MOVES = {RIGHT: 1, LEFT: -1, UP: -2, DOWN: 2}
 
 
 class BattleScreen:
@@ -42,18 +64,40 @@ class BattleScreen:
     - Battle log and UI management
     """
     
-    def __init__(self, player, enemy):
+    # Methods extracted into the battle_* helper modules
+    execute_attack = execute_attack
+    execute_magic = execute_magic
+    execute_item = execute_item
+    execute_run = execute_run
+    execute_enemy_turn = execute_enemy_turn
+    present_events = present_events
+    play_event = play_event
+    wait_for_continue = wait_for_continue
+    fast_forward = fast_forward
+    clear_elemental_effect = clear_elemental_effect
+    add_screen_shake = add_screen_shake
+    start_attack_animation = start_attack_animation
+    start_magic_animation = start_magic_animation
+    launch_projectile = launch_projectile
+    add_log = add_log
+    continue_log = continue_log
+    scroll_log = scroll_log
+    
+    def __init__(self, player, enemy, rng=None):
         """
         Initialize the battle screen with player and enemy.
         
         Args:
             player: The player character object
             enemy: The enemy character object
+            rng: Optional random.Random for the combat rolls
         """
         self.player = player
         self.enemy = enemy
+        # Rendering-free combat rules; this screen only animates its events
+        self.combat = CombatState(player, enemy, rng=rng)
         self.state = "player_turn"
-        self.battle_log = ["Battle started!", "It's your turn!"]
+        self.battle_log = BattleLog(["Battle started!", "It's your turn!"], lines_per_page=3)
         
         # Create battle buttons using the extracted UI helper
         self.buttons = create_battle_buttons()
@@ -68,14 +112,17 @@ class BattleScreen:
         self.damage_effect_timer = 0
         self.damage_target = None
         self.damage_amount = 0
-        self.action_cooldown = 0
-        self.action_delay = 30
-        self.log_page = 0
-        self.log_lines_per_page = 3
+        # Timed steps: the "actions" track plays the turn sequence, and
+        # one-shot timers handle projectile impacts and elemental effects
+        self.scheduler = ActionScheduler()
+        self.action_delay = 30  # Frames between a turn ending and the next one starting
+        self.log_page = 0  # 0 = newest messages, higher = further back
+        self.log_lines_per_page = self.battle_log.lines_per_page
+        self.continue_text = font_small.render("(Press ENTER to continue...)", True, (255, 215, 0))
         self.waiting_for_continue = False
-        self.action_steps = []
         self.particle_system = ParticleSystem()
         self.screen_shake = 0
+        self.shake_intensity = 0
         self.attack_effect_timer = 0
         
         # Magic effect system
@@ -90,13 +137,75 @@ class BattleScreen:
         # Check if this is a boss battle
         self.is_boss = hasattr(self.enemy, 'enemy_type') and "boss_dragon" in self.enemy.enemy_type
         self.pending_elemental_effect = None
-        self.elemental_effect_timer = 0
+        self.elemental_effect_timer = None
+        
+        # Cached render layers
+        self.frame_count = 0
+        self._build_layers()
+        
+        # Projectiles in flight (fireballs, knives, ...)
+        self.projectiles = ProjectilePool(self.particle_system)
+        projectile_sprites.prepare(PROJECTILE_TYPES)  # Only renders sprites not made yet
         
     def start_transition(self):
         """Start the battle transition animation."""
         self.transition_state = "in"
         self.transition_alpha = 0
         
+    def _build_layers(self):
+        """Create the cached layers the battle scene is composed from."""
+        # Static backdrop: background color and the battle log panel
+        self.backdrop = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.backdrop.fill((20, 10, 40))  # Dark purple background
+        pygame.draw.rect(self.backdrop, UI_BG, (100, 50, 800, 100), border_radius=8)
+        pygame.draw.rect(self.backdrop, UI_BORDER, (100, 50, 800, 100), 3, border_radius=8)
+        pygame.draw.rect(self.backdrop, (30, 30, 50), (180, 410, 160, 20))
+        if not self.is_boss:
+            pygame.draw.rect(self.backdrop, (30, 30, 50), (680, 310, 160, 20))
+        
+        # Player sprite: redrawn only when its pose changes
+        pad = BATTLE_SPRITE_PADDING
+        self.player_layer = CachedLayer(
+            (PLAYER_SIZE + pad * 2, PLAYER_SIZE + pad * 2),
+            lambda layer: draw_entity_at(self.player, layer, pad, pad),
+            lambda: animation_key(self.player))
+        
+        # Enemy sprite: bosses draw across the whole screen (fire breath),
+        # regular enemies flicker a few times per second
+        if self.is_boss:
+            self.enemy_layer = CachedLayer(
+                (SCREEN_WIDTH, SCREEN_HEIGHT),
+                lambda layer: self._draw_enemy(layer, 700, 250),
+                lambda: (pygame.time.get_ticks() // BOSS_LAYER_INTERVAL_MS, animation_key(self.enemy)))
+            self.enemy_layer_pos = (0, 0)
+        else:
+            self.enemy_layer = CachedLayer(
+                (60 + pad * 2, 60 + pad * 2),
+                lambda layer: self._draw_enemy(layer, pad, pad),
+                lambda: self.frame_count // ENEMY_FLICKER_FRAMES)
+            self.enemy_layer_pos = (700 - pad, 250 - pad)
+        
+        # Health bars and names: redrawn only when health changes
+        self.status_layer = CachedLayer(
+            (SCREEN_WIDTH, SCREEN_HEIGHT), self._draw_status,
+            lambda: (self.player.health, self.player.max_health,
+                     self.enemy.health, self.enemy.max_health))
+        
+        # Warrior slash effect is the same every time, so it's drawn once when first needed
+        self.slash_layer = None
+        
+        # Red flash over whoever was hit, and the last damage number rendered
+        self.damage_flash = {}
+        for target, size in (("player", PLAYER_SIZE), ("enemy", ENEMY_SIZE)):
+            flash = pygame.Surface((size, size), pygame.SRCALPHA)
+            flash.fill((255, 0, 0, 100))
+            self.damage_flash[target] = flash
+        self.damage_text = (None, None)
+        
+        # Reused overlay for the fade transition
+        self.transition_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.transition_overlay.fill((0, 0, 0))
+        
     def draw(self, surface):
         """
         Draw the complete battle screen including characters, UI, and effects.
@@ -104,6 +213,8 @@ class BattleScreen:
         Args:
             surface: The pygame surface to draw on
         """
+        self.frame_count += 1
+        
         # Calculate screen shake offset
         shake_offset_x = 0
         shake_offset_y = 0
@@ -112,65 +223,50 @@ class BattleScreen:
             shake_offset_y = random.randint(-self.shake_intensity, self.shake_intensity)
             self.screen_shake -= 1
         
-        # Create temporary surface for drawing
-        temp_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        temp_surface.fill((20, 10, 40))  # Dark purple background
+        # Static backdrop
+        surface.blit(self.backdrop, (0, 0))
         
-        # Draw player and enemy avatars
+        # Player and enemy sprites (shake only moves where they are blitted)
         player_x, player_y = 200 + shake_offset_x, 350 + shake_offset_y
         enemy_x, enemy_y = 700 + shake_offset_x, 250 + shake_offset_y
-        
-        # Draw the player using the same character drawing method as overworld
-        # Temporarily set the player's position for battle drawing
-        original_x, original_y = self.player.x, self.player.y
-        self.player.x, self.player.y = player_x, player_y
-        
-        # Draw the player directly to the battle surface
-        self.player.draw(temp_surface)
-        
-        # Restore original position
-        self.player.x, self.player.y = original_x, original_y
-        
-        # Draw enemy based on type
-        self._draw_enemy(temp_surface, enemy_x, enemy_y)
+        pad = BATTLE_SPRITE_PADDING
+        surface.blit(self.player_layer.get(), (player_x - pad, player_y - pad))
+        surface.blit(self.enemy_layer.get(), (self.enemy_layer_pos[0] + shake_offset_x,
+                                              self.enemy_layer_pos[1] + shake_offset_y))
         
         # Draw character-specific attack effects
-        self._draw_attack_effects(temp_surface, player_x, player_y, enemy_x, enemy_y)
+        self._draw_attack_effects(surface, shake_offset_x, shake_offset_y)
         
         # Draw magic effect
-        self._draw_magic_effect(temp_surface)
+        self._draw_magic_effect(surface)
         
         # Draw projectiles
-        self._draw_projectiles(temp_surface)
+        t = profiler.start()
+        self._draw_projectiles(surface)
+        profiler.stop("battle.projectiles.draw", t)
         
         # Draw UI elements
-        self._draw_ui_elements(temp_surface, player_x, player_y, enemy_x, enemy_y)
+        self._draw_ui_elements(surface, player_x, player_y, enemy_x, enemy_y)
         
         # Draw particles
-        self.particle_system.draw(temp_surface)
+        t = profiler.start()
+        self.particle_system.draw(surface)
+        profiler.stop("battle.particles.draw", t)
         
         # Draw transition overlay if active
         if self.transition_state != "none":
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, self.transition_alpha))
-            temp_surface.blit(overlay, (0, 0))
+            self.transition_overlay.set_alpha(self.transition_alpha)
+            surface.blit(self.transition_overlay, (0, 0))
             
         # Show summary after battle
         if self.battle_ended and self.show_summary:
-            self._draw_battle_summary(temp_surface)
-        
-        # Draw the temporary surface to the screen
-        surface.blit(temp_surface, (0, 0))
+            self._draw_battle_summary(surface)
 
     def _draw_enemy(self, surface, enemy_x, enemy_y):
         """Draw the enemy based on its type."""
-        if hasattr(self.enemy, 'enemy_type') and "boss_dragon" in self.enemy.enemy_type:
+        if self.is_boss:
             # Draw the boss using its own draw method
-            boss_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            self.enemy.x = enemy_x
-            self.enemy.y = enemy_y
-            self.enemy.draw(boss_surf)
-            surface.blit(boss_surf, (0, 0))
+            draw_entity_at(self.enemy, surface, enemy_x, enemy_y)
         elif self.enemy.enemy_type == "fiery":
             # Draw fiery enemy
             pygame.draw.ellipse(surface, (220, 80, 0), (enemy_x, enemy_y, 60, 60))
@@ -212,61 +308,74 @@ class BattleScreen:
             pygame.draw.circle(surface, (0, 100, 200), (enemy_x + 20, enemy_y + 25), 6)
             pygame.draw.circle(surface, (0, 100, 200), (enemy_x + 40, enemy_y + 25), 6)
 
-    def _draw_attack_effects(self, surface, player_x, player_y, enemy_x, enemy_y):
+    def _draw_attack_effects(self, surface, shake_offset_x, shake_offset_y):
         """Draw character-specific attack effects."""
         if self.attack_effect_timer > 0:
             if self.player.type == "Warrior":
-                # Holy slash effect for Warrior/Paladin
-                effect_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                
-                # Multiple holy slashes with different angles and colors
-                slash_angles = [0, 15, -15, 30, -30]
-                for i, angle in enumerate(slash_angles):
-                    # Calculate slash start and end points
-                    start_x = player_x + 25
-                    start_y = player_y + 15
-                    end_x = start_x + math.cos(math.radians(angle)) * 80
-                    end_y = start_y + math.sin(math.radians(angle)) * 80
-                    
-                    # Holy slash colors (gold, white, light blue)
-                    slash_colors = [(255, 215, 0, 200), (255, 255, 255, 180), (173, 216, 230, 160)]
-                    color = slash_colors[i % len(slash_colors)]
-                    
-                    # Draw the slash with glow effect
-                    for width in range(8, 2, -2):
-                        alpha = color[3] - (8 - width) * 20
-                        glow_color = (*color[:3], max(0, alpha))
-                        pygame.draw.line(effect_surf, glow_color, (start_x, start_y), (end_x, end_y), width)
-                
-                # Add enemy-side slash effect
-                enemy_slash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                
-                # Draw impact slashes on enemy
-                impact_angles = [0, 20, -20, 40, -40]
-                for i, angle in enumerate(impact_angles):
-                    # Calculate impact slash points
-                    center_x = enemy_x + 30
-                    center_y = enemy_y + 30
-                    start_x = center_x - math.cos(math.radians(angle)) * 25
-                    start_y = center_y - math.sin(math.radians(angle)) * 25
-                    end_x = center_x + math.cos(math.radians(angle)) * 25
-                    end_y = center_y + math.sin(math.radians(angle)) * 25
-                    
-                    # Impact slash colors (brighter versions)
-                    impact_colors = [(255, 255, 100, 250), (255, 255, 255, 220), (200, 230, 255, 200)]
-                    color = impact_colors[i % len(impact_colors)]
-                    
-                    # Draw impact slash with glow
-                    for width in range(10, 3, -2):
-                        alpha = color[3] - (10 - width) * 25
-                        glow_color = (*color[:3], max(0, alpha))
-                        pygame.draw.line(enemy_slash_surf, glow_color, (start_x, start_y), (end_x, end_y), width)
-                
-                surface.blit(effect_surf, (0, 0))
-                surface.blit(enemy_slash_surf, (0, 0))
+                if self.slash_layer is None:
+                    self.slash_layer = self._build_slash_layer()
+                slash_surf, slash_pos = self.slash_layer
+                surface.blit(slash_surf, (slash_pos[0] + shake_offset_x, slash_pos[1] + shake_offset_y))
             
             self.attack_effect_timer -= 1
 
+    def _build_slash_layer(self):
+        """
+        Draw the Warrior's holy slash effect once, cropped to where it has pixels.
+        
+        Returns:
+            tuple: (surface, (x, y)) where to blit it when there's no shake
+        """
+        # Holy slash effect for Warrior/Paladin
+        effect_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+
+        # Multiple holy slashes with different angles and colors
+        slash_angles = [0, 15, -15, 30, -30]
+        for i, angle in enumerate(slash_angles):
+            # Calculate slash start and end points
+            start_x = 200 + 25
+            start_y = 350 + 15
+            end_x = start_x + math.cos(math.radians(angle)) * 80
+            end_y = start_y + math.sin(math.radians(angle)) * 80
+
+            # Holy slash colors (gold, white, light blue)
+            slash_colors = [(255, 215, 0, 200), (255, 255, 255, 180), (173, 216, 230, 160)]
+            color = slash_colors[i % len(slash_colors)]
+
+            # Draw the slash with glow effect
+            for width in range(8, 2, -2):
+                alpha = color[3] - (8 - width) * 20
+                glow_color = (*color[:3], max(0, alpha))
+                pygame.draw.line(effect_surf, glow_color, (start_x, start_y), (end_x, end_y), width)
+
+        # Add enemy-side slash effect
+        enemy_slash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+
+        # Draw impact slashes on enemy
+        impact_angles = [0, 20, -20, 40, -40]
+        for i, angle in enumerate(impact_angles):
+            # Calculate impact slash points
+            center_x = 700 + 30
+            center_y = 250 + 30
+            start_x = center_x - math.cos(math.radians(angle)) * 25
+            start_y = center_y - math.sin(math.radians(angle)) * 25
+            end_x = center_x + math.cos(math.radians(angle)) * 25
+            end_y = center_y + math.sin(math.radians(angle)) * 25
+
+            # Impact slash colors (brighter versions)
+            impact_colors = [(255, 255, 100, 250), (255, 255, 255, 220), (200, 230, 255, 200)]
+            color = impact_colors[i % len(impact_colors)]
+
+            # Draw impact slash with glow
+            for width in range(10, 3, -2):
+                alpha = color[3] - (10 - width) * 25
+                glow_color = (*color[:3], max(0, alpha))
+                pygame.draw.line(enemy_slash_surf, glow_color, (start_x, start_y), (end_x, end_y), width)
+
+        effect_surf.blit(enemy_slash_surf, (0, 0))
+        rect = effect_surf.get_bounding_rect()
+        return effect_surf.subsurface(rect).copy(), rect.topleft
+
     def _draw_magic_effect(self, surface):
         """Draw magic effect circles."""
         if self.magic_effect['active']:
@@ -285,78 +394,26 @@ class BattleScreen:
                              (self.magic_effect['x'], self.magic_effect['y']), 8)
 
     def _draw_projectiles(self, surface):
-        """Draw fireball and knife projectiles."""
-        # Draw fireball projectile
-        if hasattr(self, 'fireball_projectile') and self.fireball_projectile['active'] and not self.fireball_projectile.get('hit', False):
-            # Draw fireball with glow effect
-            x, y = int(self.fireball_projectile['x']), int(self.fireball_projectile['y'])
-            size = self.fireball_projectile['size']
-            color = self.fireball_projectile['color']
-            
-            # Outer glow
-            for i in range(3, 0, -1):
-                glow_size = size + i * 3
-                glow_alpha = 100 - i * 30
-                glow_color = (*color[:3], glow_alpha)
-                glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, glow_color, (glow_size, glow_size), glow_size)
-                surface.blit(glow_surf, (x - glow_size, y - glow_size))
-            
-            # Main fireball
-            pygame.draw.circle(surface, color, (x, y), size)
-            pygame.draw.circle(surface, (255, 255, 200), (x, y), size // 2)
-        
-        # Draw knife projectile
-        if hasattr(self, 'knife_projectile') and self.knife_projectile['active'] and not self.knife_projectile.get('hit', False):
-            x, y = int(self.knife_projectile['x']), int(self.knife_projectile['y'])
-            size = self.knife_projectile['size']
-            rotation = self.knife_projectile['rotation']
-            color = self.knife_projectile['color']
-            
-            # Create knife surface for rotation
-            knife_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            
-            # Draw knife blade (pointed oval) - scaled for larger size
-            blade_points = [
-                (size, 0),  # Tip
-                (size - 4, size // 2),  # Top edge
-                (size - 2, size),  # Bottom edge
-                (size + 2, size),  # Bottom edge
-                (size + 4, size // 2),  # Top edge
-            ]
-            pygame.draw.polygon(knife_surf, color, blade_points)
-            
-            # Draw knife handle - scaled for larger size
-            handle_rect = pygame.Rect(size - 2, size, 4, size // 2)
-            pygame.draw.rect(knife_surf, (139, 69, 19), handle_rect)  # Brown handle
-            
-            # Add metallic shine to blade
-            shine_points = [
-                (size, 2),  # Tip shine
-                (size - 2, size // 2 - 2),  # Top shine
-                (size + 2, size // 2 - 2),  # Top shine
-            ]
-            pygame.draw.polygon(knife_surf, (200, 200, 200), shine_points)
-            
-            # Rotate and draw
-            rotated_knife = pygame.transform.rotate(knife_surf, rotation)
-            knife_rect = rotated_knife.get_rect(center=(x, y))
-            surface.blit(rotated_knife, knife_rect)
+        """Draw every projectile in flight using the pre-rendered sprites."""
+        pool = self.projectiles
+        for slot in pool.active_slots():
+            sprite, (offset_x, offset_y) = projectile_sprites.get(
+                pool.type_names[pool.kind[slot]], pool.get_type(slot),
+                pool.colors[slot], pool.rotation[slot])
+            surface.blit(sprite, (int(pool.x[slot]) - offset_x, int(pool.y[slot]) - offset_y))
 
-    def _draw_ui_elements(self, surface, player_x, player_y, enemy_x, enemy_y):
-        """Draw UI elements like health bars, battle log, and buttons."""
+    def _draw_status(self, surface):
+        """Draw the health bars and enemy name onto the status layer."""
         # Draw health bars
         player_health_width = 150 * (self.player.health / max(1, self.player.max_health))
-        pygame.draw.rect(surface, (30, 30, 50), (180, 410, 160, 20))
         pygame.draw.rect(surface, HEALTH_COLOR, (182, 412, player_health_width, 16))
         player_text = font_small.render(f"{self.player.health}/{self.player.max_health}", True, TEXT_COLOR)
         text_rect = player_text.get_rect(center=(180 + 80, 410 + 10))
         surface.blit(player_text, text_rect)
         
         # Only draw enemy health bar and name if not a boss dragon
-        if not (hasattr(self.enemy, 'enemy_type') and "boss_dragon" in self.enemy.enemy_type):
+        if not self.is_boss:
             enemy_health_width = 150 * (self.enemy.health / max(1, self.enemy.max_health))
-            pygame.draw.rect(surface, (30, 30, 50), (680, 310, 160, 20))
             pygame.draw.rect(surface, HEALTH_COLOR, (682, 312, enemy_health_width, 16))
             enemy_text = font_small.render(f"{self.enemy.health}/{self.enemy.max_health}", True, TEXT_COLOR)
             text_rect = enemy_text.get_rect(center=(680 + 80, 310 + 10))
@@ -364,23 +421,20 @@ class BattleScreen:
             
             # Draw enemy name (not for boss)
             enemy_name = font_small.render(self.enemy.name, True, (255, 215, 0))
-            name_rect = enemy_name.get_rect(midtop=(enemy_x + 30, enemy_y - 25))
+            name_rect = enemy_name.get_rect(midtop=(700 + 30, 250 - 25))
             surface.blit(enemy_name, name_rect)
+
+    def _draw_ui_elements(self, surface, player_x, player_y, enemy_x, enemy_y):
+        """Draw UI elements like health bars, battle log, and buttons."""
+        # Health bars and names (cached until health changes)
+        surface.blit(self.status_layer.get(), (0, 0))
         
-        # Draw battle log
-        pygame.draw.rect(surface, UI_BG, (100, 50, 800, 100), border_radius=8)
-        pygame.draw.rect(surface, UI_BORDER, (100, 50, 800, 100), 3, border_radius=8)
-        
-        start_idx = max(0, len(self.battle_log) - self.log_lines_per_page)
-        end_idx = min(len(self.battle_log), start_idx + self.log_lines_per_page)
-        
-        for i, log in enumerate(self.battle_log[start_idx:end_idx]):
-            log_text = font_small.render(log, True, TEXT_COLOR)
-            surface.blit(log_text, (120, 70 + i * 30))
+        # Draw battle log (the panel itself is part of the backdrop)
+        # The page is only re-rendered when a new message arrives
+        surface.blit(self.battle_log.render_page(font_small, TEXT_COLOR, self.log_page), (120, 70))
         
         if self.waiting_for_continue:
-            continue_text = font_small.render("(Press ENTER to continue...)", True, (255, 215, 0))
-            surface.blit(continue_text, (120, 70 + self.log_lines_per_page * 30))
+            surface.blit(self.continue_text, (120, 70 + self.log_lines_per_page * 30))
         
         # Draw buttons
         if self.state == "player_turn" and not self.waiting_for_continue:
@@ -390,19 +444,15 @@ class BattleScreen:
         
         # Draw damage effect
         if self.damage_effect_timer > 0:
-            effect_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            if self.damage_target == "player":
-                pygame.draw.rect(effect_surf, (255, 0, 0, 100), (player_x, player_y, PLAYER_SIZE, PLAYER_SIZE))
-            elif self.damage_target == "enemy":
-                pygame.draw.rect(effect_surf, (255, 0, 0, 100), (enemy_x, enemy_y, ENEMY_SIZE, ENEMY_SIZE))
-            
-            damage_text = font_medium.render(f"-{self.damage_amount}", True, (255, 50, 50))
+            if self.damage_text[0] != self.damage_amount:
+                self.damage_text = (self.damage_amount, font_medium.render(f"-{self.damage_amount}", True, (255, 50, 50)))
+            damage_text = self.damage_text[1]
             if self.damage_target == "player":
                 surface.blit(damage_text, (player_x + 20, player_y - 30))
+                surface.blit(self.damage_flash["player"], (player_x, player_y))
             elif self.damage_target == "enemy":
                 surface.blit(damage_text, (enemy_x + 20, enemy_y - 30))
-                
-            surface.blit(effect_surf, (0, 0))
+                surface.blit(self.damage_flash["enemy"], (enemy_x, enemy_y))
             self.damage_effect_timer -= 1
 
     def _draw_battle_summary(self, surface):
@@ -442,7 +492,9 @@ class BattleScreen:
         """
         self.player.update_animation()
         self.enemy.update_animation()
+        t = profiler.start()
         self.particle_system.update()
+        profiler.stop("battle.particles.update", t)
         
         # Update magic effect
         if self.magic_effect['active']:
@@ -451,90 +503,10 @@ class BattleScreen:
                 self.magic_effect['active'] = False
                 self.magic_effect['radius'] = 0
         
-        # Update fireball projectile
-        if hasattr(self, 'fireball_projectile') and self.fireball_projectile['active']:
-            # Update timer
-            self.fireball_projectile['timer'] += 1
-            
-            if self.fireball_projectile['timer'] < self.fireball_projectile['max_timer']:
-                # Calculate direction to target
-                dx = self.fireball_projectile['target_x'] - self.fireball_projectile['x']
-                dy = self.fireball_projectile['target_y'] - self.fireball_projectile['y']
-                distance = math.sqrt(dx*dx + dy*dy)
-                
-                if distance > 0:
-                    # Move fireball towards target
-                    self.fireball_projectile['x'] += (dx / distance) * self.fireball_projectile['speed']
-                    self.fireball_projectile['y'] += (dy / distance) * self.fireball_projectile['speed']
-                
-                # Add trail particles
-                for _ in range(2):
-                    angle = random.uniform(0, math.pi*2)
-                    dist = random.uniform(0, 6)
-                    px = self.fireball_projectile['x'] + math.cos(angle) * dist
-                    py = self.fireball_projectile['y'] + math.sin(angle) * dist
-                    self.particle_system.add_particle(
-                        px, py, self.fireball_projectile['color'],
-                        (random.uniform(-0.5, 0.5), random.uniform(-0.5, 0.5)),
-                        2, 15
-                    )
-            else:
-                # Timer expired - fireball hits target and explodes
-                self.particle_system.add_explosion(
-                    700 + 30, 250 + 30,  # Enemy center position
-                    self.fireball_projectile['color'], count=30, size_range=(3, 8), 
-                    speed_range=(2, 6), lifetime_range=(20, 35)
-                )
-                self.fireball_projectile['active'] = False
-                self.fireball_projectile['hit'] = True  # Mark as hit
-                # Add a small delay to ensure projectile is removed before next frame
-                self.action_cooldown = 2
-        
-        # Clean up hit projectiles
-        if hasattr(self, 'fireball_projectile') and self.fireball_projectile.get('hit', False):
-            delattr(self, 'fireball_projectile')
-        if hasattr(self, 'knife_projectile') and self.knife_projectile.get('hit', False):
-            delattr(self, 'knife_projectile')
-        
-        # Update knife projectile
-        if hasattr(self, 'knife_projectile') and self.knife_projectile['active']:
-            # Update timer
-            self.knife_projectile['timer'] += 1
-            
-            if self.knife_projectile['timer'] < self.knife_projectile['max_timer']:
-                # Calculate direction to target
-                dx = self.knife_projectile['target_x'] - self.knife_projectile['x']
-                dy = self.knife_projectile['target_y'] - self.knife_projectile['y']
-                distance = math.sqrt(dx*dx + dy*dy)
-                
-                if distance > 0:
-                    # Move knife towards target
-                    self.knife_projectile['x'] += (dx / distance) * self.knife_projectile['speed']
-                    self.knife_projectile['y'] += (dy / distance) * self.knife_projectile['speed']
-                    self.knife_projectile['rotation'] += 60  # Spin the knife faster (4x speed)
-                
-                # Add trail particles
-                for _ in range(1):
-                    angle = random.uniform(0, math.pi*2)
-                    dist = random.uniform(0, 4)
-                    px = self.knife_projectile['x'] + math.cos(angle) * dist
-                    py = self.knife_projectile['y'] + math.sin(angle) * dist
-                    self.particle_system.add_particle(
-                        px, py, (120, 120, 120),
-                        (random.uniform(-0.3, 0.3), random.uniform(-0.3, 0.3)),
-                        1, 10
-                    )
-            else:
-                # Timer expired - knife hits target and explodes
-                self.particle_system.add_explosion(
-                    700 + 30, 250 + 30,  # Enemy center position
-                    (80, 80, 80), count=20, size_range=(2, 6), 
-                    speed_range=(1, 4), lifetime_range=(15, 25)
-                )
-                self.knife_projectile['active'] = False
-                self.knife_projectile['hit'] = True  # Mark as hit
-                # Add a small delay to ensure projectile is removed before next frame
-                self.action_cooldown = 2
+        # Move projectiles, add their trails and explode the ones that arrived
+        t = profiler.start()
+        self.projectiles.update()
+        profiler.stop("battle.projectiles.update", t)
         
         # Update transition
         if self.transition_state == "in":
@@ -548,107 +520,64 @@ class BattleScreen:
                 self.transition_alpha = 0
                 self.transition_state = "none"
                 
-        if self.action_cooldown > 0:
-            self.action_cooldown -= 1
-            return False
-        
-        # Check for battle end conditions
-        if self.enemy.health <= 0:
-            self.battle_ended = True
-            self.result = "win"
-            self.add_log("You defeated the enemy!")
-            self.show_summary = True
-            return True
-        elif self.player.health <= 0:
-            self.battle_ended = True
-            self.result = "lose"
-            self.add_log("You were defeated...")
-            self.show_summary = True
-            return True
-        
-        # Update elemental effect
-        if self.elemental_effect_timer > 0:
-            self.elemental_effect_timer -= 1
-            if self.elemental_effect_timer == 0:
-                self.pending_elemental_effect = None
-        
-        # Process current action steps
-        if self.action_steps:
-            step = self.action_steps.pop(0)
-            step()
-            return False
-            
-        # Handle enemy turn if no actions are queued
-        if self.state == "enemy_turn" and not self.battle_ended and not self.waiting_for_continue:
-            damage = max(1, self.enemy.strength - self.player.defense // 3)
-            self.player.health -= damage
-            self.add_log(f"{self.enemy.name} attacks for {damage} damage!")
-            self.damage_target = "player"
-            self.damage_amount = damage
-            self.damage_effect_timer = 20
-            self.enemy.start_attack_animation()
-            self.player.start_hit_animation()
-            self.add_screen_shake(3, 5)
-            # Elemental effect after dialog
-            self.pending_elemental_effect = self.enemy.enemy_type
-            self.elemental_effect_timer = 20
-            self.state = "player_turn"
-            self.add_log("It's your turn!")
-            self.action_cooldown = self.action_delay
-            
-        return False
+        # Run every scheduled step that is due this frame
+        self.scheduler.advance(1)
+        
+        # Battle end is decided by the combat engine and set when its event plays
+        return self.battle_ended
     
     def handle_input(self, event, game=None):
         """
-        Handle input events for the battle screen.
+        Handle raw key events for the battle screen (arrows, ENTER, SPACE and clicks
+        arrive as actions through handle_command instead).
         
         Args:
             event: The pygame event to handle
             game: Optional game object for sound effects
         """
+        # TAB skips the rest of the current animations
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_TAB and not self.battle_ended:
+            self.fast_forward()
+            return
+        
+        # PAGE UP / PAGE DOWN scroll through older battle log messages
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_PAGEUP, pygame.K_PAGEDOWN):
+            self.scroll_log(1 if event.key == pygame.K_PAGEUP else -1)
+    
+    def handle_command(self, action, game=None):
+        """
+        Handle an action from the keyboard, mouse or touch controls.
+        
+        Args:
+            action: An ActionEvent (see systems/input_actions.py)
+            game: Optional game object for sound effects
+        """
+        # ENTER, SPACE and clicks all mean "go on"
+        confirm = action.action in (CONFIRM, TALK, CLICK)
+            
         if self.waiting_for_continue:
-            if event.type == pygame.KEYDOWN and (event.key == pygame.K_RETURN or event.key == pygame.K_SPACE):
-                self.waiting_for_continue = False
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                self.waiting_for_continue = False
+            if confirm:
+                self.continue_log()
             return
             
         if self.battle_ended and self.show_summary:
-            if event.type == pygame.KEYDOWN and (event.key == pygame.K_RETURN or event.key == pygame.K_SPACE):
+            if confirm:
                 if self.result == "escape" and game:
                     self.show_summary = False
                     game.state = "overworld"
                     game.battle_screen = None
                 else:
                     self.show_summary = False
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if self.result == "escape" and game:
-                    self.show_summary = False
-                    game.state = "overworld"
-                    game.battle_screen = None
-                else:
-                    self.show_summary = False
-        elif self.state == "player_turn" and not self.battle_ended and self.action_cooldown == 0:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RIGHT or event.key == pygame.K_d:
-                    self.selected_option = (self.selected_option + 1) % 4
-                    if game and hasattr(game, 'SFX_ARROW') and game.SFX_ARROW: game.SFX_ARROW.play()
-                elif event.key == pygame.K_LEFT or event.key == pygame.K_a:
-                    self.selected_option = (self.selected_option - 1) % 4
-                    if game and hasattr(game, 'SFX_ARROW') and game.SFX_ARROW: game.SFX_ARROW.play()
-                elif event.key == pygame.K_UP or event.key == pygame.K_w:
-                    self.selected_option = (self.selected_option - 2) % 4
-                    if game and hasattr(game, 'SFX_ARROW') and game.SFX_ARROW: game.SFX_ARROW.play()
-                elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
-                    self.selected_option = (self.selected_option + 2) % 4
-                    if game and hasattr(game, 'SFX_ARROW') and game.SFX_ARROW: game.SFX_ARROW.play()
-                elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                    if game and hasattr(game, 'SFX_ENTER') and game.SFX_ENTER: game.SFX_ENTER.play()
-                    self.handle_action(game)
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
+        elif self.state == "player_turn" and not self.battle_ended and not self.scheduler.busy("actions"):
+            if action.action in SELECTION_MOVES:
+                self.selected_option = (self.selected_option + SELECTION_MOVES[action.action]) % 4
+                if game and hasattr(game, 'SFX_ARROW') and game.SFX_ARROW: game.SFX_ARROW.play()
+            elif action.action in (CONFIRM, TALK):
+                if game and hasattr(game, 'SFX_ENTER') and game.SFX_ENTER: game.SFX_ENTER.play()
+                self.handle_action(game)
+            elif action.action == CLICK:
                 for i, button in enumerate(self.buttons):
-                    if button.rect.collidepoint(mouse_pos):
+                    if button.rect.collidepoint(action.pos):
                         self.selected_option = i
                         if game and hasattr(game, 'SFX_ENTER') and game.SFX_ENTER: game.SFX_ENTER.play()
                         self.handle_action(game)
@@ -660,35 +589,24 @@ class BattleScreen:
         Args:
             game: Optional game object for sound effects
         """
-        if self.state != "player_turn" or self.battle_ended or self.action_cooldown > 0:
+        if self.state != "player_turn" or self.battle_ended or self.scheduler.busy("actions"):
             return
-        if self.selected_option == 0:  # Attack
-            if game and hasattr(game, 'SFX_ATTACK') and game.SFX_ATTACK: game.SFX_ATTACK.play()
-            self.action_steps = [
-                lambda: self.add_log("You attack!"),
-                lambda: self.start_attack_animation(),
-                lambda: self.execute_attack()
-            ]
-        elif self.selected_option == 1:  # Magic
-            if self.player.mana >= 20:
-                if game and hasattr(game, 'SFX_MAGIC') and game.SFX_MAGIC: game.SFX_MAGIC.play()
-                self.action_steps = [
-                    lambda: self.add_log("You cast a fireball!"),
-                    lambda: self.start_magic_animation(),
-                    lambda: self.execute_magic()
-                ]
+        action = ACTIONS[self.selected_option]
+        if game:
+            if action == "attack":
+                sound = getattr(game, 'SFX_ATTACK', None)
+            elif action == "magic" and self.combat.player.mana >= MAGIC_MANA_COST:
+                sound = getattr(game, 'SFX_MAGIC', None)
+            elif action == "item":
+                sound = getattr(game, 'SFX_ITEM', None)
             else:
-                if game and hasattr(game, 'SFX_CLICK') and game.SFX_CLICK: game.SFX_CLICK.play()
-                self.add_log("Not enough mana!")
-        elif self.selected_option == 2:  # Item
-            if game and hasattr(game, 'SFX_ITEM') and game.SFX_ITEM: game.SFX_ITEM.play()
-            self.action_steps = [
-                lambda: self.add_log("You used a health potion!"),
-                lambda: self.execute_item()
-            ]
-        elif self.selected_option == 3:  # Run
-            if game and hasattr(game, 'SFX_CLICK') and game.SFX_CLICK: game.SFX_CLICK.play()
-            self.action_steps = [
-                lambda: self.add_log("You attempt to escape..."),
-                lambda: self.execute_run()
-            ] 
\ No newline at end of file
+                sound = getattr(game, 'SFX_CLICK', None)
+            if sound: sound.play()
+        if action == "attack":
+            self.execute_attack()
+        elif action == "magic":
+            self.execute_magic()
+        elif action == "item":
+            self.execute_item()
+        else:
+            self.execute_run()
@@ -7,6 +7,7 @@ This module contains the Button class for UI elements.
 
 import pygame
 from config.constants import *
+from systems.quality_governor import quality
 
 class Button:
     """
@@ -27,7 +28,7 @@ class Button:
         
     def draw(self, surface):
         """Draw the button with glow effects and selection state"""
-        if self.glow > 0 or self.selected:
+        if (self.glow > 0 or self.selected) and quality.button_glow:
             glow_radius = max(self.glow, 8 if self.selected else 0)
             glow_surf = pygame.Surface((self.rect.width + glow_radius*2, self.rect.height + glow_radius*2), pygame.SRCALPHA)
             pygame.draw.rect(glow_surf, (*self.current_color[:3], 50), glow_surf.get_rect(), border_radius=12)
@@ -11,6 +11,11 @@ The OpeningCutscene features:
 - Particle effects and visual transitions
 - Scrollable story text
 - Skip functionality
+
+All text is rendered once, when the cutscene is created: each scene's lines
+become one surface, and the whole scrolling story one tall strip. Each frame
+only changes the alpha of a block (fade in/out) or blits the visible part of
+the strip (scrolling).
 """
 
 import pygame
@@ -19,6 +24,38 @@ import math
 from config.constants import *
 from systems.particle_system import ParticleSystem
 
+# Cutscene text (one line every 50 pixels)
+INTRO_TEXT = [
+    "LONG AGO, IN THE KINGDOM OF PIXELONIA,",
+    "AN ANCIENT EVIL AWOKE FROM ITS SLUMBER.",
+    "THE DRAGON MALAKOR, RULER OF SHADOWS,",
+    "THREATENED TO PLUNGE THE WORLD INTO DARKNESS."
+]
+DRAGON_TEXT = [
+    "THE DRAGON MALAKOR RAVAGED THE LAND,",
+    "BURNING VILLAGES AND TERRIFYING THE PEOPLE.",
+    "THE KING CALLED FOR HEROES TO RISE UP",
+    "AND CHALLENGE THE ANCIENT EVIL."
+]
+STORY_TEXT = [
+    "YOUR QUEST BEGINS...",
+    "",
+    "THE KINGDOM OF PIXELONIA NEEDS A HERO.",
+    "MALAKOR THE TERRIBLE HAS RETURNED,",
+    "AND ONLY YOU CAN STOP HIM.",
+    "",
+    "TRAVEL THROUGH PERILOUS LANDS,",
+    "BATTLE FIERCE MONSTERS,",
+    "AND GATHER POWERFUL ARTIFACTS.",
+    "",
+    "YOUR JOURNEY LEADS TO THE DRAGON'S LAIR,",
+    "WHERE THE FINAL CONFRONTATION AWAITS.",
+    "",
+    "CHOOSE YOUR HERO WISELY,",
+    "FOR THE FATE OF THE KINGDOM RESTS IN YOUR HANDS."
+]
+LINE_HEIGHT = 50
+
 
 class OpeningCutscene:
     """
@@ -50,7 +87,51 @@ class OpeningCutscene:
         self.scroll_y = SCREEN_HEIGHT
         self.scroll_speed = 1
         self.transition_state = "none"  # Initialize transition_state
-        
+        self._prerender()
+
+    def _prerender(self):
+        """Render every piece of cutscene text once"""
+        # Title and subtitle with their shadows (drawn shadow first)
+        title = font_large.render("DRAGON'S LAIR", True, (255, 50, 50))
+        title_shadow = font_large.render("DRAGON'S LAIR", True, (150, 0, 0))
+        subtitle = font_medium.render("A RETRO RPG ADVENTURE", True, TEXT_COLOR)
+        subtitle_shadow = font_medium.render("A RETRO RPG ADVENTURE", True, (0, 100, 100))
+        self.title_blits = [
+            (title_shadow, (SCREEN_WIDTH//2 - title.get_width()//2 + 3, 103)),
+            (title, (SCREEN_WIDTH//2 - title.get_width()//2, 100)),
+            (subtitle_shadow, (SCREEN_WIDTH//2 - subtitle.get_width()//2 + 2, 162)),
+            (subtitle, (SCREEN_WIDTH//2 - subtitle.get_width()//2, 160)),
+        ]
+        self.intro_block = self._render_lines(INTRO_TEXT, TEXT_COLOR)
+        self.dragon_block = self._render_lines(DRAGON_TEXT, (255, 200, 100))
+        self.story_strip = self._render_lines(STORY_TEXT, (60, 40, 20))
+        self.skip_prompt = font_small.render("Press any key to skip...", True, (200, 200, 200))
+        self.continue_prompt = font_medium.render("PRESS ENTER TO CONTINUE", True, (100, 60, 30))
+        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))  # Black, faded with set_alpha
+
+    @staticmethod
+    def _render_lines(lines, color):
+        """
+        Render lines of text, centred, into one transparent surface as wide as the screen.
+
+        Line i is centred LINE_HEIGHT * i + LINE_HEIGHT // 2 pixels from the top.
+        """
+        block = pygame.Surface((SCREEN_WIDTH, len(lines) * LINE_HEIGHT), pygame.SRCALPHA)
+        # Fully transparent pixels of the text's own colour, so antialiased edges don't blend towards black
+        block.fill((*color, 0))
+        for i, line in enumerate(lines):
+            if line:
+                text = font_cinematic.render(line, True, color)
+                block.blit(text, text.get_rect(center=(SCREEN_WIDTH//2, i * LINE_HEIGHT + LINE_HEIGHT//2)))
+        return block
+
+    def _draw_faded_block(self, screen, block, first_line_y):
+        """Draw a text block at the current text alpha, its first line centred at first_line_y"""
+        if self.text_alpha <= 0:
+            return
+        block.set_alpha(self.text_alpha)
+        screen.blit(block, (0, first_line_y - LINE_HEIGHT//2))
+
     def update(self):
         """
         Update the cutscene state, animations, and timing.
@@ -118,17 +199,16 @@ class OpeningCutscene:
             self.draw_story_scene(screen)
         
         # Draw transition overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, self.transition_alpha))
-        screen.blit(overlay, (0, 0))
+        if self.transition_alpha > 0:
+            self.overlay.set_alpha(self.transition_alpha)
+            screen.blit(self.overlay, (0, 0))
         
         # Draw particles
         self.particle_system.draw(screen)
         
         # Draw skip prompt
         if pygame.time.get_ticks() % 1000 < 500:  # Blinking text
-            skip_text = font_small.render("Press any key to skip...", True, (200, 200, 200))
-            screen.blit(skip_text, (SCREEN_WIDTH - skip_text.get_width() - 20, SCREEN_HEIGHT - 40))
+            screen.blit(self.skip_prompt, (SCREEN_WIDTH - self.skip_prompt.get_width() - 20, SCREEN_HEIGHT - 40))
     
     def draw_intro_scene(self, screen):
         """
@@ -144,33 +224,11 @@ class OpeningCutscene:
             y = math.sin(pygame.time.get_ticks() * 0.001 + i) * 50 + SCREEN_HEIGHT//2
             pygame.draw.circle(screen, (200, 200, 255), (x, int(y)), 1)
         
-        # Draw title with shadow effect
-        title = font_large.render("DRAGON'S LAIR", True, (255, 50, 50))
-        title_shadow = font_large.render("DRAGON'S LAIR", True, (150, 0, 0))
-        screen.blit(title_shadow, (SCREEN_WIDTH//2 - title.get_width()//2 + 3, 103))
-        screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 100))
-        
-        # Draw subtitle with shadow effect
-        subtitle = font_medium.render("A RETRO RPG ADVENTURE", True, TEXT_COLOR)
-        subtitle_shadow = font_medium.render("A RETRO RPG ADVENTURE", True, (0, 100, 100))
-        screen.blit(subtitle_shadow, (SCREEN_WIDTH//2 - subtitle.get_width()//2 + 2, 162))
-        screen.blit(subtitle, (SCREEN_WIDTH//2 - subtitle.get_width()//2, 160))
+        # Draw title and subtitle with shadow effect
+        screen.blits(self.title_blits)
         
         # Draw intro text with fade effect
-        intro_text = [
-            "LONG AGO, IN THE KINGDOM OF PIXELONIA,",
-            "AN ANCIENT EVIL AWOKE FROM ITS SLUMBER.",
-            "THE DRAGON MALAKOR, RULER OF SHADOWS,",
-            "THREATENED TO PLUNGE THE WORLD INTO DARKNESS."
-        ]
-        
-        y_pos = 250
-        for line in intro_text:
-            text = font_cinematic.render(line, True, TEXT_COLOR)
-            text.set_alpha(self.text_alpha)
-            text_rect = text.get_rect(center=(SCREEN_WIDTH//2, y_pos))
-            screen.blit(text, text_rect)
-            y_pos += 50
+        self._draw_faded_block(screen, self.intro_block, 250)
     
     def draw_dragon_scene(self, screen):
         """
@@ -223,20 +281,7 @@ class OpeningCutscene:
                 pygame.draw.circle(screen, (255, 150, 0), (x, y), int(size))
         
         # Draw scene text with fade effect
-        scene_text = [
-            "THE DRAGON MALAKOR RAVAGED THE LAND,",
-            "BURNING VILLAGES AND TERRIFYING THE PEOPLE.",
-            "THE KING CALLED FOR HEROES TO RISE UP",
-            "AND CHALLENGE THE ANCIENT EVIL."
-        ]
-        
-        y_pos = 100
-        for line in scene_text:
-            text = font_cinematic.render(line, True, (255, 200, 100))
-            text.set_alpha(self.text_alpha)
-            text_rect = text.get_rect(center=(SCREEN_WIDTH//2, y_pos))
-            screen.blit(text, text_rect)
-            y_pos += 50
+        self._draw_faded_block(screen, self.dragon_block, 100)
     
     def draw_story_scene(self, screen):
         """
@@ -250,31 +295,12 @@ class OpeningCutscene:
         pygame.draw.rect(screen, (180, 150, 100), (50, 50, SCREEN_WIDTH - 100, SCREEN_HEIGHT - 100))
         pygame.draw.rect(screen, (150, 120, 80), (50, 50, SCREEN_WIDTH - 100, SCREEN_HEIGHT - 100), 3)
         
-        # Draw story text (scrolling)
-        story = [
-            "YOUR QUEST BEGINS...",
-            "",
-            "THE KINGDOM OF PIXELONIA NEEDS A HERO.",
-            "MALAKOR THE TERRIBLE HAS RETURNED,",
-            "AND ONLY YOU CAN STOP HIM.",
-            "",
-            "TRAVEL THROUGH PERILOUS LANDS,",
-            "BATTLE FIERCE MONSTERS,",
-            "AND GATHER POWERFUL ARTIFACTS.",
-            "",
-            "YOUR JOURNEY LEADS TO THE DRAGON'S LAIR,",
-            "WHERE THE FINAL CONFRONTATION AWAITS.",
-            "",
-            "CHOOSE YOUR HERO WISELY,",
-            "FOR THE FATE OF THE KINGDOM RESTS IN YOUR HANDS."
-        ]
-        
-        y_pos = self.scroll_y
-        for line in story:
-            text = font_cinematic.render(line, True, (60, 40, 20))
-            text_rect = text.get_rect(center=(SCREEN_WIDTH//2, y_pos))
-            screen.blit(text, text_rect)
-            y_pos += 50
+        # Draw story text (scrolling): only the part of the strip that is on screen
+        strip_top = int(self.scroll_y) - LINE_HEIGHT//2
+        visible = pygame.Rect(0, max(0, -strip_top), SCREEN_WIDTH, SCREEN_HEIGHT - max(0, strip_top))
+        visible = visible.clip(self.story_strip.get_rect())
+        if visible.height > 0:
+            screen.blit(self.story_strip, (0, max(0, strip_top)), visible)
         
         # Draw decorative elements
         pygame.draw.line(screen, (100, 80, 60), (100, 100), (100, SCREEN_HEIGHT - 100), 2)
@@ -286,7 +312,7 @@ class OpeningCutscene:
         
         # Draw continue prompt
         if self.timer > 180 and pygame.time.get_ticks() % 1000 < 500:
-            prompt = font_medium.render("PRESS ENTER TO CONTINUE", True, (100, 60, 30))
+            prompt = self.continue_prompt
             screen.blit(prompt, (SCREEN_WIDTH//2 - prompt.get_width()//2, SCREEN_HEIGHT - 80))
     
     def skip(self):
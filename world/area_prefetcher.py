@@ -0,0 +1,109 @@
+"""
+DRAGON'S LAIR RPG - Area Prefetcher Module
+==========================================
+
+This module builds the next area before the player walks into it.
+
+WHAT THIS FILE DOES:
+===================
+Creating a WorldArea (town layout, guard, decorations) and pre-rendering its
+scenery takes a few milliseconds - close to 20 ms for the town. Done in the
+middle of an area transition, that is a visible hitch.
+
+When the player comes within AREA_PREFETCH_CELLS grid squares of an area
+edge, WorldMap asks the AreaPrefetcher for the area(s) on the other side.
+A background thread builds and pre-renders them, so the transition only has
+to pick up a finished area. If the player is faster than the thread (or
+teleports), the area is finished on the main thread and that time is
+reported as a "stall": printed, counted here, and recorded in the frame
+profiler as "area.stall".
+
+FOR NOVICE CODERS:
+==================
+A "future" is a ticket for work happening on another thread: future.done()
+says whether it has finished, future.result() waits for it and hands back
+the result (here: the finished WorldArea).
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from systems.frame_profiler import profiler
+from world.world_area import WorldArea
+
+# One background thread builds areas for every WorldMap
+_builder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="area-builder")
+
+
+def build_area(area_x, area_y, area_type):
+    """Create an area and pre-render its scenery (runs on the builder thread)"""
+    area = WorldArea(area_x, area_y, area_type)
+    area.prerender()
+    return area
+
+
+class AreaPrefetcher:
+    """
+    Builds a WorldMap's areas ahead of time on a background thread.
+
+    Attributes:
+        prefetched: Areas picked up finished from the background thread
+        stalls: Areas the main thread had to wait for or build itself
+        stall_ms: Total main-thread time spent on those
+        worst_stall_ms: Longest single stall
+    """
+
+    def __init__(self, world_map):
+        self.world_map = world_map
+        self.pending = {}  # (area_x, area_y) -> future of a WorldArea
+        self.prefetched = 0
+        self.stalls = 0
+        self.stall_ms = 0.0
+        self.worst_stall_ms = 0.0
+
+    def request(self, area_x, area_y):
+        """Start building an area in the background (if it doesn't exist yet)"""
+        key = (area_x, area_y)
+        if key in self.pending or key in self.world_map.areas or not self.world_map.in_bounds(area_x, area_y):
+            return
+        area_type = self.world_map.area_type_at(area_x, area_y)
+        self.pending[key] = _builder.submit(build_area, area_x, area_y, area_type)
+
+    def keep_only(self, keys):
+        """Forget prefetched areas the player has walked away from"""
+        for key in list(self.pending):
+            if key not in keys:
+                self.pending.pop(key).cancel()
+
+    def take(self, area_x, area_y):
+        """
+        Get an area for the world map to use right now.
+
+        Returns:
+            WorldArea: The prefetched area, or one built here (a reported stall)
+        """
+        start = time.perf_counter()
+        future = self.pending.pop((area_x, area_y), None)
+        if future is not None and future.done():
+            self.prefetched += 1
+            return future.result()
+        if future is not None and not future.cancel():
+            area = future.result()  # Already being built: wait for it
+            reason = "waited for the background builder"
+        else:
+            area = build_area(area_x, area_y, self.world_map.area_type_at(area_x, area_y))
+            reason = "built on the main thread"
+        self.report_stall(area_x, area_y, (time.perf_counter() - start) * 1000, reason)
+        return area
+
+    def report_stall(self, area_x, area_y, ms, reason):
+        self.stalls += 1
+        self.stall_ms += ms
+        self.worst_stall_ms = max(self.worst_stall_ms, ms)
+        if profiler.enabled:
+            profiler.record("area.stall", ms)
+        print(f"Area ({area_x}, {area_y}) wasn't ready: {reason} ({ms:.1f} ms)")
+
+    def get_stats(self):
+        return {"prefetched": self.prefetched, "stalls": self.stalls,
+                "stall_ms": self.stall_ms, "worst_stall_ms": self.worst_stall_ms}
@@ -0,0 +1,166 @@
+"""
+DRAGON'S LAIR RPG - Area Residency Module
+=========================================
+
+This module keeps the number of live WorldAreas within a memory budget.
+
+WHAT THIS FILE DOES:
+===================
+Every area the player visits keeps its enemies, items, town guard and its
+pre-rendered scenery (about 2.7 MB per area) alive. In a big world that adds
+up, so AreaResidency:
+- Keeps the current area and its neighbours ("hot" areas) untouched
+- When the estimated memory of all live areas goes over AREA_MEMORY_BUDGET,
+  packs the least recently visited areas away: their enemies, items and
+  flags become a small blob (the same records a save file uses, usually
+  100-200 bytes), and the WorldArea with its scenery is dropped
+- Unpacks a stored area again when the player comes back - WorldMap does
+  this by itself, nothing else in the game needs to know
+
+Blobs are kept in memory, or written to AREA_SPILL_DIR if that is set.
+Stored areas are still included in save files.
+
+FOR NOVICE CODERS:
+==================
+"Least recently used" (LRU) means: when something has to go, pick the thing
+that hasn't been needed for the longest time. An OrderedDict remembers the
+order areas were visited in, so the oldest one is always first.
+"""
+
+import os
+from collections import OrderedDict
+
+from config.constants import *
+from systems.save_system import area_snapshot, restore_area, encode_area, decode_area
+
+# Rough memory estimate for a live area besides its scenery surface
+AREA_BASE_BYTES = 16 * 1024    # WorldArea, town layout lists, guard dict, ...
+AREA_ENTITY_BYTES = 2 * 1024   # One enemy or item
+
+
+class AreaResidency:
+    """
+    Decides which of a WorldMap's areas stay live and stores the others.
+
+    Attributes:
+        budget: Estimated bytes live areas may use before old ones are stored
+        stored: (area_x, area_y) -> blob bytes (or the blob's file path)
+        evictions: Areas packed away so far
+        restores: Areas brought back so far
+    """
+
+    def __init__(self, world_map, budget=AREA_MEMORY_BUDGET, spill_dir=AREA_SPILL_DIR):
+        self.world_map = world_map
+        self.budget = budget
+        self.spill_dir = spill_dir
+        self.stored = {}
+        self.stored_info = {}           # (area_x, area_y) -> (area_type, visited), for the world map
+        self.last_used = OrderedDict()  # Live areas, least recently visited first
+        self.evictions = 0
+        self.restores = 0
+
+    def is_hot(self, area_x, area_y, current_x=None, current_y=None):
+        """Whether an area is close enough to the player to always stay live"""
+        if current_x is None:
+            current_x, current_y = self.world_map.current_area_x, self.world_map.current_area_y
+        return max(abs(area_x - current_x), abs(area_y - current_y)) <= AREA_HOT_RADIUS
+
+    def touch(self, area_x, area_y):
+        """Remember that an area was just used"""
+        self.last_used[(area_x, area_y)] = True
+        self.last_used.move_to_end((area_x, area_y))
+
+    @staticmethod
+    def area_bytes(area):
+        """Estimated memory used by a live area"""
+        size = AREA_BASE_BYTES + AREA_ENTITY_BYTES * (len(area.enemies) + len(area.items))
+        if area.background is not None:
+            size += area.background.get_bytesize() * area.background.get_width() * area.background.get_height()
+        return size
+
+    def resident_bytes(self):
+        return sum(self.area_bytes(area) for area in self.world_map.areas.values())
+
+    def enforce(self):
+        """Store least recently used areas until live areas fit in the budget"""
+        total = self.resident_bytes()
+        if total <= self.budget:
+            return
+        areas = self.world_map.areas
+        # Areas that were never touched count as the oldest
+        order = [key for key in areas if key not in self.last_used]
+        order += [key for key in self.last_used if key in areas]
+        for key in order:
+            if total <= self.budget:
+                break
+            if self.is_hot(*key):
+                continue
+            area = areas[key]
+            total -= self.area_bytes(area)
+            self.evict(area)
+
+    def evict(self, area):
+        """Pack an area away and drop the live WorldArea (and its scenery)"""
+        key = (area.area_x, area.area_y)
+        self.store_snapshot(area_snapshot(area))
+        del self.world_map.areas[key]
+        self.last_used.pop(key, None)
+        self.evictions += 1
+
+    def store_snapshot(self, area_tuple):
+        """Keep an area tuple (from the save system) as a blob"""
+        area_x, area_y, area_type, visited = area_tuple[:4]
+        key = (area_x, area_y)
+        blob = encode_area(area_tuple)
+        if self.spill_dir:
+            path = os.path.join(self.spill_dir, f"area_{area_x}_{area_y}.bin")
+            try:
+                os.makedirs(self.spill_dir, exist_ok=True)
+                with open(path, "wb") as f:
+                    f.write(blob)
+                blob = path
+            except OSError as e:
+                print(f"Could not spill area to disk, keeping it in memory: {e}")
+        self.stored[key] = blob
+        self.stored_info[key] = (area_type, visited)
+
+    def _load(self, key):
+        blob = self.stored[key]
+        if isinstance(blob, str):
+            with open(blob, "rb") as f:
+                return f.read()
+        return blob
+
+    def stored_type(self, area_x, area_y):
+        """Area type of a stored area (None if it isn't stored)"""
+        info = self.stored_info.get((area_x, area_y))
+        return info[0] if info else None
+
+    def restore(self, area):
+        """
+        Put a stored area's enemies, items and flags into a freshly built WorldArea.
+        Does nothing for areas that were never stored.
+        """
+        key = (area.area_x, area.area_y)
+        if key not in self.stored:
+            return
+        area_tuple = decode_area(self._load(key))
+        blob = self.stored.pop(key)
+        del self.stored_info[key]
+        if isinstance(blob, str):
+            try:
+                os.remove(blob)
+            except OSError:
+                pass
+        restore_area(area, area_tuple)
+        self.restores += 1
+
+    def stored_snapshots(self):
+        """Area tuples of every stored area (for save files)"""
+        return [decode_area(self._load(key)) for key in self.stored]
+
+    def get_stats(self):
+        return {"live": len(self.world_map.areas), "live_bytes": self.resident_bytes(),
+                "stored": len(self.stored),
+                "stored_bytes": sum(len(blob) for blob in self.stored.values() if isinstance(blob, bytes)),
+                "evictions": self.evictions, "restores": self.restores}
@@ -0,0 +1,181 @@
+"""
+DRAGON'S LAIR RPG - Area Simulation Module
+==========================================
+
+This module keeps the areas around the player alive while they're off-screen.
+
+WHAT THIS FILE DOES:
+===================
+The game only moves and spawns enemies in the area the player is in. Without
+this module every other area is frozen: walk back to a forest you cleared
+ten minutes ago and it's still empty.
+
+AreaSimulator gives each area a "tier":
+- CURRENT area: Game updates it every frame, exactly as before
+- NEIGHBOUR areas (the 8 around the current one): every
+  AREA_NEIGHBOR_TICK_FRAMES frames they get a cheap tick - enemies and items
+  spawn on the usual timers and enemies wander - with no drawing, particles
+  or animation
+- DISTANT areas: nothing at all. When one becomes a neighbour or the current
+  area again, a single catch-up works out what would have happened in the
+  meantime: the spawns it missed and how far its enemies wandered
+
+Neighbour ticks and catch-ups use the same maths, so an area looks the same
+whether it was ticked 100 times or caught up once.
+
+HOW TO USE IT:
+=============
+WorldMap owns one AreaSimulator (world_map.simulator); Game calls
+world_map.simulator.update(game_time, player_level) once per overworld frame.
+
+FOR NOVICE CODERS:
+==================
+Off-screen enemies don't chase anyone, they wander. N random steps of the
+same length usually end up about sqrt(N) steps from the start (a "random
+walk"), so one jump of speed * sqrt(steps) in a random direction looks just
+like many small wanders - and costs the same for 1 second or 1 hour.
+"""
+
+import math
+import random
+
+from config.constants import *
+from entities.enemy import Enemy
+from entities.item import Item
+
+# Enemy types found in each kind of area
+AREA_ENEMY_TYPES = {
+    "plains": ["fiery", "shadow", "ice"],
+    "forest": ["shadow", "ice"],
+    "mountain": ["fiery", "ice"],
+    "desert": ["fiery"],
+    "swamp": ["shadow", "ice"],
+    "volcano": ["fiery"],
+    "ice": ["ice"],
+    "castle": ["shadow", "fiery"],
+    "cave": ["shadow", "ice"]
+}
+
+# Off-screen enemies stay this far from their area's edges
+WANDER_MARGIN = 100
+
+
+def spawn_area_enemy(area, level):
+    """
+    Add a new enemy to an area (towns never get enemies).
+
+    Returns:
+        Enemy: The new enemy, or None if the area is a town or already full
+    """
+    if area.area_type == "town" or len(area.enemies) >= MAX_AREA_ENEMIES:
+        return None
+    enemy = Enemy(level)
+
+    # Set enemy type based on area
+    available_types = AREA_ENEMY_TYPES.get(area.area_type, ["fiery", "shadow", "ice"])
+    enemy.enemy_type = random.choice(available_types)
+
+    # Position enemy randomly within the area
+    area_world_x, area_world_y = area.get_world_position()
+    enemy.x = area_world_x + random.randint(100, AREA_WIDTH - 100)
+    enemy.y = area_world_y + random.randint(100, AREA_HEIGHT - 100)
+    area.enemies.append(enemy)
+    return enemy
+
+
+def spawn_area_item(area):
+    """
+    Add a new item to an area.
+
+    Returns:
+        Item: The new item, or None if the area already has enough
+    """
+    if len(area.items) >= MAX_AREA_ITEMS:
+        return None
+    item = Item()
+    area_world_x, area_world_y = area.get_world_position()
+    item.x = area_world_x + random.randint(100, AREA_WIDTH - 100)
+    item.y = area_world_y + random.randint(100, AREA_HEIGHT - 100)
+    area.items.append(item)
+    return item
+
+
+class AreaSimulator:
+    """
+    Ticks neighbour areas cheaply and catches distant areas up on return.
+
+    Attributes:
+        last_tick: (area_x, area_y) -> game_time the area was last simulated to
+        neighbor_ticks: Cheap neighbour ticks run so far
+        catch_ups: Catch-ups of areas that had been distant (or packed away)
+    """
+
+    def __init__(self, world_map):
+        self.world_map = world_map
+        self.last_tick = {}
+        self.enemy_progress = {}  # (area_x, area_y) -> frames towards the next enemy spawn
+        self.item_progress = {}   # (area_x, area_y) -> frames towards the next item spawn
+        self.neighbor_ticks = 0
+        self.catch_ups = 0
+
+    def update(self, game_time, level):
+        """Run this frame's share of off-screen simulation"""
+        world_map = self.world_map
+        current_key = (world_map.current_area_x, world_map.current_area_y)
+
+        # The current area is run by Game; it only needs catching up when just entered
+        current_area = world_map.areas.get(current_key)
+        if current_area:
+            last = self.last_tick.get(current_key, game_time)
+            if game_time - last > AREA_NEIGHBOR_TICK_FRAMES:
+                self.catch_ups += 1
+                self.simulate(current_area, game_time - last, level)
+            self.last_tick[current_key] = game_time
+
+        if game_time % AREA_NEIGHBOR_TICK_FRAMES:
+            return
+        for key, area in list(world_map.areas.items()):
+            if key == current_key or not world_map.residency.is_hot(*key):
+                self.last_tick.setdefault(key, game_time)  # Distant areas wait for their catch-up
+                continue
+            last = self.last_tick.get(key, game_time)
+            if game_time - last > AREA_NEIGHBOR_TICK_FRAMES:
+                self.catch_ups += 1
+            self.neighbor_ticks += 1
+            self.simulate(area, game_time - last, level)
+            self.last_tick[key] = game_time
+
+    def simulate(self, area, frames, level):
+        """Move an area `frames` frames forward: missed spawns, then enemy wandering"""
+        if frames <= 0:
+            return
+        key = (area.area_x, area.area_y)
+
+        enemy_frames = self.enemy_progress.get(key, 0) + frames
+        for _ in range(min(enemy_frames // ENEMY_SPAWN_INTERVAL, MAX_AREA_ENEMIES)):
+            spawn_area_enemy(area, level)
+        self.enemy_progress[key] = enemy_frames % ENEMY_SPAWN_INTERVAL
+
+        item_frames = self.item_progress.get(key, 0) + frames
+        for _ in range(min(item_frames // ITEM_SPAWN_INTERVAL, MAX_AREA_ITEMS)):
+            spawn_area_item(area)
+        self.item_progress[key] = item_frames % ITEM_SPAWN_INTERVAL
+
+        if area.enemies:
+            self.wander(area, frames)
+
+    @staticmethod
+    def wander(area, frames):
+        """Random-walk every enemy in an area as if `frames` frames went by"""
+        area_world_x, area_world_y = area.get_world_position()
+        min_x, max_x = area_world_x + WANDER_MARGIN, area_world_x + AREA_WIDTH - WANDER_MARGIN
+        min_y, max_y = area_world_y + WANDER_MARGIN, area_world_y + AREA_HEIGHT - WANDER_MARGIN
+        for enemy in area.enemies:
+            steps = frames / enemy.movement_delay  # Enemies take one step per movement_delay frames
+            distance = enemy.speed * math.sqrt(steps)
+            angle = random.uniform(0, 2 * math.pi)
+            enemy.x = max(min_x, min(max_x, enemy.x + math.cos(angle) * distance))
+            enemy.y = max(min_y, min(max_y, enemy.y + math.sin(angle) * distance))
+
+    def get_stats(self):
+        return {"neighbor_ticks": self.neighbor_ticks, "catch_ups": self.catch_ups}
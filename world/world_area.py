@@ -13,6 +13,7 @@ import pygame
 import random
 import math
 from config.constants import *
+from systems.quality_governor import quality
 
 class WorldArea:
     """
@@ -28,6 +29,7 @@ class WorldArea:
         self.enemies = []
         self.items = []
         self.visited = False
+        self.background = None  # Pre-rendered static scenery (see prerender())
         
         # ========================================
         # AREA-SPECIFIC VISUAL PROPERTIES
@@ -170,7 +172,7 @@ class WorldArea:
             {"x": 820, "y": 570},  # Library chimney
         ]
     
-    def _draw_scenic_background(self, surface):
+    def _draw_scenic_background(self, surface, rng):
         """Draw scenic background with massive fantasy castle and sunset"""
         # Sunset sky gradient
         for y in range(200):
@@ -340,23 +342,25 @@ class WorldArea:
         pygame.draw.rect(surface, self.background_color, (0, 250, 1000, 450))
         
         # Scattered dirt/earth spots for texture (static, not moving)
-        # Use fixed seed for consistent positioning
-        random.seed(42)  # Fixed seed for town ground texture
+        # rng has a fixed seed, so the spots are in the same place every time
         for _ in range(50):  # Just a few scattered spots
-            dirt_x = random.randint(0, 1000)
-            dirt_y = random.randint(250, 700)
-            dirt_color = (100 + random.randint(0, 30), 60 + random.randint(0, 20), 40 + random.randint(0, 15))
-            pygame.draw.circle(surface, dirt_color, (dirt_x, dirt_y), random.randint(1, 3))
+            dirt_x = rng.randint(0, 1000)
+            dirt_y = rng.randint(250, 700)
+            dirt_color = (100 + rng.randint(0, 30), 60 + rng.randint(0, 20), 40 + rng.randint(0, 15))
+            pygame.draw.circle(surface, dirt_color, (dirt_x, dirt_y), rng.randint(1, 3))
         
         # Grass texture overlay (solid grass appearance) - STATIC positions
         for x in range(0, 1000, 10):  # More frequent grass
             for y in range(250, 700, 8):  # More frequent grass
-                if random.random() < 0.6:  # Higher density
-                    grass_color = (60 + random.randint(0, 40), 100 + random.randint(0, 40), 40 + random.randint(0, 20))
+                if rng.random() < 0.6:  # Higher density
+                    grass_color = (60 + rng.randint(0, 40), 100 + rng.randint(0, 40), 40 + rng.randint(0, 20))
+                    # Lower quality settings skip a share of the tufts (the rest stay put)
+                    if (x * 7 + y * 13) % 100 >= quality.grass * 100:
+                        continue
                     # Fixed positions for grass (no random offset)
                     pygame.draw.circle(surface, grass_color, (x, y), 3)  # Larger grass, fixed position
     
-    def _draw_town_paths(self, surface):
+    def _draw_town_paths(self, surface, rng):
         """Draw red dirt paths connecting buildings"""
         # Main path from gate to town center
         path_points = [(500, 260), (500, 350), (500, 400)]
@@ -388,7 +392,7 @@ class WorldArea:
                 t = i / max(abs(x2-x1) + abs(y2-y1), 1)
                 px = x1 + (x2-x1) * t
                 py = y1 + (y2-y1) * t
-                if random.random() < 0.4:
+                if rng.random() < 0.4:
                     pygame.draw.circle(surface, (100, 60, 40), (int(px), int(py)), 2)
     
     def draw_town(self, surface):
@@ -396,11 +400,14 @@ class WorldArea:
         if self.area_type != "town":
             return
             
+        # Ground texture comes from a fixed seed so it looks the same every time
+        rng = random.Random(42)
+        
         # Draw scenic background first
-        self._draw_scenic_background(surface)
+        self._draw_scenic_background(surface, rng)
         
         # Draw red dirt paths
-        self._draw_town_paths(surface)
+        self._draw_town_paths(surface, rng)
         
         # Draw town boundaries first (walls and gates) - 3D style
         for boundary in self.town_boundaries:
@@ -763,7 +770,7 @@ class WorldArea:
             
         # Generate smoke from chimneys
         for smoke_source in self.smoke_sources:
-            if random.random() < 0.3:  # 30% chance each frame
+            if random.random() < 0.3 * quality.particles:  # 30% chance each frame
                 particle_system.add_particle(
                     smoke_source["x"], smoke_source["y"],
                     (100, 100, 100),
@@ -772,7 +779,7 @@ class WorldArea:
                 )
         
         # Generate fountain particles (if near town center)
-        if random.random() < 0.2:  # 20% chance each frame
+        if random.random() < 0.2 * quality.particles:  # 20% chance each frame
             particle_system.add_particle(
                 500, 450,  # Town center
                 (150, 200, 255),
@@ -781,7 +788,7 @@ class WorldArea:
             )
         
         # Generate leaf particles from trees
-        if random.random() < 0.1:  # 10% chance each frame
+        if random.random() < 0.1 * quality.particles:  # 10% chance each frame
             tree_positions = [(50, 250), (920, 250), (50, 700), (920, 700)]
             tree_x, tree_y = random.choice(tree_positions)
             particle_system.add_particle(
@@ -1055,20 +1062,41 @@ class WorldArea:
         # Position dialogue box at bottom of screen
         surface.blit(dialogue_box, (100, SCREEN_HEIGHT - 200))
     
-    def draw(self, surface, world_map=None):
-        """Draw the area based on its type"""
+    def prerender(self):
+        """
+        Draw the scenery that never changes (ground, grid, town buildings, mountains)
+        into self.background, so draw() only has to blit it.
+        
+        Safe to call from a background thread: it only draws on its own surface.
+        """
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         if self.area_type == "town":
-            self.draw_town(surface)
+            self.draw_town(background)
         else:
             # Draw regular area background
-            surface.fill(self.background_color)
+            background.fill(self.background_color)
             
             # Draw grid overlay
             for x in range(0, SCREEN_WIDTH, GRID_SIZE):
-                pygame.draw.line(surface, self.grid_color, (x, 0), (x, SCREEN_HEIGHT), 1)
+                pygame.draw.line(background, self.grid_color, (x, 0), (x, SCREEN_HEIGHT), 1)
             for y in range(0, SCREEN_HEIGHT, GRID_SIZE):
-                pygame.draw.line(surface, self.grid_color, (0, y), (SCREEN_WIDTH, y), 1)
+                pygame.draw.line(background, self.grid_color, (0, y), (SCREEN_WIDTH, y), 1)
             
+            if self.area_type == "mountain":
+                # Draw mountain peaks
+                points = [(0, SCREEN_HEIGHT), (200, SCREEN_HEIGHT - 100), 
+                         (400, SCREEN_HEIGHT - 150), (600, SCREEN_HEIGHT - 120),
+                         (800, SCREEN_HEIGHT - 130), (SCREEN_WIDTH, SCREEN_HEIGHT)]
+                pygame.draw.polygon(background, (80, 80, 100), points)
+        self.background = background
+    
+    def draw(self, surface, world_map=None):
+        """Draw the area based on its type"""
+        if self.background is None:
+            self.prerender()
+        surface.blit(self.background, (0, 0))
+        
+        if self.area_type != "town":
             # Draw area-specific decorations
             if self.area_type == "forest":
                 # Draw trees
@@ -1082,12 +1110,6 @@ class WorldArea:
                     x = random.randint(100, SCREEN_WIDTH - 100)
                     y = random.randint(100, SCREEN_HEIGHT - 100)
                     pygame.draw.ellipse(surface, (120, 110, 80), (x, y, 80, 40))
-            elif self.area_type == "mountain":
-                # Draw mountain peaks
-                points = [(0, SCREEN_HEIGHT), (200, SCREEN_HEIGHT - 100), 
-                         (400, SCREEN_HEIGHT - 150), (600, SCREEN_HEIGHT - 120),
-                         (800, SCREEN_HEIGHT - 130), (SCREEN_WIDTH, SCREEN_HEIGHT)]
-                pygame.draw.polygon(surface, (80, 80, 100), points)
         
         # Draw town cutscene if active
         if self.cutscene_active:
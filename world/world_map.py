@@ -0,0 +1,298 @@
+"""
+DRAGON'S LAIR RPG - World Map Module
+====================================
+
+This module contains the WorldMap class that manages the grid of world areas.
+
+WHAT THIS FILE DOES:
+===================
+The world is a grid of WorldArea objects (WORLD_SIZE x WORLD_SIZE). WorldMap:
+- Creates an area the first time the player gets to it (not all at once),
+  building the next one in the background when the player nears an edge
+  (see world/area_prefetcher.py)
+- Packs away areas the player left long ago when they use too much memory,
+  and unpacks them on return (see world/area_residency.py)
+- Keeps the areas around the player alive off-screen (see world/area_simulation.py)
+- Remembers which area the player is in
+- Moves the camera so the current area fills the screen
+- Converts between world coordinates and screen coordinates
+- Notices when the player walks into a new area (and fades the screen)
+- Draws the world map (M key)
+
+Which kind of area sits where comes from the AREA_TYPES table around the
+starting area (the classic 3x3 world) and from generate_area_type() for
+everything further out. Only live areas are kept in `areas`, so memory
+grows with the areas visited (up to AREA_MEMORY_BUDGET), not with the world size.
+
+FOR NOVICE CODERS:
+==================
+"World coordinates" are positions on the whole map, "screen coordinates" are
+positions in the window. The camera is the top-left corner of the area being
+shown, so world_to_screen() just subtracts the camera position.
+
+`areas` is a dictionary keyed by (x, y), so finding an area is one lookup no
+matter how big the world is.
+"""
+
+import random
+
+import pygame
+from config.constants import *
+from world.area_prefetcher import AreaPrefetcher, build_area
+from world.area_residency import AreaResidency
+from world.area_simulation import AreaSimulator
+
+# Which kind of area sits at each (row, column) of the 3x3 block around the start
+AREA_TYPES = [
+    ["mountain", "forest", "desert"],
+    ["swamp", "beach", "volcano"],
+    ["ice", "town", "cave"]
+]
+
+# Area types further out, with how often each one comes up
+GENERATED_AREA_WEIGHTS = {
+    "forest": 4, "desert": 3, "mountain": 3, "swamp": 3, "beach": 2,
+    "volcano": 2, "ice": 3, "cave": 2, "castle": 1, "town": 1,
+}
+
+# World map layout (pixels)
+WORLD_MAP_PIXELS = 450  # Size of the grid part of the map
+MAP_PADDING = 12
+MAP_TITLE_HEIGHT = 40
+
+
+def generate_area_type(area_x, area_y, seed=WORLD_SEED):
+    """
+    Pick the area type for a grid cell outside the AREA_TYPES table.
+
+    The same cell always gets the same type for the same seed, so areas can
+    be created in any order (or again, after loading a save).
+    """
+    rng = random.Random((seed * 1000003 + area_x) * 1000003 + area_y)
+    types = list(GENERATED_AREA_WEIGHTS)
+    return rng.choices(types, weights=[GENERATED_AREA_WEIGHTS[t] for t in types])[0]
+
+
+class WorldMap:
+    """
+    Manages the world grid, camera positioning, and area transitions.
+    Handles coordinate conversion between world and screen space.
+
+    Args:
+        size: Areas per side (default WORLD_SIZE)
+        area_type_source: Optional function (area_x, area_y) -> area type,
+                          used instead of the table + generator
+    """
+    def __init__(self, size=WORLD_SIZE, area_type_source=None):
+        self.size = size
+        self.area_type_source = area_type_source
+        self.areas = {}  # (area_x, area_y) -> WorldArea, only for live areas
+        self.start_area_x = self.start_area_y = size // 2  # Start in center area
+        self.current_area_x = self.start_area_x
+        self.current_area_y = self.start_area_y
+        self.camera_x = 0
+        self.camera_y = 0
+        self.area_transition_alpha = 0
+        self.transitioning = False
+        self._map_surface = None
+        self._map_key = None
+        self.prefetcher = AreaPrefetcher(self)
+        self.residency = AreaResidency(self)
+        self.simulator = AreaSimulator(self)
+
+        # Build the starting area right away and mark it as visited
+        start = (self.start_area_x, self.start_area_y)
+        self.areas[start] = build_area(*start, self.area_type_at(*start))
+        self.areas[start].visited = True
+
+    def area_type_at(self, area_x, area_y):
+        """Get the kind of area at a grid position (without creating it)"""
+        stored_type = self.residency.stored_type(area_x, area_y)
+        if stored_type:
+            return stored_type
+        if self.area_type_source:
+            return self.area_type_source(area_x, area_y)
+        # The classic 3x3 layout sits around the starting area
+        row = area_y - self.start_area_y + 1
+        column = area_x - self.start_area_x + 1
+        if 0 <= row < len(AREA_TYPES) and 0 <= column < len(AREA_TYPES[row]):
+            return AREA_TYPES[row][column]
+        return generate_area_type(area_x, area_y)
+
+    def in_bounds(self, area_x, area_y):
+        return 0 <= area_x < self.size and 0 <= area_y < self.size
+
+    def get_area(self, area_x, area_y):
+        """Get the area at a grid position, creating it on first use (None outside the world)"""
+        area = self.areas.get((area_x, area_y))
+        if area is None and self.in_bounds(area_x, area_y):
+            area = self.areas[(area_x, area_y)] = self.prefetcher.take(area_x, area_y)
+            self.residency.restore(area)  # Brings back enemies and items if it was packed away
+            self.residency.touch(area_x, area_y)
+        return area
+
+    def get_known_area(self, area_x, area_y):
+        """(area type, visited) of a live or packed-away area, None if it doesn't exist yet"""
+        area = self.areas.get((area_x, area_y))
+        if area:
+            return area.area_type, area.visited
+        return self.residency.stored_info.get((area_x, area_y))
+
+    def prefetch_neighbors(self, player_world_x, player_world_y):
+        """
+        Start building the areas across any edge the player is close to
+        (within AREA_PREFETCH_CELLS grid squares). Call once per frame.
+        """
+        margin = AREA_PREFETCH_CELLS * GRID_SIZE
+        local_x = player_world_x - self.current_area_x * AREA_WIDTH
+        local_y = player_world_y - self.current_area_y * AREA_HEIGHT
+        step_x = -1 if local_x < margin else 1 if local_x >= AREA_WIDTH - margin - PLAYER_SIZE else 0
+        step_y = -1 if local_y < margin else 1 if local_y >= AREA_HEIGHT - margin - PLAYER_SIZE else 0
+        wanted = set()
+        if step_x:
+            wanted.add((self.current_area_x + step_x, self.current_area_y))
+        if step_y:
+            wanted.add((self.current_area_x, self.current_area_y + step_y))
+        if step_x and step_y:
+            wanted.add((self.current_area_x + step_x, self.current_area_y + step_y))
+        self.prefetcher.keep_only(wanted)
+        for area_x, area_y in wanted:
+            self.prefetcher.request(area_x, area_y)
+
+    def get_current_area(self):
+        return self.get_area(self.current_area_x, self.current_area_y)
+
+    def get_start_position(self):
+        """World position in the middle of the starting area"""
+        return (self.start_area_x * AREA_WIDTH + AREA_WIDTH // 2,
+                self.start_area_y * AREA_HEIGHT + AREA_HEIGHT // 2)
+
+    def get_area_at_world_pos(self, world_x, world_y):
+        """Get area at world position"""
+        area_x = world_x // AREA_WIDTH
+        area_y = world_y // AREA_HEIGHT
+        return self.get_area(area_x, area_y)
+
+    def update_camera(self, player_world_x, player_world_y):
+        """Update camera to follow player - now screen-based"""
+        # Calculate which area the player is in
+        area_x = player_world_x // AREA_WIDTH
+        area_y = player_world_y // AREA_HEIGHT
+
+        # Clamp area coordinates to the world
+        area_x = max(0, min(self.size - 1, area_x))
+        area_y = max(0, min(self.size - 1, area_y))
+
+        # Set camera to show the current area
+        self.camera_x = area_x * AREA_WIDTH
+        self.camera_y = area_y * AREA_HEIGHT
+
+    def world_to_screen(self, world_x, world_y):
+        """Convert world coordinates to screen coordinates"""
+        return (world_x - self.camera_x, world_y - self.camera_y)
+
+    def screen_to_world(self, screen_x, screen_y):
+        """Convert screen coordinates to world coordinates"""
+        return (screen_x + self.camera_x, screen_y + self.camera_y)
+
+    def check_area_transition(self, player_world_x, player_world_y):
+        """Check if player should transition to a new area"""
+        # Clamp player position to world bounds
+        player_world_x = max(0, min(self.size * AREA_WIDTH - 1, player_world_x))
+        player_world_y = max(0, min(self.size * AREA_HEIGHT - 1, player_world_y))
+
+        new_area_x = player_world_x // AREA_WIDTH
+        new_area_y = player_world_y // AREA_HEIGHT
+        if new_area_x != self.current_area_x or new_area_y != self.current_area_y:
+            current_area = self.get_area(new_area_x, new_area_y)
+            self.current_area_x = new_area_x
+            self.current_area_y = new_area_y
+            current_area.visited = True
+            self.transitioning = True
+            self.area_transition_alpha = 255
+            self.residency.touch(new_area_x, new_area_y)
+            self.residency.enforce()
+            return True
+        return False
+
+    def update_transition(self):
+        """Update area transition effect"""
+        if self.transitioning:
+            self.area_transition_alpha = max(0, self.area_transition_alpha - 15)
+            if self.area_transition_alpha <= 0:
+                self.transitioning = False
+
+    # ------------------------------------------------------------------
+    # World map (M key)
+    # ------------------------------------------------------------------
+    def known_area_count(self):
+        return len(self.areas) + len(self.residency.stored)
+
+    def get_map_window(self):
+        """
+        The block of areas the world map shows: at most WORLD_MAP_VIEW_CELLS
+        per side, centered on the player and kept inside the world.
+
+        Returns:
+            tuple: (first area x, first area y, areas per side)
+        """
+        view = min(self.size, WORLD_MAP_VIEW_CELLS)
+        first_x = max(0, min(self.size - view, self.current_area_x - view // 2))
+        first_y = max(0, min(self.size - view, self.current_area_y - view // 2))
+        return first_x, first_y, view
+
+    def draw_world_map(self, screen, player_pos=None):
+        """Draw the world map (re-rendered only when the player changes area or finds a new one)"""
+        key = (self.current_area_x, self.current_area_y, self.known_area_count())
+        if self._map_surface is None or self._map_key != key:
+            self._map_surface = self._render_world_map()
+            self._map_key = key
+        screen.fill(BACKGROUND)
+        map_x = (SCREEN_WIDTH - self._map_surface.get_width()) // 2
+        map_y = (SCREEN_HEIGHT - self._map_surface.get_height()) // 2
+        screen.blit(self._map_surface, (map_x, map_y))
+
+        # Player marker (moves every frame, so it isn't part of the cached map)
+        if player_pos:
+            first_x, first_y, view = self.get_map_window()
+            cell_size = WORLD_MAP_PIXELS // view
+            marker_x = map_x + MAP_PADDING + (player_pos[0] / AREA_WIDTH - first_x) * cell_size
+            marker_y = map_y + MAP_TITLE_HEIGHT + (player_pos[1] / AREA_HEIGHT - first_y) * cell_size
+            pygame.draw.circle(screen, (255, 255, 0), (int(marker_x), int(marker_y)), 5)
+
+    def _render_world_map(self):
+        first_x, first_y, view = self.get_map_window()
+        cell_size = WORLD_MAP_PIXELS // view
+        title = f"WORLD MAP  ({self.current_area_x}, {self.current_area_y})  {self.known_area_count()} areas found"
+        title_text = font_tiny.render(title, True, TEXT_COLOR)
+        width = view * cell_size + MAP_PADDING * 2
+        height = view * cell_size + MAP_TITLE_HEIGHT + MAP_PADDING
+        panel = pygame.Surface((width, height))
+        panel.fill(UI_BG)
+        pygame.draw.rect(panel, UI_BORDER, panel.get_rect(), 3)
+        panel.blit(title_text, ((width - title_text.get_width()) // 2, (MAP_TITLE_HEIGHT - title_text.get_height()) // 2))
+
+        for y in range(first_y, first_y + view):
+            for x in range(first_x, first_x + view):
+                cell_x = MAP_PADDING + (x - first_x) * cell_size
+                cell_y = MAP_TITLE_HEIGHT + (y - first_y) * cell_size
+                known = self.get_known_area(x, y)  # Never create areas just to draw them
+                area_type, visited = known if known else (None, False)
+
+                # Color based on area type and visited status
+                if x == self.current_area_x and y == self.current_area_y:
+                    color = (100, 255, 100)  # Current area - bright green
+                elif visited:
+                    color = (50, 150, 50)    # Visited area - dark green
+                else:
+                    color = (50, 50, 50)     # Unvisited area - dark gray
+
+                pygame.draw.rect(panel, color, (cell_x + 1, cell_y + 1, cell_size - 2, cell_size - 2))
+                pygame.draw.rect(panel, UI_BORDER, (cell_x, cell_y, cell_size, cell_size), 1)
+
+                # Area names only fit on bigger cells
+                if visited and cell_size >= 36:
+                    name_text = font_tiny.render(area_type[:3].upper(), True, TEXT_COLOR)
+                    panel.blit(name_text, (cell_x + (cell_size - name_text.get_width()) // 2,
+                                           cell_y + (cell_size - name_text.get_height()) // 2))
+        return panel